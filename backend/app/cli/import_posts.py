@@ -0,0 +1,54 @@
+"""
+Imports posts with their categories from an NDJSON file into the database at `POSTGRES_URL`.
+
+Each line is a post, e.g. `{"title": "...", "body": "...", "status": "published",
+"categories": [{"category": "Programming", "sub_category": "Python"}]}`. Categories and
+sub-categories are matched by name and must already exist. The report is printed as JSON
+and the exit code is 1 if any row was rejected.
+
+Usage:
+    python -m app.cli.import_posts posts.ndjson --author <user uuid>
+    cat posts.ndjson | python -m app.cli.import_posts -
+"""
+
+import argparse
+import asyncio
+import sys
+from typing import AsyncIterator, TextIO
+from uuid import UUID
+
+from app.config import config
+from app.crud.post_import import PostImporter
+from app.database.session import async_session_maker, engine
+
+
+async def read_lines(file: TextIO) -> AsyncIterator[str]:
+    for line in file:
+        yield line
+
+
+async def run(file: TextIO, author: UUID | None, chunk_size: int) -> int:
+    try:
+        async with async_session_maker() as session:
+            importer = PostImporter(session, author=author, chunk_size=chunk_size)
+            report = await importer.run(read_lines(file))
+    finally:
+        await engine.dispose()
+
+    print(report.model_dump_json(indent=2))
+    return 1 if report.failed else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("path", help="The NDJSON file, `-` for stdin")
+    parser.add_argument(
+        "--author", type=UUID, help="UUID of the user creating the posts"
+    )
+    parser.add_argument("--chunk-size", type=int, default=config.IMPORT_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    if args.path == "-":
+        sys.exit(asyncio.run(run(sys.stdin, args.author, args.chunk_size)))
+    with open(args.path, encoding="utf-8") as file:
+        sys.exit(asyncio.run(run(file, args.author, args.chunk_size)))
@@ -0,0 +1,57 @@
+"""
+Purges the records soft deleted more than `--older-than-days` ago from `POSTGRES_URL`.
+
+Tombstones are hard deleted in batches, each in its own transaction, so the purge can run
+alongside the application, e.g. nightly from cron. Posts go first, then sub-categories,
+categories and users, so the references to a record are mostly gone when it is purged. The
+number of purged records per model is printed as JSON.
+
+Usage:
+    python -m app.cli.purge_tombstones
+    python -m app.cli.purge_tombstones --older-than-days 7 --batch-size 1000
+"""
+
+import argparse
+import asyncio
+import json
+from datetime import timedelta
+from typing import Dict
+
+from app.config import config
+from app.crud import UserCRUD
+from app.crud.category import CategoryCRUD
+from app.crud.post import PostCRUD
+from app.crud.sub_category import SubCategoryCRUD
+from app.database.session import async_session_maker, engine
+
+CRUD_CLASSES = {
+    "posts": PostCRUD,
+    "sub_categories": SubCategoryCRUD,
+    "categories": CategoryCRUD,
+    "users": UserCRUD,
+}
+
+
+async def run(older_than: timedelta, batch_size: int) -> Dict[str, int]:
+    purged = {}
+    try:
+        async with async_session_maker() as session:
+            for name, crud_class in CRUD_CLASSES.items():
+                purged[name] = await crud_class(session).purge_deleted(
+                    older_than, batch_size=batch_size
+                )
+    finally:
+        await engine.dispose()
+    return purged
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--older-than-days", type=int, default=config.TOMBSTONE_RETENTION_DAYS
+    )
+    parser.add_argument("--batch-size", type=int, default=config.PURGE_BATCH_SIZE)
+    args = parser.parse_args()
+
+    purged = asyncio.run(run(timedelta(days=args.older_than_days), args.batch_size))
+    print(json.dumps(purged, indent=2))
@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import List, Literal
 
 from pydantic_settings import BaseSettings
 
@@ -11,12 +12,50 @@ class BaseConfig(BaseSettings):
 
 
 class Config(BaseConfig):
+    DEBUG: bool = False  # adds the X-DB-Query-Count and X-DB-Time-Ms headers
     POSTGRES_URL: str
     TEST_POSTGRES_URL: str
+    POSTGRES_REPLICA_URLS: List[str] = []  # read replicas for GET requests
+    DB_REPLICA_EJECT_SECONDS: float = 30  # how long a failing replica is skipped
+    DB_REPLICA_STICKY_SECONDS: float = 5  # keeps a user on the primary after a write
+    DB_REPLICA_STICKY_MAX_SIZE: int = 10_000  # users kept on the primary at once
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30  # seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = -1  # seconds before a connection is replaced, -1 never
+    DB_POOL_PRE_PING: bool = False
+    DB_ECHO: bool = False
+    DB_STATEMENT_CACHE_SIZE: int = 100  # asyncpg statement cache per connection
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 100  # SQLAlchemy prepared statement cache
+    DB_PGBOUNCER_MODE: bool = False  # transaction pooling, disables statement caching
+    DB_SLOW_QUERY_MS: float = 200  # slower statements are logged, 0 disables
+    DB_SLOWEST_STATEMENTS: int = 5  # slowest statements kept per request
+    DB_N_PLUS_ONE_THRESHOLD: int = 10  # repeats of a statement per request to warn at
     JWT_SECRET_KEY: str
     JWT_ALGORITHM: str
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 15 * 24  # one Day
     JWT_REFRESH_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7  # 7 days
+    JWT_CACHE_MAX_SIZE: int = 10_000  # verified tokens kept in memory
+    JWT_CACHE_TTL_SECONDS: int = 300  # 0 disables the cache
+    USER_CACHE_MAX_SIZE: int = 10_000  # current users kept in memory
+    USER_CACHE_TTL_SECONDS: int = 30  # 0 disables the cache
+    RESPONSE_CACHE_MAX_SIZE: int = 1_000  # cached responses of public read endpoints
+    RESPONSE_CACHE_TTL_SECONDS: int = 60  # 0 disables caching, ETags are still sent
+    TAXONOMY_CACHE_TTL_SECONDS: int = 300  # reload of the category tree snapshot
+    LOADER_MAX_BATCH_SIZE: int = 500  # keys per batched `IN (...)` lookup
+    EXPORT_BATCH_SIZE: int = 1_000  # rows fetched per round trip by streaming exports
+    IMPORT_CHUNK_SIZE: int = 1_000  # rows validated and copied per import transaction
+    IMPORT_MAX_ERRORS: int = 1_000  # rejected rows detailed in an import report
+    TOMBSTONE_RETENTION_DAYS: int = 30  # soft deleted rows kept before being purged
+    PURGE_BATCH_SIZE: int = 500  # tombstones hard deleted per purge transaction
+    COMPRESSION_MINIMUM_SIZE: int = 1_024  # bytes, smaller bodies are sent as is
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4  # used when the `brotli` package is installed
+    COMPRESSION_CACHE_MAX_SIZE: int = 1_000  # bodies kept per ETag and encoding
+    COMPRESSION_CACHE_TTL_SECONDS: int = 300  # 0 disables the cache
+    PASSWORD_HASHER_EXECUTOR: Literal["thread", "process"] = "thread"
+    PASSWORD_HASHER_WORKERS: int = 4
+    PASSWORD_HASHER_MAX_QUEUE: int = 64  # waiting operations before rejecting
 
 
 config = Config()
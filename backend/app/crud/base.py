@@ -1,21 +1,45 @@
-from typing import Any, Dict, Generic, Sequence, Type, TypeVar
+import asyncio
+from datetime import datetime, timedelta
+from typing import Any, Dict, Generic, List, Sequence, Tuple, Type, TypeVar
 from uuid import UUID
 
+from sqlalchemy import ColumnElement, func
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.sql.expression import and_, select
+from sqlalchemy.orm import load_only
+from sqlalchemy.sql.base import ExecutableOption
+from sqlalchemy.sql.expression import (and_, delete, insert, or_, select,
+                                       tuple_, update)
 
-from app.database import Base
-from app.exceptions import DatabaseException
+from app.config import config
+from app.database import Base, read_only
+from app.exceptions import BadRequestException, DatabaseException
+from app.utils import CursorHandler, DataLoader, response_cache
 
 ModelType = TypeVar("ModelType", bound=Base)
+OrderKeys = List[Tuple[str, bool]]
 
 
 class BaseCRUD(Generic[ModelType]):
     """
     A base class for performing CRUD (Create, Read, Update, Delete) operations asynchronously
     on SQLAlchemy models.
+
+    Attributes:
+        keyset_fields (Tuple[str, ...]): The default ordering, also used for keyset (cursor) pagination.
+            The last one must be unique to act as a tiebreaker.
+        sortable_fields (Tuple[str, ...]): The columns clients are allowed to sort by.
+        cache_namespaces (Tuple[str, ...]): The response cache namespaces invalidated by every write.
+        selectable_fields (Tuple[str, ...]): The columns clients are allowed to request with a sparse fieldset.
+        soft_delete (bool): Whether deletes only set `deleted_at` and `deleted_by`. Soft deleted
+            records are hidden from every query and hard deleted later by `purge_deleted`.
     """
 
+    keyset_fields: Tuple[str, ...] = ("created_at", "uuid")
+    sortable_fields: Tuple[str, ...] = ("created_at", "updated_at")
+    cache_namespaces: Tuple[str, ...] = ()
+    selectable_fields: Tuple[str, ...] = ()
+    soft_delete: bool = False
+
     def __init__(self, model: Type[ModelType], session: AsyncSession) -> None:
         """
         Initializes the BaseCRUD class with the given SQLAlchemy model and session.
@@ -27,6 +51,7 @@ class BaseCRUD(Generic[ModelType]):
         self.session = session
         self.model = model
 
+    @read_only
     async def get_by(
         self,
         filters: Dict[str, Any] | None = None,
@@ -36,6 +61,10 @@ class BaseCRUD(Generic[ModelType]):
         limit: int = 100,
         order_by: str | None = None,
         order_desc: bool = False,
+        sort: str | None = None,
+        cursor: str | None = None,
+        options: Sequence[ExecutableOption] | None = None,
+        fields: str | Sequence[str] | None = None,
     ) -> Sequence[ModelType] | ModelType | None:
         """
         Asynchronously retrieves records from the database filtered by a specific field and value.
@@ -48,28 +77,56 @@ class BaseCRUD(Generic[ModelType]):
             limit (int, optional): The maximum number of records to return. Defaults to `100`.
             order_by (str, optional): The field to order the records by. Defaults to `None`.
             order_desc (bool, optional): If `True`, orders the records in descending order. Defaults to `False`.
+            sort (str, optional): A comma separated sort spec, e.g. `-created_at,title`, where a leading `-`
+                                        means descending. Takes precedence over `order_by`. Defaults to `None`.
+            cursor (str, optional): The `next_cursor` of the previous page. When given, records are fetched
+                                        with keyset pagination instead of `skip`. Defaults to `None`.
+            options (Sequence[ExecutableOption], optional): Loader options applied to the query, e.g.
+                                        `load_only(...)` to select only some columns. Defaults to `None`.
+            fields (str | Sequence[str], optional): A sparse fieldset, e.g. `uuid,title`, only these columns
+                                        (and the ordering columns) are selected. Defaults to `None`.
 
         Returns:
             Sequence[ModelType]: If `unique` is `False`, which returns a list of records or matching records.
             ModelType: If `unique` is `True`, which returns a single matching record.
             None: If no records are found matching the criteria or there is no record.
 
+        Raises:
+            BadRequestException: If the sort spec, the cursor or the fieldset is invalid.
         """
+        fields = self.parse_fields(fields)
+        if not sort and order_by:
+            sort = f"-{order_by}" if order_desc else order_by
+        order_keys = self._order_keys(sort)
+        keyset_values = self._decode_cursor(cursor, order_keys) if cursor else None
         try:
             query = select(self.model)
+            if options:
+                query = query.options(*options)
+            if fields:
+                columns = dict.fromkeys([*fields, *(field for field, _ in order_keys)])
+                query = query.options(
+                    load_only(*(getattr(self.model, column) for column in columns))
+                )
             if filters:
                 conditions = []
                 for field, value in filters.items():
                     conditions.append(getattr(self.model, field) == value)
                 query = query.where(and_(*conditions))
-            query = query.offset(skip).limit(limit)
-            result = await self.session.execute(query)
-
-            if order_by:
-                order_column = getattr(self.model, order_by)
+            if keyset_values:
+                query = query.where(self._keyset_condition(order_keys, keyset_values))
+                skip = 0
+            if not unique or sort:
                 query = query.order_by(
-                    order_column.desc() if order_desc else order_column.asc()
+                    *[
+                        getattr(self.model, field).desc()
+                        if descending
+                        else getattr(self.model, field).asc()
+                        for field, descending in order_keys
+                    ]
                 )
+            query = query.offset(skip).limit(limit)
+            result = await self.session.execute(query)
 
             if unique:
                 return result.scalars().first()
@@ -78,6 +135,228 @@ class BaseCRUD(Generic[ModelType]):
         except Exception as e:
             raise DatabaseException(f"Exception in fetching records.. {e}")
 
+    def parse_fields(
+        self, fields: str | Sequence[str] | None
+    ) -> Tuple[str, ...] | None:
+        """
+        Parses a sparse fieldset, validated against `selectable_fields`.
+
+        Args:
+            fields (str | Sequence[str] | None): Comma separated field names, e.g. `uuid,title`, or a sequence of names.
+
+        Returns:
+            Tuple[str, ...] | None: The field names in the requested order without duplicates,
+            or `None` if no fieldset was requested.
+
+        Raises:
+            BadRequestException: If a field is not selectable.
+        """
+        if not fields:
+            return None
+        names = fields.split(",") if isinstance(fields, str) else fields
+        parsed: List[str] = []
+        for name in names:
+            name = name.strip()
+            if name not in self.selectable_fields:
+                raise BadRequestException(f"Cannot select `{name}`.")
+            if name not in parsed:
+                parsed.append(name)
+        return tuple(parsed)
+
+    def next_cursor(
+        self, records: Sequence[ModelType], limit: int, sort: str | None = None
+    ) -> str | None:
+        """
+        Builds the cursor pointing after the last record of a page.
+
+        Args:
+            records (Sequence[ModelType]): The records of the current page.
+            limit (int): The page size that was requested.
+            sort (str, optional): The sort spec the page was fetched with. Defaults to `None`.
+
+        Returns:
+            str | None: The `next_cursor` token, or `None` if this was the last page.
+        """
+        if not records or len(records) < limit:
+            return None
+        last = records[-1]
+        return CursorHandler.encode(
+            [getattr(last, field) for field, _ in self._order_keys(sort)]
+        )
+
+    def _order_keys(self, sort: str | None) -> OrderKeys:
+        """
+        Parses a sort spec into `(field, descending)` pairs, validated against `sortable_fields`.
+
+        A tiebreak on the last keyset field is appended unless one of the sort fields is already
+        unique, so the ordering is stable and can be paginated with a cursor.
+
+        Args:
+            sort (str | None): The sort spec, e.g. `-created_at,title`.
+
+        Returns:
+            OrderKeys: The ordering as a list of `(field, descending)` pairs.
+
+        Raises:
+            BadRequestException: If a field is not sortable or appears more than once.
+        """
+        if not sort:
+            return [(field, False) for field in self.keyset_fields]
+
+        order_keys = []
+        for part in sort.split(","):
+            part = part.strip()
+            field = part.lstrip("+-")
+            if field not in self.sortable_fields or field in dict(order_keys):
+                raise BadRequestException(f"Cannot sort by `{field}`.")
+            order_keys.append((field, part.startswith("-")))
+
+        tiebreak = self.keyset_fields[-1]
+        if not any(self._is_unique(field) for field, _ in order_keys):
+            order_keys.append((tiebreak, order_keys[-1][1]))
+        return order_keys
+
+    def _is_unique(self, field: str) -> bool:
+        column = getattr(self.model, field).property.columns[0]
+        if column.unique or column.primary_key:
+            return True
+        # A partial unique index makes the column unique among the rows that are queried.
+        return any(
+            index.unique and list(index.columns) == [column]
+            for index in column.table.indexes
+        )
+
+    def _keyset_condition(
+        self, order_keys: OrderKeys, values: List[Any]
+    ) -> ColumnElement[bool]:
+        """
+        Builds the `WHERE` clause selecting the records that come after the cursor values.
+
+        When every key is sorted in the same direction a row comparison is used, which Postgres
+        can satisfy with a composite index, otherwise the equivalent expanded form is built.
+
+        Args:
+            order_keys (OrderKeys): The ordering of the query.
+            values (List[Any]): The typed values decoded from the cursor.
+
+        Returns:
+            ColumnElement[bool]: The SQLAlchemy boolean clause.
+        """
+        columns = [getattr(self.model, field) for field, _ in order_keys]
+        directions = {descending for _, descending in order_keys}
+        if len(directions) == 1:
+            if directions.pop():
+                return tuple_(*columns) < tuple_(*values)
+            return tuple_(*columns) > tuple_(*values)
+
+        conditions = []
+        for index, (column, value) in enumerate(zip(columns, values)):
+            equals = [c == v for c, v in zip(columns[:index], values[:index])]
+            after = column < value if order_keys[index][1] else column > value
+            conditions.append(and_(*equals, after))
+        return or_(*conditions)
+
+    def _decode_cursor(self, cursor: str, order_keys: OrderKeys) -> List[Any]:
+        """
+        Decodes a cursor and converts its values to the types of the ordering columns.
+
+        Args:
+            cursor (str): The cursor token received from the client.
+            order_keys (OrderKeys): The ordering the cursor was built for.
+
+        Returns:
+            List[Any]: The typed keyset values.
+
+        Raises:
+            BadRequestException: If the cursor is malformed or does not match the ordering.
+        """
+        values = CursorHandler.decode(cursor)
+        if len(values) != len(order_keys):
+            raise BadRequestException("Invalid pagination cursor.")
+
+        typed_values = []
+        for (field, _), value in zip(order_keys, values):
+            python_type = getattr(self.model, field).type.python_type
+            try:
+                if python_type is datetime:
+                    typed_values.append(datetime.fromisoformat(value))
+                else:
+                    typed_values.append(python_type(value))
+            except (AttributeError, TypeError, ValueError):
+                raise BadRequestException("Invalid pagination cursor.")
+        return typed_values
+
+    async def invalidate_caches(self) -> None:
+        """
+        Invalidates the caches holding records of the model.
+
+        Called after every committed write, and by code writing the table directly, e.g. the
+        post importer.
+        """
+        for loader in self.session.info.get("loaders", {}).values():
+            loader.clear()
+        await response_cache.invalidate(self.cache_namespaces)
+
+    @read_only
+    async def get_by_keys(
+        self, field: str, values: Sequence[Any]
+    ) -> Sequence[ModelType]:
+        """
+        Asynchronously retrieves every record whose `field` is one of `values`, in one `IN` query.
+
+        Args:
+            field (str): The field to match, e.g. `uuid`.
+            values (Sequence[Any]): The values to match.
+
+        Returns:
+            Sequence[ModelType]: The matching records, in no particular order.
+        """
+        if not values:
+            return []
+        try:
+            query = select(self.model).where(getattr(self.model, field).in_(values))
+            result = await self.session.execute(query)
+            return result.scalars().all()
+        except Exception as e:
+            raise DatabaseException(f"Exception in fetching records.. {e}")
+
+    def loader(self, field: str = "uuid", many: bool = False) -> DataLoader:
+        """
+        Returns the batching loader of records by `field`, shared by everything using the session.
+
+        Lookups issued in the same event loop tick, from any CRUD class or router, are coalesced
+        into one `get_by_keys` query, and results are memoized until the session commits a write.
+        Loaders of different models take turns on the session, which cannot run concurrent queries.
+
+        Args:
+            field (str, optional): The field records are looked up by. Defaults to `uuid`.
+            many (bool, optional): Whether a key matches several records, e.g. post categories by
+                `post_uuid`, the loader then resolves to lists. Defaults to `False`.
+
+        Returns:
+            DataLoader: Resolves a key to its record (or `None`), or to its list of records if `many`.
+        """
+        loaders = self.session.info.setdefault("loaders", {})
+        key = (self.model, field, many)
+        if key not in loaders:
+            lock = self.session.info.setdefault("loader_lock", asyncio.Lock())
+
+            async def batch_load(values: List[Any]) -> List[Any]:
+                async with lock:
+                    records = await self.get_by_keys(field, values)
+                grouped: Dict[Any, Any] = {}
+                for record in records:
+                    if many:
+                        grouped.setdefault(getattr(record, field), []).append(record)
+                    else:
+                        grouped[getattr(record, field)] = record
+                return [grouped.get(value, [] if many else None) for value in values]
+
+            loaders[key] = DataLoader(
+                batch_load, max_batch_size=config.LOADER_MAX_BATCH_SIZE
+            )
+        return loaders[key]
+
     async def get_by_uuid(self, uuid: str | UUID) -> ModelType | None:
         """
         Asynchronously retrieves a record from the database by its UUID.
@@ -113,6 +392,7 @@ class BaseCRUD(Generic[ModelType]):
             model = self.model(**attributes)
             self.session.add(model)
             await self.session.commit()
+            await self.invalidate_caches()
             return model
 
         except Exception as e:
@@ -136,27 +416,202 @@ class BaseCRUD(Generic[ModelType]):
             for key, value in attributes.items():
                 setattr(model, key, value)
             await self.session.commit()
+            await self.invalidate_caches()
             return True
 
         except Exception as e:
             raise DatabaseException(f"Exception in updating record. {e}")
 
-    async def delete(self, model: ModelType) -> bool:
+    async def delete(self, model: ModelType, deleted_by: UUID | None = None) -> bool:
         """
         Asynchronously deletes a record from the database.
 
         Args:
             model (ModelType): The model instance to be deleted.
+            deleted_by (UUID, optional): The UUID of the user deleting the record. Defaults to `None`.
 
         Returns:
             bool: `True` if the deletion was successful.
 
         Notes:
-            The model is removed from the session and committed, making the deletion permanent.
+            With `soft_delete` the record is only marked as deleted, otherwise it is removed from
+            the session. Either way the change is committed.
         """
         try:
-            await self.session.delete(model)
+            if self.soft_delete:
+                model.deleted_at = func.now()
+                model.deleted_by = deleted_by
+            else:
+                await self.session.delete(model)
             await self.session.commit()
+            await self.invalidate_caches()
             return True
         except Exception as e:
             raise DatabaseException(f"Exception in deleting record. {e}")
+
+    async def bulk_create(self, rows: List[Dict[str, Any]]) -> Sequence[ModelType]:
+        """
+        Asynchronously inserts many records with a single multi-row `INSERT ... RETURNING`.
+
+        Args:
+            rows (List[Dict[str, Any]]): The attributes of each record to create.
+
+        Returns:
+            Sequence[ModelType]: The created instances of the model, in the order of `rows`.
+
+        Notes:
+            All rows are inserted in one transaction and committed once, if any row fails none is kept.
+        """
+        if not rows:
+            return []
+        try:
+            result = await self.session.scalars(
+                insert(self.model).returning(self.model, sort_by_parameter_order=True),
+                rows,
+            )
+            records = result.all()
+            await self.session.commit()
+            await self.invalidate_caches()
+            return records
+
+        except Exception as e:
+            await self.session.rollback()
+            raise DatabaseException(f"Exception in creating records. {e}")
+
+    async def bulk_update(
+        self, uuids: Sequence[str | UUID], attributes: Dict[str, Any]
+    ) -> int:
+        """
+        Asynchronously applies the same attributes to many records with a single `UPDATE`.
+
+        Args:
+            uuids (Sequence[str | UUID]): The UUIDs of the records to update.
+            attributes (Dict[str, Any]): A dictionary of attributes and their new values.
+
+        Returns:
+            int: The number of updated records.
+        """
+        if not uuids:
+            return 0
+        try:
+            result = await self.session.execute(
+                update(self.model)
+                .where(self.model.uuid.in_(uuids))
+                .values(**attributes)
+            )
+            await self.session.commit()
+            await self.invalidate_caches()
+            return result.rowcount
+
+        except Exception as e:
+            await self.session.rollback()
+            raise DatabaseException(f"Exception in updating records. {e}")
+
+    async def bulk_delete(
+        self, uuids: Sequence[str | UUID], deleted_by: UUID | None = None
+    ) -> int:
+        """
+        Asynchronously deletes many records with a single `DELETE`, or a single `UPDATE`
+        marking them as deleted with `soft_delete`.
+
+        Args:
+            uuids (Sequence[str | UUID]): The UUIDs of the records to delete.
+            deleted_by (UUID, optional): The UUID of the user deleting the records. Defaults to `None`.
+
+        Returns:
+            int: The number of deleted records, records already soft deleted are not counted.
+        """
+        if not uuids:
+            return 0
+        if self.soft_delete:
+            statement = (
+                update(self.model)
+                .where(self.model.uuid.in_(uuids))
+                .values(deleted_at=func.now(), deleted_by=deleted_by)
+            )
+        else:
+            statement = delete(self.model).where(self.model.uuid.in_(uuids))
+        try:
+            result = await self.session.execute(statement)
+            await self.session.commit()
+            await self.invalidate_caches()
+            return result.rowcount
+
+        except Exception as e:
+            await self.session.rollback()
+            raise DatabaseException(f"Exception in deleting records. {e}")
+
+    async def purge_deleted(
+        self,
+        older_than: timedelta,
+        batch_size: int = config.PURGE_BATCH_SIZE,
+    ) -> int:
+        """
+        Asynchronously hard deletes the records soft deleted more than `older_than` ago.
+
+        Tombstones are purged `batch_size` at a time, oldest first, each batch in its own short
+        transaction, so the purge can run alongside the application. Rows locked by another
+        transaction are skipped until the next run. Rows referencing a purged record are deleted
+        if the reference is required, e.g. the post categories of a post, otherwise the
+        reference is cleared, e.g. the `created_by` of the posts of a user.
+
+        Args:
+            older_than (timedelta): How long a record stays soft deleted before being purged.
+            batch_size (int, optional): The number of records deleted per transaction. Defaults to `PURGE_BATCH_SIZE`.
+
+        Returns:
+            int: The number of purged records.
+        """
+        purged = 0
+        while True:
+            try:
+                result = await self.session.scalars(
+                    select(self.model.uuid)
+                    .where(self.model.deleted_at < func.now() - older_than)
+                    .order_by(self.model.deleted_at)
+                    .limit(batch_size)
+                    .with_for_update(skip_locked=True)
+                    .execution_options(include_deleted=True)
+                )
+                uuids = result.all()
+                if uuids:
+                    await self._release_references(uuids)
+                    await self.session.execute(
+                        delete(self.model)
+                        .where(self.model.uuid.in_(uuids))
+                        .execution_options(
+                            include_deleted=True, synchronize_session=False
+                        )
+                    )
+                await self.session.commit()
+            except Exception as e:
+                await self.session.rollback()
+                raise DatabaseException(f"Exception in purging records. {e}")
+
+            purged += len(uuids)
+            if len(uuids) < batch_size:
+                break
+
+        if purged:
+            await self.invalidate_caches()
+        return purged
+
+    async def _release_references(self, uuids: Sequence[UUID]) -> None:
+        """Deletes the rows requiring one of the records, clears the optional references to them."""
+        primary_key = self.model.__table__.c.uuid
+        for table in Base.metadata.sorted_tables:
+            for foreign_key in table.foreign_keys:
+                if foreign_key.column is not primary_key:
+                    continue
+                column = foreign_key.parent
+                if column.nullable:
+                    statement = (
+                        update(table)
+                        .where(column.in_(uuids))
+                        .values({column.name: None})
+                    )
+                else:
+                    statement = delete(table).where(column.in_(uuids))
+                await self.session.execute(
+                    statement.execution_options(include_deleted=True)
+                )
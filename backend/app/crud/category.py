@@ -4,6 +4,8 @@ from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crud.base import BaseCRUD
+from app.crud.taxonomy import taxonomy_cache
+from app.database import read_only
 from app.exceptions import BadRequestException, NotFoundException
 from app.models import Category
 
@@ -13,6 +15,10 @@ class CategoryCRUD(BaseCRUD[Category]):
     Category-specific CRUD operations in the database.
     """
 
+    sortable_fields = ("created_at", "updated_at", "name")
+    cache_namespaces = ("categories", "sub_categories", "posts")
+    soft_delete = True
+
     def __init__(self, session: AsyncSession):
         """
         Initializes the CategoryCRUD class with the provided async session and Category Model
@@ -22,8 +28,48 @@ class CategoryCRUD(BaseCRUD[Category]):
         """
         super().__init__(model=Category, session=session)
 
+    async def invalidate_caches(self) -> None:
+        await super().invalidate_caches()
+        taxonomy_cache.invalidate()
+
+    @read_only
+    async def get_category_tree(self) -> List[Dict[str, Any]]:
+        """
+        Retrieves every category with its sub-categories from the taxonomy snapshot.
+
+        Returns:
+            List[Dict[str, Any]]: The categories ordered by name, each with its `sub_categories`.
+        """
+        snapshot = await taxonomy_cache.get(self.session)
+        return snapshot.tree()
+
+    @read_only
+    async def get_cached_category(self, uuid: UUID) -> Dict[str, Any]:
+        """
+        Retrieves a single category by its UUID from the taxonomy snapshot.
+
+        Args:
+            uuid (UUID): The UUID of the category to retrieve.
+
+        Returns:
+            Dict[str, Any]: The column values of the category.
+
+        Raises:
+            NotFoundException: If no category is found with the given UUID.
+        """
+        snapshot = await taxonomy_cache.get(self.session)
+        category = snapshot.categories.get(uuid)
+        if not category:
+            raise NotFoundException(f"Category with UUID '{uuid}' not found")
+        return category
+
+    @read_only
     async def get_all_categories(
-        self, skip: int = 0, limit: int = 100
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        sort: str | None = None,
+        cursor: str | None = None,
     ) -> List[Category]:
         """
         Retrieves all categories from the database with pagination support.
@@ -31,6 +77,8 @@ class CategoryCRUD(BaseCRUD[Category]):
         Args:
             skip (int, optional): Number of records to skip. Default to 0.
             limit (int, optional): Maximum number of records to retrieve. Defaults to 100.
+            sort (str, optional): The sort spec, e.g. `-created_at,name`. Defaults to None.
+            cursor (str, optional): The cursor of the previous page for keyset pagination. Defaults to None.
 
         Returns:
             List[Category]: A list of category objects.
@@ -39,10 +87,13 @@ class CategoryCRUD(BaseCRUD[Category]):
             BadRequestException: If an error occurs while retrieving categories.
         """
         try:
-            return await self.get_by(skip=skip, limit=limit)
+            return await self.get_by(skip=skip, limit=limit, sort=sort, cursor=cursor)
+        except BadRequestException:
+            raise
         except Exception as e:
             raise BadRequestException(f"Failed to fetch categories: {e}")
 
+    @read_only
     async def get_category_by_uuid(self, uuid: UUID) -> Category:
         """
         Retrieves a single category by its UUID.
@@ -118,14 +169,15 @@ class CategoryCRUD(BaseCRUD[Category]):
         except Exception as e:
             raise BadRequestException(f"Exception on updating category. {e}")
 
-    async def delete_category(self, category_uuid) -> bool:
+    async def delete_category(
+        self, category_uuid: UUID, user_uuid: UUID | None = None
+    ) -> bool:
         """
-        Deletes a category from the database.
-
-        Note: This function currently performs a hard delete, but it can be modified for soft deletion in the future.
+        Soft deletes a category, it is purged from the database later.
 
         Args:
             category_uuid (UUID): The UUID of the category to delete.
+            user_uuid (UUID, optional): The UUID of the user deleting the category. Defaults to None.
 
         Returns:
             bool: True if the deletion was successful, False otherwise.
@@ -134,10 +186,9 @@ class CategoryCRUD(BaseCRUD[Category]):
             NotFoundException: If the category is not found.
             BadRequestException: If an error occurs while deleting the category.
         """
-        # TODO: Make it soft delete
         category = await self.get_category_by_uuid(category_uuid)
         try:
-            deleted = await self.delete(category)
+            deleted = await self.delete(category, deleted_by=user_uuid)
             if deleted:
                 return True
             return False
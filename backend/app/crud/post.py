@@ -1,14 +1,50 @@
-from typing import Any, Dict, List
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, List, Sequence
 from uuid import UUID
 
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Row, func, tuple_
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import load_only
 
+from app.config import config
 from app.crud.base import BaseCRUD
+from app.crud.post_category import PostCategoryCRUD
+from app.crud.taxonomy import taxonomy_cache
+from app.crud.user import UserCRUD
+from app.database import read_only
 from app.exceptions import (BadRequestException, CustomException,
                             NotFoundException)
-from app.models import Post, PostCategory, SubCategory
+from app.models import Post
+from app.schemas.post import PostAuthor, PostStatus
+from app.utils import CursorHandler
+
+EXCERPT_LENGTH = 280
+LISTING_COLUMNS = (
+    Post.uuid,
+    Post.title,
+    Post.status,
+    Post.excerpt,
+    Post.created_by,
+    Post.created_at,
+    Post.updated_at,
+)
+POST_FIELDS = (
+    "uuid",
+    "title",
+    "status",
+    "excerpt",
+    "body",
+    "created_by",
+    "updated_by",
+    "created_at",
+    "updated_at",
+)
+SEARCH_CONFIG = "english"
+SEARCH_HEADLINE_OPTIONS = (
+    "StartSel=<mark>, StopSel=</mark>, MaxWords=35, MinWords=15, MaxFragments=2"
+)
 
 
 class PostCRUD(BaseCRUD[Post]):
@@ -16,6 +52,11 @@ class PostCRUD(BaseCRUD[Post]):
     Post-specific CRUD operations in the database.
     """
 
+    sortable_fields = ("created_at", "updated_at", "title", "status")
+    cache_namespaces = ("posts",)
+    selectable_fields = POST_FIELDS
+    soft_delete = True
+
     def __init__(self, session: AsyncSession):
         """
         Initializes the PostCRUD class with the provided async session and Post Model
@@ -25,29 +66,81 @@ class PostCRUD(BaseCRUD[Post]):
         """
         super().__init__(model=Post, session=session)
 
-    async def get_all_posts(self, skip: int = 0, limit: int = 100) -> List[Post]:
+    @staticmethod
+    def make_excerpt(body: str, length: int = EXCERPT_LENGTH) -> str:
+        """
+        Builds the plain-text excerpt of a post body, cut at a word boundary.
+
+        Args:
+            body (str): The body of the post.
+            length (int, optional): The maximum length, without the ellipsis. Defaults to 280.
+
+        Returns:
+            str: The excerpt, ending with an ellipsis if the body was cut.
+        """
+        text = " ".join(body.split())
+        if len(text) <= length:
+            return text
+        cut = text[:length].rsplit(" ", 1)[0] or text[:length]
+        return cut.rstrip(" ,.;:") + "…"
+
+    def _with_excerpt(self, attributes: Dict[str, Any]) -> Dict[str, Any]:
+        if attributes.get("body") is None:
+            return attributes
+        return {**attributes, "excerpt": self.make_excerpt(attributes["body"])}
+
+    async def bulk_update(
+        self, uuids: Sequence[str | UUID], attributes: Dict[str, Any]
+    ) -> int:
+        return await super().bulk_update(uuids, self._with_excerpt(attributes))
+
+    @read_only
+    async def get_all_posts(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        sort: str | None = None,
+        cursor: str | None = None,
+        fields: str | Sequence[str] | None = None,
+    ) -> List[Post]:
         """
-        Get all posts from the database.
+        Get all posts from the database, only the listing columns are loaded (no `body`).
 
         Args:
             skip (int, optional): The number of posts to skip. Defaults to 0.
             limit (int, optional): The number of posts to return. Defaults to 100.
+            sort (str, optional): The sort spec, e.g. `-created_at,title`. Defaults to None.
+            cursor (str, optional): The cursor of the previous page for keyset pagination. Defaults to None.
+            fields (str | Sequence[str], optional): The columns to load instead of the listing columns. Defaults to None.
 
         Returns:
-            List[Post]: A list of posts.
+            List[Post]: A list of posts, with their `author` unless `fields` is given.
 
         Raises:
-            NotFoundException: If there are no records.
+            NotFoundException: If there are no records and no `cursor` is given.
             BadRequestException: If there is an error fetching the records.
         """
         try:
-            posts = await self.get_by(skip=skip, limit=limit)
-            if not posts:
+            posts = await self.get_by(
+                skip=skip,
+                limit=limit,
+                sort=sort,
+                cursor=cursor,
+                options=None if fields else [load_only(*LISTING_COLUMNS)],
+                fields=fields,
+            )
+            # A cursor past the last record is the empty end of the listing.
+            if not posts and not cursor:
                 raise NotFoundException("No posts found.")
+            if not fields:
+                await self.attach_authors(posts)
             return posts
+        except BadRequestException:
+            raise
         except Exception as e:
             raise BadRequestException(f"Exception on fetching post records. {e}")
 
+    @read_only
     async def get_post_by_uuid(self, uuid: UUID) -> Post:
         """
         Get a post by its UUID.
@@ -63,15 +156,7 @@ class PostCRUD(BaseCRUD[Post]):
             BadRequestException: If there is an error fetching the post record.
         """
         try:
-            query = (
-                select(Post)
-                .options(
-                    selectinload(Post.post_categories)
-                    .selectinload(PostCategory.sub_categories)
-                    .selectinload(SubCategory.category)
-                )
-                .filter(Post.uuid == uuid)
-            )
+            query = select(Post).filter(Post.uuid == uuid)
             result = await self.session.execute(query)
             post = result.scalar_one_or_none()
             if not post:
@@ -82,6 +167,169 @@ class PostCRUD(BaseCRUD[Post]):
         except Exception as e:
             raise NotFoundException(f"Exception on fetching post record. {e}")
 
+    @read_only
+    async def get_post_detail(self, uuid: UUID) -> Dict[str, Any]:
+        """
+        Get a post by its UUID with its post categories, their sub-category and category.
+
+        The sub-categories and categories come from the taxonomy snapshot, the post categories
+        and the author are resolved by the request's batching loaders.
+
+        Args:
+            uuid (UUID): The UUID of the post to fetch.
+
+        Returns:
+            Dict[str, Any]: The post with its `author`, each post category holding its `sub_categories` detail.
+
+        Raises:
+            NotFoundException: If there is no post found.
+        """
+        post = await self.get_post_by_uuid(uuid)
+        post_categories, author = await asyncio.gather(
+            PostCategoryCRUD(self.session)
+            .loader("post_uuid", many=True)
+            .load(post.uuid),
+            UserCRUD(self.session).loader().load(post.created_by),
+        )
+        snapshot = await taxonomy_cache.get(self.session)
+        return {
+            **snapshot.hydrate_post(post, post_categories),
+            "author": PostAuthor.model_validate(author) if author else None,
+        }
+
+    async def attach_authors(self, posts: Sequence[Post]) -> None:
+        """
+        Sets the `author` of each post, all authors are loaded with a single batched query.
+
+        Args:
+            posts (Sequence[Post]): The posts, with `created_by` loaded.
+        """
+        authors = (
+            await UserCRUD(self.session)
+            .loader()
+            .load_many(post.created_by for post in posts)
+        )
+        for post, author in zip(posts, authors):
+            post.author = author
+
+    @read_only
+    async def stream_posts(
+        self,
+        status: PostStatus | None = None,
+        updated_since: datetime | None = None,
+        batch_size: int = config.EXPORT_BATCH_SIZE,
+    ) -> AsyncResult:
+        """
+        Streams the columns of every matching post, oldest first, with a server-side cursor.
+
+        Rows are fetched `batch_size` at a time as the result is consumed, so memory use does
+        not grow with the number of posts, and the whole export is a single query. The result
+        holds a connection until it is exhausted or the session is closed.
+
+        Args:
+            status (PostStatus, optional): Only stream posts with this status. Defaults to None.
+            updated_since (datetime, optional): Only stream posts updated at or after this time. Defaults to None.
+            batch_size (int, optional): The number of rows fetched per round trip. Defaults to `EXPORT_BATCH_SIZE`.
+
+        Returns:
+            AsyncResult: The rows as mappings, iterate `partitions()` to get them batch by batch.
+
+        Raises:
+            BadRequestException: If there is an error starting the stream.
+        """
+        query = select(*(getattr(Post, field) for field in POST_FIELDS)).order_by(
+            Post.created_at, Post.uuid
+        )
+        if status:
+            query = query.where(Post.status == status)
+        if updated_since:
+            query = query.where(Post.updated_at >= updated_since)
+
+        try:
+            result = await self.session.stream(
+                query.execution_options(yield_per=batch_size)
+            )
+            return result.mappings()
+        except Exception as e:
+            raise BadRequestException(f"Exception on exporting posts. {e}")
+
+    @read_only
+    async def search_posts(
+        self, q: str, limit: int = 20, cursor: str | None = None
+    ) -> Sequence[Row]:
+        """
+        Full-text search over the title and body of the posts, best matches first.
+
+        Matches come from the GIN indexed `search_vector` column, where title words weigh more
+        than body words. Only the page of posts is highlighted with `ts_headline`, and only
+        their listing columns are loaded (no `body`).
+
+        Args:
+            q (str): The search query, in web search syntax, e.g. `"exact phrase" -excluded or other`.
+            limit (int, optional): The number of posts to return. Defaults to 20.
+            cursor (str, optional): The `next_search_cursor` of the previous page. Defaults to None.
+
+        Returns:
+            Sequence[Row]: Rows of `(Post, rank, snippet)` with the `author` of each post, the
+                snippet marks matches with `<mark>`.
+
+        Raises:
+            BadRequestException: If the cursor is invalid or there is an error searching the posts.
+        """
+        tsquery = func.websearch_to_tsquery(SEARCH_CONFIG, q)
+        rank = func.ts_rank(Post.search_vector, tsquery)
+        ranked = select(Post.uuid, rank.label("rank")).where(
+            Post.search_vector.op("@@")(tsquery)
+        )
+        if cursor:
+            ranked = ranked.where(
+                tuple_(rank, Post.uuid) < tuple_(*self._decode_search_cursor(cursor))
+            )
+        ranked = ranked.order_by(rank.desc(), Post.uuid.desc()).limit(limit).subquery()
+
+        try:
+            query = (
+                select(
+                    Post,
+                    ranked.c.rank,
+                    func.ts_headline(
+                        SEARCH_CONFIG, Post.body, tsquery, SEARCH_HEADLINE_OPTIONS
+                    ).label("snippet"),
+                )
+                .join(ranked, Post.uuid == ranked.c.uuid)
+                .options(load_only(*LISTING_COLUMNS))
+                .order_by(ranked.c.rank.desc(), Post.uuid.desc())
+            )
+            rows = (await self.session.execute(query)).all()
+            await self.attach_authors([row.Post for row in rows])
+            return rows
+        except Exception as e:
+            raise BadRequestException(f"Exception on searching posts. {e}")
+
+    def next_search_cursor(self, rows: Sequence[Row], limit: int) -> str | None:
+        """
+        Builds the cursor pointing after the last row of a search page.
+
+        Args:
+            rows (Sequence[Row]): The rows returned by `search_posts`.
+            limit (int): The page size that was requested.
+
+        Returns:
+            str | None: The `next_search_cursor` token, or `None` if this was the last page.
+        """
+        if not rows or len(rows) < limit:
+            return None
+        return CursorHandler.encode([rows[-1].rank, rows[-1].Post.uuid])
+
+    @staticmethod
+    def _decode_search_cursor(cursor: str) -> List[Any]:
+        values = CursorHandler.decode(cursor)
+        try:
+            rank, uuid = values
+            return [float(rank), UUID(uuid)]
+        except (AttributeError, TypeError, ValueError):
+            raise BadRequestException("Invalid pagination cursor.")
+
     async def create_post(self, attributes: Dict[str, Any]) -> Post:
         """
         Create a new post in the database.
@@ -95,7 +343,7 @@ class PostCRUD(BaseCRUD[Post]):
             BadRequestException: If there is an error creating the post.
         """
         try:
-            post = await self.create(attributes)
+            post = await self.create(self._with_excerpt(attributes))
             return post
         except Exception as e:
             raise BadRequestException(f"Exception on creating post. {e}")
@@ -117,26 +365,70 @@ class PostCRUD(BaseCRUD[Post]):
         """
         try:
             post = await self.get_post_by_uuid(uuid)
-            updated = await self.update(post, attributes)
+            updated = await self.update(post, self._with_excerpt(attributes))
             if updated:
                 return True
             return False
         except Exception as e:
             raise BadRequestException(f"Exception on updating post. {e}")
 
-    async def delete_post(self, uuid: UUID) -> None:
+    async def delete_post(self, uuid: UUID, user_uuid: UUID | None = None) -> None:
         """
-        Delete a post from the database.
+        Soft delete a post, it is purged from the database later.
 
         Args:
             uuid: The UUID of the post to delete.
+            user_uuid (UUID, optional): The UUID of the user deleting the post. Defaults to None.
 
         Raises:
             NotFoundException: If there is no post found.
             BadRequestException: If there is an error deleting the post.
         """
+        post = await self.get_post_by_uuid(uuid)
         try:
-            post = await self.get_post_by_uuid(uuid)
-            await self.delete(post)
+            await self.delete(post, deleted_by=user_uuid)
         except Exception as e:
             raise BadRequestException(f"Exception on deleting post. {e}")
+
+    async def create_multiple_posts(self, rows: List[Dict[str, Any]]) -> List[Post]:
+        """
+        Create many posts in the database with a single insert and commit.
+
+        Args:
+            rows (List[Dict[str, Any]]): The attributes of each post to be created.
+
+        Returns:
+            List[Post]: The created posts.
+
+        Raises:
+            BadRequestException: If there is an error creating the posts.
+        """
+        try:
+            return await self.bulk_create([self._with_excerpt(row) for row in rows])
+        except Exception as e:
+            raise BadRequestException(f"Exception on creating posts. {e}")
+
+    async def delete_multiple_posts(
+        self, uuids: List[UUID], user_uuid: UUID | None = None
+    ) -> int:
+        """
+        Soft delete many posts with a single update and commit.
+
+        Args:
+            uuids (List[UUID]): The UUIDs of the posts to delete.
+            user_uuid (UUID, optional): The UUID of the user deleting the posts. Defaults to None.
+
+        Returns:
+            int: The number of deleted posts.
+
+        Raises:
+            NotFoundException: If none of the posts were found.
+            BadRequestException: If there is an error deleting the posts.
+        """
+        try:
+            deleted = await self.bulk_delete(uuids, deleted_by=user_uuid)
+        except Exception as e:
+            raise BadRequestException(f"Exception on deleting posts. {e}")
+        if not deleted:
+            raise NotFoundException("No posts found.")
+        return deleted
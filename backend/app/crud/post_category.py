@@ -1,9 +1,10 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Sequence
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crud.base import BaseCRUD
+from app.database import read_only
 from app.exceptions import BadRequestException, NotFoundException
 from app.models import PostCategory
 
@@ -14,6 +15,11 @@ class PostCategoryCRUD(BaseCRUD[PostCategory]):
     Provides methods for retrieving, creating, updating, and deleting post categories.
     """
 
+    keyset_fields = ("uuid",)
+    sortable_fields = ()
+    cache_namespaces = ("posts",)
+    selectable_fields = ("uuid", "post_uuid", "category_uuid", "sub_category_uuid")
+
     def __init__(self, session: AsyncSession):
         """
         Initializes the PostCategoryCRUD clas with the provided async session.
@@ -23,8 +29,13 @@ class PostCategoryCRUD(BaseCRUD[PostCategory]):
         """
         super().__init__(model=PostCategory, session=session)
 
+    @read_only
     async def get_all_post_categories(
-        self, skip: int = 0, limit: int = 100
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str | None = None,
+        fields: str | Sequence[str] | None = None,
     ) -> List[PostCategory]:
         """
         Retrieves all post categories with pagination.
@@ -32,6 +43,8 @@ class PostCategoryCRUD(BaseCRUD[PostCategory]):
         Args:
             skip (int, optional): The number of records to skip. Defaults to 0.
             limit (int, optional): The number of records to retrieve. Defaults to 100.
+            cursor (str, optional): The cursor of the previous page for keyset pagination. Defaults to None.
+            fields (str | Sequence[str], optional): The sparse fieldset, only these columns are loaded. Defaults to None.
 
         Returns:
             List[PostCategory]: A list of post category objects.
@@ -40,12 +53,21 @@ class PostCategoryCRUD(BaseCRUD[PostCategory]):
             BadRequesetException: If there is an error retrieving post categories.
         """
         try:
-            return await self.get_by(skip=skip, limit=limit)
+            return await self.get_by(
+                skip=skip, limit=limit, cursor=cursor, fields=fields
+            )
+        except BadRequestException:
+            raise
         except Exception as e:
             raise BadRequestException(f"Error on retrieving post categories: {e}")
 
+    @read_only
     async def get_all_post_categories_by_post_uuid(
-        self, post_uuid: str, skip: int = 0, limit: int = 100
+        self,
+        post_uuid: str,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str | None = None,
     ) -> List[PostCategory]:
         """
         Retrieves all post categories associated with a specific post UUID.
@@ -54,6 +76,7 @@ class PostCategoryCRUD(BaseCRUD[PostCategory]):
             post_uuid (str): The UUID of the post.
             skip (int, optional): The number of records to skip. Default to 0.
             limit (int, optional): The number of records to retrieve. Defaults to 100.
+            cursor (str, optional): The cursor of the previous page for keyset pagination. Defaults to None.
 
         Returns:
             List[PostCategory]: A list of post category objects associated with the post.
@@ -63,12 +86,17 @@ class PostCategoryCRUD(BaseCRUD[PostCategory]):
         """
         try:
             filter_ = {"post_uuid": post_uuid}
-            return await self.get_by(filters=filter_, skip=skip, limit=limit)
+            return await self.get_by(
+                filters=filter_, skip=skip, limit=limit, cursor=cursor
+            )
+        except BadRequestException:
+            raise
         except Exception as e:
             raise BadRequestException(
                 f"Error retrieving post categories by the post UUID: {e}"
             )
 
+    @read_only
     async def get_post_category_by_uuid(self, uuid: UUID) -> PostCategory:
         """
         Retrieves a single post category by its UUID.
@@ -122,7 +150,7 @@ class PostCategoryCRUD(BaseCRUD[PostCategory]):
             post_category_uuid (UUID): The UUID of the post category to be updated.
 
         Returns:
-            bool: True if the update was successful, False otherwise.
+            bool: True once the post category is updated.
 
         Raises:
             NotFoundException: If the post category is not found.
@@ -131,10 +159,11 @@ class PostCategoryCRUD(BaseCRUD[PostCategory]):
         try:
             post_category = await self.get_post_category_by_uuid(post_category_uuid)
             await self.update(post_category, data)
+            return True
         except NotFoundException:
             raise
         except Exception as e:
-            BadRequestException(f"Error updating post category: {e}")
+            raise BadRequestException(f"Error updating post category: {e}")
 
     async def delete_post_category(self, post_category_uuid: UUID) -> bool:
         """
@@ -144,7 +173,7 @@ class PostCategoryCRUD(BaseCRUD[PostCategory]):
             post_category_uuid (UUID): The UUID of the post category to be deleted.
 
         Returns:
-            bool: True if deletion was successful, False otherwise.
+            bool: True once the post category is deleted.
 
         Raises:
             NotFoundException: If the post category is not found.
@@ -153,6 +182,7 @@ class PostCategoryCRUD(BaseCRUD[PostCategory]):
         try:
             post_category = await self.get_post_category_by_uuid(post_category_uuid)
             await self.delete(post_category)
+            return True
         except NotFoundException:
             raise
         except Exception as e:
@@ -0,0 +1,303 @@
+from typing import (Any, AsyncIterable, AsyncIterator, Dict, Iterable, List,
+                    Sequence, Tuple)
+from uuid import UUID, uuid4
+
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import config
+from app.crud.category import CategoryCRUD
+from app.crud.post import PostCRUD
+from app.crud.sub_category import SubCategoryCRUD
+from app.schemas.post import (PostImportCategory, PostImportError,
+                              PostImportResponse, PostImportRow)
+
+ROW_ADAPTER = TypeAdapter(PostImportRow)
+
+STAGING_TABLES = (
+    """
+    CREATE TEMPORARY TABLE import_posts (
+        uuid uuid, title text, body text, excerpt text, status text
+    ) ON COMMIT DROP
+    """,
+    """
+    CREATE TEMPORARY TABLE import_post_categories (
+        uuid uuid, post_uuid uuid, category_uuid uuid, sub_category_uuid uuid
+    ) ON COMMIT DROP
+    """,
+)
+
+DROP_STAGING_TABLES = "DROP TABLE import_posts, import_post_categories"
+
+MERGE_STAGED_ROWS = """
+WITH inserted AS (
+    INSERT INTO posts (
+        uuid, title, body, excerpt, status,
+        created_by, updated_by, created_at, updated_at
+    )
+    SELECT uuid, title, body, excerpt, status::poststatus,
+        CAST(:author AS uuid), CAST(:author AS uuid), now(), now()
+    FROM import_posts
+    ON CONFLICT (uuid) DO NOTHING
+    RETURNING uuid
+), linked AS (
+    INSERT INTO post_categories (uuid, post_uuid, category_uuid, sub_category_uuid)
+    SELECT staged.uuid, staged.post_uuid, staged.category_uuid, staged.sub_category_uuid
+    FROM import_post_categories AS staged
+    JOIN inserted ON inserted.uuid = staged.post_uuid
+)
+SELECT uuid FROM inserted
+"""
+
+Line = Tuple[int, str | bytes]
+
+
+async def iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    """
+    Splits a byte stream, e.g. a request body, into lines.
+
+    Args:
+        chunks (AsyncIterable[bytes]): The chunks of the stream.
+
+    Yields:
+        bytes: Each line, without its line break.
+    """
+    pending = b""
+    async for chunk in chunks:
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            yield line
+    if pending:
+        yield pending
+
+
+class PostImporter:
+    """
+    Imports posts with their categories from NDJSON, one `PostImportRow` per line.
+
+    Lines are processed in chunks: each chunk is validated with the post schemas, its
+    category and sub-category names are resolved with one batched query per model, and the
+    valid rows are copied (`COPY`) into temporary staging tables and merged into `posts` and
+    `post_categories` with a single set-based insert. Every chunk is its own transaction.
+    Rows repeating a UUID of their chunk are rejected and rows whose UUID already exists are
+    skipped, both are reported by line. If a chunk still fails in the database, its rows are
+    retried one by one so only the offending rows are rejected.
+
+    Attributes:
+        session (AsyncSession): The session the import runs in, it is committed after every chunk.
+        author (UUID | None): The user the imported posts are created by.
+        chunk_size (int): The number of lines per chunk.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        author: UUID | None = None,
+        chunk_size: int = config.IMPORT_CHUNK_SIZE,
+    ) -> None:
+        self.session = session
+        self.author = author
+        self.chunk_size = chunk_size
+        self.report = PostImportResponse(imported=0, skipped=0, failed=0, errors=[])
+
+    async def run(self, lines: AsyncIterable[str | bytes]) -> PostImportResponse:
+        """
+        Imports every line, blank lines are ignored.
+
+        Args:
+            lines (AsyncIterable[str | bytes]): The NDJSON lines.
+
+        Returns:
+            PostImportResponse: How many posts were imported, skipped and rejected.
+        """
+        chunk: List[Line] = []
+        line_number = 0
+        async for line in lines:
+            line_number += 1
+            if not line.strip():
+                continue
+            chunk.append((line_number, line))
+            if len(chunk) >= self.chunk_size:
+                await self._import_chunk(chunk)
+                chunk = []
+        if chunk:
+            await self._import_chunk(chunk)
+        return self.report
+
+    async def _import_chunk(self, chunk: Sequence[Line]) -> None:
+        rows: List[Tuple[int, PostImportRow]] = []
+        for line_number, line in chunk:
+            try:
+                rows.append((line_number, ROW_ADAPTER.validate_json(line)))
+            except ValidationError as e:
+                self._reject(line_number, self._validation_message(e))
+
+        posts: List[Tuple[Any, ...]] = []
+        post_categories: List[Tuple[Any, ...]] = []
+        lines: Dict[UUID, int] = {}
+        taxonomy = await self._resolve_taxonomy(row for _, row in rows)
+        for line_number, row in rows:
+            try:
+                self._check_text(row)
+                if row.uuid in lines:
+                    raise ValueError(
+                        f"Duplicate uuid `{row.uuid}`, already on line {lines[row.uuid]}."
+                    )
+                links = [self._link(category, taxonomy) for category in row.categories]
+            except ValueError as e:
+                self._reject(line_number, str(e))
+                continue
+
+            uuid = row.uuid or uuid4()
+            posts.append(
+                (
+                    uuid,
+                    row.title,
+                    row.body,
+                    PostCRUD.make_excerpt(row.body),
+                    row.status.name,
+                )
+            )
+            post_categories.extend((uuid4(), uuid, *link) for link in links)
+            lines[uuid] = line_number
+
+        if posts:
+            await self._copy_and_merge(posts, post_categories, lines)
+
+    async def _resolve_taxonomy(
+        self, rows: Iterable[PostImportRow]
+    ) -> Dict[str, Dict[str, Any]]:
+        category_names, sub_category_names = set(), set()
+        for row in rows:
+            for category in row.categories:
+                if category.category:
+                    category_names.add(category.category)
+                if category.sub_category:
+                    sub_category_names.add(category.sub_category)
+
+        categories = (
+            await CategoryCRUD(self.session).loader("name").load_many(category_names)
+        )
+        sub_categories = (
+            await SubCategoryCRUD(self.session)
+            .loader("name")
+            .load_many(sub_category_names)
+        )
+        return {
+            "categories": {
+                category.name: category for category in categories if category
+            },
+            "sub_categories": {
+                sub_category.name: sub_category
+                for sub_category in sub_categories
+                if sub_category
+            },
+        }
+
+    @staticmethod
+    def _check_text(row: PostImportRow) -> None:
+        # PostgreSQL text cannot hold NUL characters, `COPY` would fail the whole chunk.
+        for field in ("title", "body"):
+            if "\x00" in getattr(row, field):
+                raise ValueError(f"{field}: NUL characters are not allowed.")
+
+    @staticmethod
+    def _link(
+        category: PostImportCategory, taxonomy: Dict[str, Dict[str, Any]]
+    ) -> Tuple[UUID, UUID | None]:
+        if category.sub_category:
+            sub_category = taxonomy["sub_categories"].get(category.sub_category)
+            if sub_category is None:
+                raise ValueError(f"Unknown sub-category `{category.sub_category}`.")
+            if category.category and (
+                taxonomy["categories"].get(category.category) is None
+                or taxonomy["categories"][category.category].uuid
+                != sub_category.category_uuid
+            ):
+                raise ValueError(
+                    f"Sub-category `{category.sub_category}` is not in category `{category.category}`."
+                )
+            return sub_category.category_uuid, sub_category.uuid
+
+        if not category.category:
+            raise ValueError("A category or a sub-category is required.")
+        parent = taxonomy["categories"].get(category.category)
+        if parent is None:
+            raise ValueError(f"Unknown category `{category.category}`.")
+        return parent.uuid, None
+
+    async def _copy_and_merge(
+        self,
+        posts: List[Tuple[Any, ...]],
+        post_categories: List[Tuple[Any, ...]],
+        lines: Dict[UUID, int],
+    ) -> None:
+        try:
+            for statement in STAGING_TABLES:
+                await self.session.execute(text(statement))
+
+            connection = await self.session.connection()
+            raw_connection = await connection.get_raw_connection()
+            driver = raw_connection.driver_connection
+            await driver.copy_records_to_table(
+                "import_posts",
+                records=posts,
+                columns=["uuid", "title", "body", "excerpt", "status"],
+            )
+            if post_categories:
+                await driver.copy_records_to_table(
+                    "import_post_categories",
+                    records=post_categories,
+                    columns=["uuid", "post_uuid", "category_uuid", "sub_category_uuid"],
+                )
+
+            result = await self.session.execute(
+                text(MERGE_STAGED_ROWS), {"author": self.author}
+            )
+            inserted = set(result.scalars().all())
+            # Dropped explicitly too, as the session may only release a savepoint on commit.
+            await self.session.execute(text(DROP_STAGING_TABLES))
+            await self.session.commit()
+        except Exception as e:
+            await self.session.rollback()
+            if len(posts) == 1:
+                self._reject(lines[posts[0][0]], f"Exception on importing posts. {e}")
+                return
+            # Retried row by row, so a single bad row does not fail the whole chunk.
+            for post in posts:
+                await self._copy_and_merge(
+                    [post],
+                    [link for link in post_categories if link[1] == post[0]],
+                    {post[0]: lines[post[0]]},
+                )
+            return
+
+        for uuid, line_number in lines.items():
+            if uuid in inserted:
+                self.report.imported += 1
+            else:
+                self._skip(line_number, f"Post with uuid `{uuid}` already exists.")
+        await PostCRUD(self.session).invalidate_caches()
+
+    def _reject(self, line_number: int, message: str) -> None:
+        self.report.failed += 1
+        self._add_error(line_number, message)
+
+    def _skip(self, line_number: int, message: str) -> None:
+        self.report.skipped += 1
+        self._add_error(line_number, message)
+
+    def _add_error(self, line_number: int, message: str) -> None:
+        if len(self.report.errors) < config.IMPORT_MAX_ERRORS:
+            self.report.errors.append(
+                PostImportError(line=line_number, message=message)
+            )
+
+    @staticmethod
+    def _validation_message(error: ValidationError) -> str:
+        return "; ".join(
+            f"{'.'.join(map(str, detail['loc'])) or 'line'}: {detail['msg']}"
+            for detail in error.errors()
+        )
@@ -4,6 +4,8 @@ from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crud.base import BaseCRUD
+from app.crud.taxonomy import taxonomy_cache
+from app.database import read_only
 from app.exceptions import BadRequestException, NotFoundException
 from app.models import SubCategory
 
@@ -16,6 +18,10 @@ class SubCategoryCRUD(BaseCRUD[SubCategory]):
     Including creating, updating, deleting, and fetching SubCategories by UUID or with pagination.
     """
 
+    sortable_fields = ("created_at", "updated_at", "name")
+    cache_namespaces = ("sub_categories", "posts")
+    soft_delete = True
+
     def __init__(self, session: AsyncSession):
         """
         Initializes the PostCRUD class with the provided async session and SubCategory Model
@@ -25,8 +31,40 @@ class SubCategoryCRUD(BaseCRUD[SubCategory]):
         """
         super().__init__(model=SubCategory, session=session)
 
+    async def invalidate_caches(self) -> None:
+        await super().invalidate_caches()
+        taxonomy_cache.invalidate()
+
+    @read_only
+    async def get_cached_sub_category(self, sub_category_uuid: UUID) -> Dict[str, Any]:
+        """
+        Retrieves a single sub-category by its UUID from the taxonomy snapshot.
+
+        Args:
+            sub_category_uuid (UUID): The UUID of the sub-category to retrieve.
+
+        Returns:
+            Dict[str, Any]: The column values of the sub-category.
+
+        Raises:
+            NotFoundException: If no sub-category is found with the given UUID.
+        """
+        snapshot = await taxonomy_cache.get(self.session)
+        sub_category = snapshot.sub_categories.get(sub_category_uuid)
+        if not sub_category:
+            raise NotFoundException(
+                f"SubCategory with UUID `{sub_category_uuid}` not found."
+            )
+        return sub_category
+
+    @read_only
     async def get_all_sub_categories(
-        self, *, skip: int = 0, limit: int = 100
+        self,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        sort: str | None = None,
+        cursor: str | None = None,
     ) -> List[SubCategory]:
         """
         Retrieves all sub-categories from the database with pagination support.
@@ -34,25 +72,31 @@ class SubCategoryCRUD(BaseCRUD[SubCategory]):
         Args:
             skip (int, optional): Number of records to skip. Defaults to 0.
             limit (int, optional): Maximum number of records to retrieve. Defaults to 100.
+            sort (str, optional): The sort spec, e.g. `-created_at,name`. Defaults to None.
+            cursor (str, optional): The cursor of the previous page for keyset pagination. Defaults to None.
 
         Returns:
             List[SubCategroy]: A list of SubCategory objects.
 
         Raises:
-            NotFoundException: If no sub-categories are found.
+            NotFoundException: If no sub-categories are found and no `cursor` is given.
             BadRequestException: If an error occurs while retrieving sub-categories.
 
         """
         try:
-            sub_categories = await self.get_by(skip=skip, limit=limit)
-            if not sub_categories:
+            sub_categories = await self.get_by(
+                skip=skip, limit=limit, sort=sort, cursor=cursor
+            )
+            # A cursor past the last record is the empty end of the listing.
+            if not sub_categories and not cursor:
                 raise NotFoundException("No sub-categories found.")
             return sub_categories
-        except NotFoundException:
+        except (BadRequestException, NotFoundException):
             raise
         except Exception as e:
             raise BadRequestException(f"Failed to fetch sub-categories: {e}")
 
+    @read_only
     async def get_sub_category_by_uuid(self, sub_category_uuid: UUID) -> SubCategory:
         """
         Retrieves a single sub-category by its UUID.
@@ -72,7 +116,7 @@ class SubCategoryCRUD(BaseCRUD[SubCategory]):
 
             if not sub_category:
                 raise NotFoundException(
-                    f"SubCategoet with UUID `{sub_category_uuid}` not found."
+                    f"SubCategory with UUID `{sub_category_uuid}` not found."
                 )
             return sub_category
         except NotFoundException:
@@ -132,12 +176,15 @@ class SubCategoryCRUD(BaseCRUD[SubCategory]):
         except Exception as e:
             raise BadRequestException(f"Failed to update sub-category: {e}")
 
-    async def delete_sub_category(self, sub_category_uuid: UUID) -> bool:
+    async def delete_sub_category(
+        self, sub_category_uuid: UUID, user_uuid: UUID | None = None
+    ) -> bool:
         """
-        Deletes a SubCategory from the database.
+        Soft deletes a SubCategory, it is purged from the database later.
 
         Args:
             sub_category_uuid (UUID): The UUID of the SubCategory to delete.
+            user_uuid (UUID, optional): The UUID of the user deleting the SubCategory. Defaults to None.
 
         Returns:
             bool: True if the deletion was successful, False otherwise.
@@ -148,7 +195,7 @@ class SubCategoryCRUD(BaseCRUD[SubCategory]):
         """
         try:
             sub_category = await self.get_sub_category_by_uuid(sub_category_uuid)
-            return await self.delete(sub_category)
+            return await self.delete(sub_category, deleted_by=user_uuid)
         except NotFoundException:
             raise
         except Exception as e:
@@ -0,0 +1,184 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Sequence
+from uuid import UUID
+
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.config import config
+from app.models import Category, Post, PostCategory, SubCategory
+
+
+def _columns(record: Any) -> Dict[str, Any]:
+    state = inspect(record)
+    return {
+        attribute.key: state.dict[attribute.key]
+        for attribute in state.mapper.column_attrs
+        if attribute.key in state.dict
+    }
+
+
+@dataclass(frozen=True)
+class TaxonomySnapshot:
+    """
+    An immutable copy of every category and sub-category.
+
+    Attributes:
+        categories (Dict[UUID, Dict[str, Any]]): The column values of each category, by UUID.
+        sub_categories (Dict[UUID, Dict[str, Any]]): The column values of each sub-category, by UUID.
+    """
+
+    categories: Dict[UUID, Dict[str, Any]]
+    sub_categories: Dict[UUID, Dict[str, Any]]
+
+    def tree(self) -> List[Dict[str, Any]]:
+        """
+        Builds the category tree, each category with its sub-categories, both ordered by name.
+
+        Returns:
+            List[Dict[str, Any]]: The categories, each with a `sub_categories` list.
+        """
+        children: Dict[UUID, List[Dict[str, Any]]] = {}
+        for sub_category in self.sub_categories.values():
+            children.setdefault(sub_category["category_uuid"], []).append(sub_category)
+        return [
+            {
+                **category,
+                "sub_categories": sorted(
+                    children.get(uuid, []), key=lambda item: item["name"]
+                ),
+            }
+            for uuid, category in sorted(
+                self.categories.items(), key=lambda item: item[1]["name"]
+            )
+        ]
+
+    def sub_category_detail(self, uuid: UUID | None) -> Dict[str, Any] | None:
+        """
+        Returns a sub-category with its parent category nested under `category`.
+
+        Args:
+            uuid (UUID | None): The UUID of the sub-category.
+
+        Returns:
+            Dict[str, Any] | None: The sub-category, or `None` if it does not exist.
+        """
+        sub_category = self.sub_categories.get(uuid)
+        if sub_category is None:
+            return None
+        return {
+            **sub_category,
+            "category": self.categories.get(sub_category["category_uuid"]),
+        }
+
+    def hydrate_post(
+        self, post: Post, post_categories: Sequence[PostCategory]
+    ) -> Dict[str, Any]:
+        """
+        Returns the column values of a post with its post categories, where the sub-category
+        and its category are taken from the snapshot instead of being loaded with the post.
+
+        Args:
+            post (Post): The post.
+            post_categories (Sequence[PostCategory]): The post categories of the post.
+
+        Returns:
+            Dict[str, Any]: The post, each post category holding its `sub_categories` detail.
+        """
+        return {
+            **_columns(post),
+            "post_categories": [
+                {
+                    **_columns(post_category),
+                    "sub_categories": self.sub_category_detail(
+                        post_category.sub_category_uuid
+                    ),
+                }
+                for post_category in post_categories
+            ],
+        }
+
+
+class TaxonomyCache:
+    """
+    A process-wide snapshot of the taxonomy (categories and their sub-categories).
+
+    The taxonomy changes rarely but is read with every post, so it is loaded once, at startup
+    or on first use, and served from memory. Category and sub-category writes invalidate it,
+    and it is reloaded after `ttl` seconds to pick up writes made by other worker processes.
+
+    Attributes:
+        ttl (float): How long a snapshot is served, in seconds.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._snapshot: TaxonomySnapshot | None = None
+        self._loaded_at = 0.0
+        self._version = 0
+        self._lock: asyncio.Lock | None = None
+
+    async def get(self, session: AsyncSession) -> TaxonomySnapshot:
+        """
+        Returns the current snapshot, loading it with `session` if missing or stale.
+
+        Args:
+            session (AsyncSession): The session used to load the snapshot.
+
+        Returns:
+            TaxonomySnapshot: The taxonomy snapshot.
+        """
+        snapshot = self._current()
+        if snapshot is not None:
+            return snapshot
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            snapshot = self._current()
+            if snapshot is None:
+                snapshot = await self.load(session)
+        return snapshot
+
+    async def load(self, session: AsyncSession) -> TaxonomySnapshot:
+        """
+        Loads a fresh snapshot with `session` and serves it from now on.
+
+        The snapshot is not kept if the taxonomy was invalidated while it was loading.
+
+        Args:
+            session (AsyncSession): The session used to load the snapshot.
+
+        Returns:
+            TaxonomySnapshot: The loaded snapshot.
+        """
+        version = self._version
+        categories = (await session.execute(select(Category))).scalars().all()
+        sub_categories = (await session.execute(select(SubCategory))).scalars().all()
+        snapshot = TaxonomySnapshot(
+            categories={category.uuid: _columns(category) for category in categories},
+            sub_categories={
+                sub_category.uuid: _columns(sub_category)
+                for sub_category in sub_categories
+            },
+        )
+        if version == self._version:
+            self._snapshot = snapshot
+            self._loaded_at = time.monotonic()
+        return snapshot
+
+    def invalidate(self) -> None:
+        """Drops the snapshot, the next read loads a fresh one."""
+        self._version += 1
+        self._snapshot = None
+
+    def _current(self) -> TaxonomySnapshot | None:
+        if self._snapshot is None or time.monotonic() - self._loaded_at >= self.ttl:
+            return None
+        return self._snapshot
+
+
+taxonomy_cache = TaxonomyCache(ttl=config.TAXONOMY_CACHE_TTL_SECONDS)
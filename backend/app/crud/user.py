@@ -1,15 +1,24 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Sequence
 from uuid import UUID
 
+from sqlalchemy import inspect
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 
 from app.config import config
 from app.crud.base import BaseCRUD
+from app.database import read_only
 from app.exceptions import (BadRequestException, NotFoundException,
                             UnauthorizedException)
 from app.models import User
 from app.schemas.token import Token
-from app.utils import JWTHandler, PasswordHandler
+from app.utils import JWTHandler, TTLCache, password_hashing_pool
+from app.utils.metrics import register_cache
+
+user_cache: TTLCache[UUID, Dict[str, Any]] = TTLCache(
+    maxsize=config.USER_CACHE_MAX_SIZE, ttl=config.USER_CACHE_TTL_SECONDS
+)
+register_cache("user", user_cache)
 
 
 class UserCRUD(BaseCRUD[User]):
@@ -17,6 +26,11 @@ class UserCRUD(BaseCRUD[User]):
     User-specific CRUD operations for managing user accounts in the database.
     """
 
+    sortable_fields = ("created_at", "updated_at", "username", "email")
+    selectable_fields = ("uuid", "username", "email", "profile_image")
+    cache_namespaces = ("posts",)
+    soft_delete = True
+
     def __init__(self, session: AsyncSession):
         """
         Initializes the UserCRUD class with the provided async session and User Model
@@ -58,13 +72,54 @@ class UserCRUD(BaseCRUD[User]):
         except Exception as e:
             raise BadRequestException(e)
 
-    async def get_all_users(self, skip: int = 0, limit: int = 100) -> List[User] | None:
+    async def get_cached_by_uuid(self, uuid: UUID) -> User | None:
+        """
+        Asynchronously retrieves a user by their uuid, served from the process-level user cache when possible.
+
+        On a cache hit the user is attached to the session without a query, on a miss it is loaded
+        and its column values are cached. Entries are dropped when the user is updated or deleted.
+
+        Args:
+            uuid (UUID): The uuid of the User to be retrieved.
+
+        Returns:
+            User | None: The user object if found, otherwise None
+        """
+        columns = user_cache.get(uuid)
+        if columns is None:
+            user = await self.get_by_uuid(uuid)
+            if user:
+                user_cache.set(
+                    uuid,
+                    {
+                        attribute.key: getattr(user, attribute.key)
+                        for attribute in inspect(User).column_attrs
+                    },
+                )
+            return user
+
+        user = User(**columns)
+        make_transient_to_detached(user)
+        return await self.session.merge(user, load=False)
+
+    @read_only
+    async def get_all_users(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        sort: str | None = None,
+        cursor: str | None = None,
+        fields: str | Sequence[str] | None = None,
+    ) -> List[User] | None:
         """
         Asynchronously retrieves all the users.
 
         Args:
             skip (int): The number of users data to skip. Defaults to "0".
             limit (int): The number of users data to retrieve. Defaults to "100"
+            sort (str, optional): The sort spec, e.g. `-created_at,username`. Defaults to None.
+            cursor (str, optional): The cursor of the previous page for keyset pagination. Defaults to None.
+            fields (str | Sequence[str], optional): The sparse fieldset, only these columns are loaded. Defaults to None.
 
         Returns:
             List[User] | None: The list of users data or None
@@ -76,7 +131,12 @@ class UserCRUD(BaseCRUD[User]):
             return await self.get_by(
                 skip=skip,
                 limit=limit,
+                sort=sort,
+                cursor=cursor,
+                fields=fields,
             )
+        except BadRequestException:
+            raise
         except Exception as e:
             raise BadRequestException(f"Exception on fetching all user. `{e}`")
 
@@ -100,7 +160,7 @@ class UserCRUD(BaseCRUD[User]):
         if user:
             raise BadRequestException("User already exists")
 
-        hashed_password = PasswordHandler.hash_password(password)
+        hashed_password = await password_hashing_pool.hash_password(password)
 
         user = await self.create(
             {"username": username, "email": email, "password": hashed_password}
@@ -127,17 +187,19 @@ class UserCRUD(BaseCRUD[User]):
             raise NotFoundException("User not found.")
 
         updated = await self.update(user, attributes)
+        user_cache.delete(uuid)
 
         if updated:
             return True
         return False
 
-    async def delete_user(self, uuid: UUID) -> None:
+    async def delete_user(self, uuid: UUID, deleted_by: UUID | None = None) -> None:
         """
-        Deletes a user from the database based on the provided UUID.
+        Soft deletes a user based on the provided UUID, it is purged from the database later.
 
         Args:
             uuid (UUID): The UUID of the user to be deleted.
+            deleted_by (UUID, optional): The UUID of the user deleting the user. Defaults to None.
 
         Returns:
             None
@@ -150,21 +212,21 @@ class UserCRUD(BaseCRUD[User]):
         if not user:
             raise NotFoundException("User not found.")
         try:
-            await self.delete(user)
+            await self.delete(user, deleted_by=deleted_by)
         except Exception as e:
             raise BadRequestException(f"Exception on deleting user. {e}")
+        user_cache.delete(uuid)
 
-    async def login(self, email: str, password: str) -> Token:
+    async def authenticate(self, email: str, password: str) -> User:
         """
-        Logs in a user by validating their credentials (email and password) and
-        generating JWT tokens for authentication.
+        Validates the credentials of a user with one lookup and one password verification.
 
         Args:
             email (str): The email address of the user.
             password (str): The password provided by the user.
 
         Returns:
-            Token: A Token object containing an access token and a refresh token.
+            User: The authenticated user.
 
         Raises:
             NotFoundException: If no user is found with the given email address.
@@ -175,9 +237,22 @@ class UserCRUD(BaseCRUD[User]):
         if not user:
             raise NotFoundException("User not found.")
 
-        if not PasswordHandler.verify_password(password, user.password):
+        if not await password_hashing_pool.verify_password(password, user.password):
             raise UnauthorizedException("Invalid credentials.")
 
+        return user
+
+    def issue_tokens(self, user: User) -> Token:
+        """
+        Generates JWT tokens for a user whose identity is already established, e.g. right
+        after registration or authentication, without re-checking the password.
+
+        Args:
+            user (User): The user to issue the tokens for.
+
+        Returns:
+            Token: A Token object containing an access token and a refresh token.
+        """
         payload = {
             "uuid": str(user.uuid),
             "email": user.email,
@@ -186,6 +261,25 @@ class UserCRUD(BaseCRUD[User]):
 
         return self._token(payload)
 
+    async def login(self, email: str, password: str) -> Token:
+        """
+        Logs in a user by validating their credentials (email and password) and
+        generating JWT tokens for authentication.
+
+        Args:
+            email (str): The email address of the user.
+            password (str): The password provided by the user.
+
+        Returns:
+            Token: A Token object containing an access token and a refresh token.
+
+        Raises:
+            NotFoundException: If no user is found with the given email address.
+            UnauthorizedException: If the password is incorrect.
+        """
+        user = await self.authenticate(email, password)
+        return self.issue_tokens(user)
+
     async def reset_password(
         self, uuid: UUID, old_password: str, new_password: str
     ) -> User:
@@ -209,10 +303,10 @@ class UserCRUD(BaseCRUD[User]):
         if not user:
             raise NotFoundException("User not found.")
 
-        if not PasswordHandler.verify_password(old_password, user.password):
+        if not await password_hashing_pool.verify_password(old_password, user.password):
             raise UnauthorizedException("Invalid credentials.")
 
-        hashed_new_password = PasswordHandler.hash_password(new_password)
+        hashed_new_password = await password_hashing_pool.hash_password(new_password)
 
         updated_user = await self.update(
             user,
@@ -220,6 +314,7 @@ class UserCRUD(BaseCRUD[User]):
                 "password": hashed_new_password,
             },
         )
+        user_cache.delete(uuid)
         return updated_user
 
     def _token(self, payload: Dict[str, Any]) -> Token:
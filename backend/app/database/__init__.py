@@ -1,3 +1,12 @@
-from .session import Base, get_async_session
+from .routing import read_only
+from .session import (Base, create_engine, get_async_session, pool_stats,
+                      replicas)
 
-__all__ = ["Base", "get_async_session"]
+__all__ = [
+    "Base",
+    "create_engine",
+    "get_async_session",
+    "pool_stats",
+    "read_only",
+    "replicas",
+]
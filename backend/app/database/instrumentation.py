@@ -0,0 +1,117 @@
+import heapq
+import logging
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import List, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.config import config
+from app.utils.metrics import Histogram
+
+logger = logging.getLogger(__name__)
+
+PLACEHOLDERS = re.compile(r"\$\d+(?:\s*,\s*\$\d+)*")
+
+query_duration = Histogram(
+    "db_query_duration_seconds",
+    "Time spent executing SQL statements, by operation.",
+    labelnames=("operation",),
+)
+
+
+@dataclass
+class QueryStats:
+    """
+    The statements executed while handling one request.
+
+    Attributes:
+        count (int): The number of statements executed.
+        duration (float): The total execution time, in seconds.
+        shapes (Counter): How many times each statement shape ran, see `statement_shape`.
+        slowest (List[Tuple[float, str]]): The slowest statements as `(seconds, statement)`,
+            at most `DB_SLOWEST_STATEMENTS`, kept as a min-heap.
+    """
+
+    count: int = 0
+    duration: float = 0.0
+    shapes: Counter = field(default_factory=Counter)
+    slowest: List[Tuple[float, str]] = field(default_factory=list)
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        self.shapes[statement_shape(statement)] += 1
+        if len(self.slowest) < config.DB_SLOWEST_STATEMENTS:
+            heapq.heappush(self.slowest, (duration, statement))
+        elif duration > self.slowest[0][0]:
+            heapq.heapreplace(self.slowest, (duration, statement))
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """
+        Returns the statement shapes run more than `threshold` times, the sign of an N+1 pattern.
+
+        Args:
+            threshold (int): The number of runs of a shape allowed in one request.
+
+        Returns:
+            List[Tuple[str, int]]: The repeated shapes with their run count, most repeated first.
+        """
+        return [
+            (shape, count)
+            for shape, count in self.shapes.most_common()
+            if count > threshold
+        ]
+
+
+query_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def statement_shape(statement: str) -> str:
+    """
+    Normalizes a statement so runs that only differ by the number of bound values look the same,
+    e.g. `IN ($1, $2)` and `IN ($1, $2, $3)`.
+
+    Args:
+        statement (str): The SQL statement, with its parameter placeholders.
+
+    Returns:
+        str: The statement shape.
+    """
+    return PLACEHOLDERS.sub("?", " ".join(statement.split()))
+
+
+def instrument(async_engine: AsyncEngine) -> None:
+    """
+    Times every statement executed by `async_engine`.
+
+    Each duration is observed by the `db_query_duration_seconds` histogram, logged as a warning
+    when it reaches `DB_SLOW_QUERY_MS`, and recorded in the `QueryStats` of the current request,
+    if any.
+
+    Args:
+        async_engine (AsyncEngine): The engine to instrument.
+    """
+    sync_engine = async_engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany
+    ):
+        conn.info["query_started_at"] = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        duration = time.perf_counter() - conn.info["query_started_at"]
+        query_duration.observe(duration, statement.lstrip()[:6].upper())
+
+        if config.DB_SLOW_QUERY_MS and duration * 1000 >= config.DB_SLOW_QUERY_MS:
+            logger.warning("Slow query (%.1f ms): %s", duration * 1000, statement)
+
+        stats = query_stats.get()
+        if stats is not None:
+            stats.record(statement, duration)
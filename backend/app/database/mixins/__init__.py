@@ -1,4 +1,4 @@
-from .time_stamp import TimeStampMixin
+from .time_stamp import NOT_DELETED, TimeStampMixin
 from .user_audit import UserAuditMixin
 
-__all__ = ["TimeStampMixin", "UserAuditMixin"]
+__all__ = ["NOT_DELETED", "TimeStampMixin", "UserAuditMixin"]
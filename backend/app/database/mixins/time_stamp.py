@@ -1,7 +1,10 @@
-from sqlalchemy import DateTime, func
+from sqlalchemy import DateTime, func, text
 from sqlalchemy.ext.declarative import declared_attr
 from sqlalchemy.orm import Mapped, mapped_column
 
+# The predicate of partial indexes covering only live rows, as queries never see soft deleted ones.
+NOT_DELETED = text("deleted_at IS NULL")
+
 
 class TimeStampMixin:
     """Mixin class to add created_at, updated_at and deleted_at timestamp to models."""
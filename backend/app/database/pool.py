@@ -0,0 +1,63 @@
+import time
+from typing import Any, Dict
+
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+from app.utils.metrics import Histogram
+
+checkout_wait = Histogram(
+    "db_pool_wait_seconds",
+    "Time a checkout waited for a connection, including opening a new one.",
+)
+
+
+class MeteredAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """
+    An `AsyncAdaptedQueuePool` that records how long checkouts wait for a connection.
+
+    The wait covers queueing for a free connection as well as opening a new (overflow) one,
+    which together with the checked out and overflow counts tells whether the pool is sized
+    correctly for the number of workers.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._checkouts = 0
+        self._timeouts = 0
+        self._total_wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started_at = time.monotonic()
+        try:
+            return super()._do_get()
+        except TimeoutError:
+            self._timeouts += 1
+            raise
+        finally:
+            waited = time.monotonic() - started_at
+            self._checkouts += 1
+            self._total_wait_seconds += waited
+            self._max_wait_seconds = max(self._max_wait_seconds, waited)
+            checkout_wait.observe(waited)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Returns a snapshot of the pool utilization metrics.
+
+        Returns:
+            Dict[str, float]: The pool size, checked in/out and overflow connections, the number
+            of checkouts and timeouts, and the average and maximum checkout wait in seconds.
+        """
+        return {
+            "size": self.size(),
+            "checked_in": self.checkedin(),
+            "checked_out": self.checkedout(),
+            "overflow": max(self.overflow(), 0),
+            "max_overflow": self._max_overflow,
+            "checkouts": self._checkouts,
+            "timeouts": self._timeouts,
+            "avg_wait_seconds": self._total_wait_seconds / (self._checkouts or 1),
+            "max_wait_seconds": self._max_wait_seconds,
+        }
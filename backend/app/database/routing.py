@@ -0,0 +1,169 @@
+import functools
+import itertools
+import time
+from typing import Any, Awaitable, Callable, Dict, List, TypeVar
+from uuid import UUID
+
+from sqlalchemy import Engine, event
+from sqlalchemy.engine import ExceptionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import UpdateBase
+
+from app.config import config
+from app.utils import TTLCache
+
+ReturnType = TypeVar("ReturnType")
+
+sticky_users: TTLCache[UUID, bool] = TTLCache(
+    maxsize=config.DB_REPLICA_STICKY_MAX_SIZE, ttl=config.DB_REPLICA_STICKY_SECONDS
+)
+
+
+class ReplicaSet:
+    """
+    A set of read replica engines picked round-robin, skipping replicas that recently failed.
+
+    A replica is ejected for `eject_seconds` when connecting to it fails or one of its
+    connections is lost, reads then go to the remaining replicas or to the primary.
+
+    Attributes:
+        engines (List[AsyncEngine]): The replica engines.
+        eject_seconds (float): How long a failing replica is skipped.
+    """
+
+    def __init__(self, engines: List[AsyncEngine], eject_seconds: float) -> None:
+        self.engines = engines
+        self.eject_seconds = eject_seconds
+        self._ejected_until: Dict[Engine, float] = {}
+        self._routed: Dict[Engine, int] = {}
+        self._counter = itertools.count()
+        for engine in engines:
+            self._watch(engine.sync_engine)
+
+    def choose(self) -> Engine | None:
+        """
+        Picks the next healthy replica.
+
+        Returns:
+            Engine | None: The sync engine of the replica, or `None` if every replica is ejected.
+        """
+        now = time.monotonic()
+        for _ in range(len(self.engines)):
+            engine = self.engines[next(self._counter) % len(self.engines)].sync_engine
+            if self._ejected_until.get(engine, 0) <= now:
+                self._routed[engine] = self._routed.get(engine, 0) + 1
+                return engine
+        return None
+
+    def eject(self, engine: Engine) -> None:
+        """Skips `engine` for the next `eject_seconds`."""
+        self._ejected_until[engine] = time.monotonic() + self.eject_seconds
+
+    def is_healthy(self, engine: Engine) -> bool:
+        """Whether `engine` is not ejected."""
+        return self._ejected_until.get(engine, 0) <= time.monotonic()
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """
+        Returns the routing state of every replica.
+
+        Returns:
+            List[Dict[str, Any]]: The replica URL (without password), whether it is healthy and
+            how many sessions were routed to it.
+        """
+        now = time.monotonic()
+        return [
+            {
+                "url": engine.url.render_as_string(hide_password=True),
+                "healthy": self._ejected_until.get(engine.sync_engine, 0) <= now,
+                "routed": self._routed.get(engine.sync_engine, 0),
+            }
+            for engine in self.engines
+        ]
+
+    async def dispose(self) -> None:
+        """Closes the connection pools of every replica."""
+        for engine in self.engines:
+            await engine.dispose()
+
+    def _watch(self, engine: Engine) -> None:
+        @event.listens_for(engine, "do_connect")
+        def do_connect(dialect, conn_rec, cargs, cparams):
+            try:
+                return dialect.connect(*cargs, **cparams)
+            except Exception:
+                self.eject(engine)
+                raise
+
+        @event.listens_for(engine, "handle_error")
+        def handle_error(context: ExceptionContext) -> None:
+            if context.is_disconnect:
+                self.eject(engine)
+
+
+class RoutingSession(Session):
+    """
+    A session sending reads made inside a `read_only` CRUD method to a read replica.
+
+    A statement is routed to a replica only if the session is marked `replica_eligible`
+    (set per request by `get_async_session`), it runs inside a `read_only` method, and
+    the session has not written yet. Everything else, including flushes and DML, goes
+    to the primary. The replicas are taken from `info["replicas"]`.
+
+    The replica is picked on the first routed read and kept in `info["replica"]`, so every
+    read of the session sees the same point of the replication stream and holds a single
+    replica connection. If that replica is ejected, the remaining reads go to the primary.
+
+    After a commit that wrote, the user in `info["user_uuid"]` is kept on the primary
+    for `DB_REPLICA_STICKY_SECONDS` so they read their own writes despite replica lag.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kwargs: Any) -> Engine:
+        if self._flushing or isinstance(clause, UpdateBase):
+            self.info["wrote"] = True
+        elif (
+            self.info.get("read_only")
+            and self.info.get("replica_eligible")
+            and not self.info.get("wrote")
+            and self.info.get("replicas")
+        ):
+            if "replica" not in self.info:
+                self.info["replica"] = self.info["replicas"].choose()
+            replica = self.info["replica"]
+            if replica is not None and self.info["replicas"].is_healthy(replica):
+                return replica
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _stick_writer_to_primary(session: Session) -> None:
+    user_uuid = session.info.get("user_uuid")
+    if session.info.get("wrote") and user_uuid:
+        sticky_users.set(user_uuid, True)
+
+
+def read_only(
+    func: Callable[..., Awaitable[ReturnType]],
+) -> Callable[..., Awaitable[ReturnType]]:
+    """
+    Marks a CRUD method as read-only, so the reads it issues may be served by a replica.
+
+    Args:
+        func (Callable[..., Awaitable[ReturnType]]): The CRUD method, its instance must have a `session`.
+
+    Returns:
+        Callable[..., Awaitable[ReturnType]]: The wrapped method.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(self, *args: Any, **kwargs: Any) -> ReturnType:
+        info = self.session.info
+        previous = info.get("read_only", False)
+        info["read_only"] = True
+        try:
+            return await func(self, *args, **kwargs)
+        finally:
+            info["read_only"] = previous
+
+    return wrapper
@@ -1,22 +1,181 @@
-from typing import AsyncIterator
+from typing import Any, AsyncIterator, Dict
+from uuid import uuid4
 
+from fastapi import Request
+from sqlalchemy import event
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.ext.asyncio import (AsyncSession, async_sessionmaker,
-                                    create_async_engine)
-from sqlalchemy.orm import declarative_base
+from sqlalchemy.ext.asyncio import (AsyncEngine, AsyncSession,
+                                    async_sessionmaker, create_async_engine)
+from sqlalchemy.orm import (ORMExecuteState, Session, declarative_base,
+                            with_loader_criteria)
 
 from app.config import config
+from app.utils.metrics import Counter, Gauge, LabelValues
 
-engine = create_async_engine(config.POSTGRES_URL)
-async_session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+from .instrumentation import instrument
+from .mixins import TimeStampMixin
+from .pool import MeteredAsyncAdaptedQueuePool
+from .routing import ReplicaSet, RoutingSession, sticky_users
 
 
-async def get_async_session() -> AsyncIterator[AsyncSession]:
+def engine_options() -> Dict[str, Any]:
+    """
+    Builds the `create_async_engine` keyword arguments from the database settings.
+
+    In PgBouncer mode (transaction pooling) a connection may land on a different server
+    connection for every transaction, so asyncpg statement caching is disabled and
+    prepared statements get unique names.
+
+    Returns:
+        Dict[str, Any]: The engine keyword arguments.
+    """
+    connect_args: Dict[str, Any] = {
+        "statement_cache_size": config.DB_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": config.DB_PREPARED_STATEMENT_CACHE_SIZE,
+    }
+    if config.DB_PGBOUNCER_MODE:
+        connect_args = {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+
+    return {
+        "poolclass": MeteredAsyncAdaptedQueuePool,
+        "pool_size": config.DB_POOL_SIZE,
+        "max_overflow": config.DB_MAX_OVERFLOW,
+        "pool_timeout": config.DB_POOL_TIMEOUT,
+        "pool_recycle": config.DB_POOL_RECYCLE,
+        "pool_pre_ping": config.DB_POOL_PRE_PING,
+        "echo": config.DB_ECHO,
+        "connect_args": connect_args,
+    }
+
+
+def create_engine(url: str) -> AsyncEngine:
+    """
+    Creates an async engine for `url` with the configured pool and driver settings, its
+    statements are timed by `instrument`.
+
+    Args:
+        url (str): The database URL.
+
+    Returns:
+        AsyncEngine: The SQLAlchemy async engine.
+    """
+    async_engine = create_async_engine(url, **engine_options())
+    instrument(async_engine)
+    return async_engine
+
+
+def pool_stats(async_engine: AsyncEngine | None = None) -> Dict[str, float]:
+    """
+    Returns the connection pool utilization metrics of an engine.
+
+    Args:
+        async_engine (AsyncEngine, optional): The engine to inspect. Defaults to the application engine.
+
+    Returns:
+        Dict[str, float]: The metrics of `MeteredAsyncAdaptedQueuePool.stats`, or an empty dict
+        if the engine uses another pool class.
+    """
+    pool = (async_engine or engine).pool
+    if isinstance(pool, MeteredAsyncAdaptedQueuePool):
+        return pool.stats()
+    return {}
+
+
+engine = create_engine(config.POSTGRES_URL)
+replicas = ReplicaSet(
+    [create_engine(url) for url in config.POSTGRES_REPLICA_URLS],
+    eject_seconds=config.DB_REPLICA_EJECT_SECONDS,
+)
+async_session_maker = async_sessionmaker(
+    bind=engine,
+    expire_on_commit=False,
+    sync_session_class=RoutingSession,
+    info={"replicas": replicas},
+)
+
+
+def _pool_metric(*stats: str):
+    def collect() -> Dict[LabelValues, float]:
+        engines = {"primary": engine}
+        engines.update(
+            (f"replica-{index}", replica)
+            for index, replica in enumerate(replicas.engines)
+        )
+        values = {}
+        for name, async_engine in engines.items():
+            engine_stats = pool_stats(async_engine)
+            for stat in stats:
+                if stat in engine_stats:
+                    labels = (name, stat) if len(stats) > 1 else (name,)
+                    values[labels] = engine_stats[stat]
+        return values
+
+    return collect
+
+
+pool_connections = Gauge(
+    "db_pool_connections",
+    "Connections of the pool, by state.",
+    labelnames=("engine", "state"),
+    callback=_pool_metric("checked_in", "checked_out", "overflow"),
+)
+pool_checkouts = Counter(
+    "db_pool_checkouts_total",
+    "Connections checked out of the pool.",
+    labelnames=("engine",),
+    callback=_pool_metric("checkouts"),
+)
+pool_timeouts = Counter(
+    "db_pool_timeouts_total",
+    "Checkouts that timed out waiting for a free connection.",
+    labelnames=("engine",),
+    callback=_pool_metric("timeouts"),
+)
+
+SAFE_METHODS = ("GET", "HEAD")
+
+
+async def get_async_session(request: Request = None) -> AsyncIterator[AsyncSession]:
     try:
         async with async_session_maker() as session:
+            if request is not None:
+                user_uuid = getattr(request.scope.get("user"), "uuid", None)
+                session.info["user_uuid"] = user_uuid
+                session.info["replica_eligible"] = request.method in SAFE_METHODS and (
+                    user_uuid is None or not sticky_users.get(user_uuid)
+                )
             yield session
     except SQLAlchemyError as e:
         raise e
 
 
+@event.listens_for(Session, "do_orm_execute")
+def _exclude_deleted(state: ORMExecuteState) -> None:
+    """
+    Hides soft deleted rows, those with a `deleted_at`, from every ORM statement.
+
+    The criteria is added to the SELECT, UPDATE and DELETE statements of every model with
+    `TimeStampMixin`, including joins and the relationship loads of the selected records.
+    Statements run with the `include_deleted` execution option, e.g. the purge of old
+    tombstones, see every row.
+    """
+    if (
+        (state.is_select or state.is_update or state.is_delete)
+        and not state.is_column_load
+        and not state.is_relationship_load
+        and not state.execution_options.get("include_deleted", False)
+    ):
+        state.statement = state.statement.options(
+            with_loader_criteria(
+                TimeStampMixin,
+                lambda cls: cls.deleted_at.is_(None),
+                include_aliases=True,
+            )
+        )
+
+
 Base = declarative_base()
@@ -7,4 +7,11 @@ from app.dependencies.crud import CRUDProvider
 async def get_current_user(
     request: Request, user_crud: UserCRUD = Depends(CRUDProvider.get_user_crud)
 ):
-    return await user_crud.get_by_uuid(request.user.uuid)
+    """
+    Resolves the authenticated user, memoized on `request.state` for the rest of the request.
+    """
+    if not hasattr(request.state, "current_user"):
+        request.state.current_user = await user_crud.get_cached_by_uuid(
+            request.user.uuid
+        )
+    return request.state.current_user
@@ -1,5 +1,6 @@
 from .base import (BadRequestException, CustomException, DatabaseException,
-                   NotFoundException, UnauthorizedException)
+                   NotFoundException, ServiceUnavailableException,
+                   UnauthorizedException)
 
 __all__ = [
     "CustomException",
@@ -7,4 +8,5 @@ __all__ = [
     "UnauthorizedException",
     "NotFoundException",
     "DatabaseException",
+    "ServiceUnavailableException",
 ]
@@ -1,3 +1,13 @@
-from .authentication import AuthBackend, AuthenticationMiddleware
+from .authentication import AuthBackend, AuthenticationMiddleware, token_cache
+from .compression import CompressionMiddleware
+from .metrics import MetricsMiddleware
+from .query_stats import QueryStatsMiddleware
 
-__all__ = ["AuthBackend", "AuthenticationMiddleware"]
+__all__ = [
+    "AuthBackend",
+    "AuthenticationMiddleware",
+    "CompressionMiddleware",
+    "MetricsMiddleware",
+    "QueryStatsMiddleware",
+    "token_cache",
+]
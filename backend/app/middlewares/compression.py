@@ -0,0 +1,209 @@
+import gzip
+import zlib
+from typing import Dict, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import config
+from app.utils import TTLCache
+from app.utils.metrics import register_cache
+
+try:
+    import brotli
+except ImportError:  # brotli is optional, gzip is always available
+    brotli = None
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+)
+
+compressed_cache: TTLCache[Tuple[str, str], bytes] = TTLCache(
+    maxsize=config.COMPRESSION_CACHE_MAX_SIZE, ttl=config.COMPRESSION_CACHE_TTL_SECONDS
+)
+register_cache("compression", compressed_cache)
+
+
+def negotiate(accept_encoding: str) -> str | None:
+    """
+    Picks the content coding of a response from the `Accept-Encoding` request header.
+
+    Brotli is preferred to gzip when both are equally acceptable and brotli is installed.
+
+    Args:
+        accept_encoding (str): The header value, e.g. `gzip, br;q=0.9`.
+
+    Returns:
+        str | None: `br` or `gzip`, or `None` if the response must not be compressed.
+    """
+    qualities: Dict[str, float] = {}
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.partition(";")
+        quality = 1.0
+        name, _, value = params.strip().partition("=")
+        if name == "q":
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        if coding.strip():
+            qualities[coding.strip()] = quality
+
+    available = ("br", "gzip") if brotli is not None else ("gzip",)
+    best, best_quality = None, 0.0
+    for coding in available:
+        quality = qualities.get(coding, qualities.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+def compress(body: bytes, coding: str) -> bytes:
+    """Compresses a whole response body with `coding`."""
+    if coding == "br":
+        return brotli.compress(body, quality=config.COMPRESSION_BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=config.COMPRESSION_GZIP_LEVEL, mtime=0)
+
+
+class StreamCompressor:
+    """
+    Compresses a response body sent in several chunks.
+
+    Every chunk is flushed, so the client can decode each one as soon as it arrives, e.g.
+    every batch of an NDJSON export.
+    """
+
+    def __init__(self, coding: str) -> None:
+        if coding == "br":
+            self._brotli = brotli.Compressor(quality=config.COMPRESSION_BROTLI_QUALITY)
+        else:
+            self._brotli = None
+            self._gzip = zlib.compressobj(
+                config.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS
+            )
+
+    def compress(self, chunk: bytes) -> bytes:
+        if self._brotli is not None:
+            return self._brotli.process(chunk) + self._brotli.flush()
+        return self._gzip.compress(chunk) + self._gzip.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self._brotli is not None:
+            return self._brotli.finish()
+        return self._gzip.flush(zlib.Z_FINISH)
+
+
+class CompressionMiddleware:
+    """
+    Compresses JSON and text responses with gzip, or brotli when it is installed, as
+    negotiated by the `Accept-Encoding` request header.
+
+    Bodies sent in one message are compressed at once, unless they are smaller than
+    `minimum_size`. Compressed bodies of responses carrying an ETag, e.g. those of the
+    response cache, are kept by ETag and coding, so a cached response is only compressed once.
+    Streamed bodies are compressed chunk by chunk. Responses that already have a
+    `Content-Encoding` are sent as is.
+
+    The ETag of a compressed response is made weak, as its bytes differ from the identity
+    representation, `ResponseCache` accepts both forms in `If-None-Match`.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int | None = None,
+        cache: TTLCache[Tuple[str, str], bytes] = compressed_cache,
+    ) -> None:
+        self.app = app
+        self.minimum_size = (
+            config.COMPRESSION_MINIMUM_SIZE if minimum_size is None else minimum_size
+        )
+        self.cache = cache
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        coding = negotiate(Headers(scope=scope).get("Accept-Encoding", ""))
+        if coding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Message | None = None
+        compressor: StreamCompressor | None = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start, compressor, passthrough
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                content_type = headers.get("Content-Type", "").split(";")[0].strip()
+                passthrough = "Content-Encoding" in headers or not (
+                    content_type.startswith("text/")
+                    or content_type.endswith("+json")
+                    or content_type in COMPRESSIBLE_TYPES
+                )
+                if passthrough:
+                    await send(message)
+                else:
+                    start = message
+                return
+
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if compressor is None and start is not None:
+                # The first body message tells whether the response is streamed.
+                headers = MutableHeaders(scope=start)
+                if not more_body:
+                    if len(body) >= self.minimum_size:
+                        body = self._compress_body(body, coding, headers.get("ETag"))
+                        self._set_headers(headers, coding)
+                        headers["Content-Length"] = str(len(body))
+                    await send(start)
+                    await send({"type": "http.response.body", "body": body})
+                    start = None
+                    return
+
+                compressor = StreamCompressor(coding)
+                self._set_headers(headers, coding)
+                del headers["Content-Length"]
+                await send(start)
+                start = None
+
+            if compressor is None:
+                await send(message)
+                return
+            chunk = compressor.compress(body) if body else b""
+            if not more_body:
+                chunk += compressor.finish()
+            await send(
+                {"type": "http.response.body", "body": chunk, "more_body": more_body}
+            )
+
+        await self.app(scope, receive, send_compressed)
+
+    def _compress_body(self, body: bytes, coding: str, etag: str | None) -> bytes:
+        if etag is None:
+            return compress(body, coding)
+        compressed = self.cache.get((etag, coding))
+        if compressed is None:
+            compressed = compress(body, coding)
+            self.cache.set((etag, coding), compressed)
+        return compressed
+
+    @staticmethod
+    def _set_headers(headers: MutableHeaders, coding: str) -> None:
+        headers["Content-Encoding"] = coding
+        headers.add_vary_header("Accept-Encoding")
+        etag = headers.get("ETag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
@@ -0,0 +1,56 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.utils.metrics import Counter, Gauge, Histogram
+
+requests_total = Counter(
+    "http_requests_total",
+    "HTTP requests handled, by route and status code.",
+    labelnames=("method", "route", "status"),
+)
+request_duration = Histogram(
+    "http_request_duration_seconds",
+    "Time to handle an HTTP request, until the response is sent.",
+    labelnames=("method", "route"),
+)
+requests_in_flight = Gauge(
+    "http_requests_in_flight",
+    "HTTP requests being handled.",
+)
+
+
+class MetricsMiddleware:
+    """
+    Counts and times every HTTP request by route template, see `app.utils.metrics`.
+
+    Routes are labelled with their template, e.g. `/post/{uuid}`, so the number of series
+    stays bounded, requests matching no route are labelled `unmatched`.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        requests_in_flight.inc()
+        started_at = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            duration = time.perf_counter() - started_at
+            requests_in_flight.dec()
+            route = getattr(scope.get("route"), "path", "unmatched")
+            requests_total.inc(scope["method"], route, str(status_code))
+            request_duration.observe(duration, scope["method"], route)
@@ -0,0 +1,85 @@
+import logging
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import config
+from app.database.instrumentation import QueryStats, query_stats
+from app.utils.metrics import Histogram
+
+logger = logging.getLogger(__name__)
+
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+request_queries = Histogram(
+    "http_request_db_queries",
+    "SQL statements executed per request, by route.",
+    labelnames=("method", "route"),
+    buckets=QUERY_COUNT_BUCKETS,
+)
+request_db_duration = Histogram(
+    "http_request_db_duration_seconds",
+    "Time spent in SQL statements per request, by route.",
+    labelnames=("method", "route"),
+)
+
+
+class QueryStatsMiddleware:
+    """
+    Collects the SQL statements executed by each request, see `app.database.instrumentation`.
+
+    The query count and database time of every request are observed by histograms labelled
+    with the route template. In debug mode they are also returned in the `X-DB-Query-Count`
+    and `X-DB-Time-Ms` headers. Statement shapes that ran more than `DB_N_PLUS_ONE_THRESHOLD`
+    times in one request are logged as likely N+1 queries.
+    """
+
+    def __init__(self, app: ASGIApp, debug: bool | None = None) -> None:
+        self.app = app
+        self.debug = config.DEBUG if debug is None else debug
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = query_stats.set(stats)
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start" and self.debug:
+                headers = MutableHeaders(scope=message)
+                headers["X-DB-Query-Count"] = str(stats.count)
+                headers["X-DB-Time-Ms"] = f"{stats.duration * 1000:.2f}"
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            query_stats.reset(token)
+            self._report(scope, stats)
+
+    @staticmethod
+    def _report(scope: Scope, stats: QueryStats) -> None:
+        route = getattr(scope.get("route"), "path", "unmatched")
+        request_queries.observe(stats.count, scope["method"], route)
+        request_db_duration.observe(stats.duration, scope["method"], route)
+
+        for shape, count in stats.repeated(config.DB_N_PLUS_ONE_THRESHOLD):
+            logger.warning(
+                "Possible N+1 query on %s %s, ran %d times: %s",
+                scope["method"],
+                route,
+                count,
+                shape,
+            )
+        if stats.slowest:
+            logger.debug(
+                "Slowest queries on %s %s: %s",
+                scope["method"],
+                route,
+                [
+                    (round(duration * 1000, 2), statement)
+                    for duration, statement in sorted(stats.slowest, reverse=True)
+                ],
+            )
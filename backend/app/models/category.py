@@ -1,19 +1,28 @@
 from uuid import uuid4
 
-from sqlalchemy import UUID, Unicode
+from sqlalchemy import UUID, Index, Unicode
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
-from app.database.mixins import TimeStampMixin, UserAuditMixin
+from app.database.mixins import NOT_DELETED, TimeStampMixin, UserAuditMixin
 
 
 class Category(Base, UserAuditMixin, TimeStampMixin):
     __tablename__ = "categories"
+    __table_args__ = (
+        Index(
+            "ix_categories_created_at_uuid",
+            "created_at",
+            "uuid",
+            postgresql_where=NOT_DELETED,
+        ),
+        Index("ix_categories_name", "name", unique=True, postgresql_where=NOT_DELETED),
+    )
 
     uuid: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, unique=True, nullable=False, default=uuid4
     )
-    name: Mapped[str] = mapped_column(Unicode(128), nullable=False, unique=True)
+    name: Mapped[str] = mapped_column(Unicode(128), nullable=False)
 
     def __str__(self):
         return f"uuid: {self.uuid}, name: {self.name}"
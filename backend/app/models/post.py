@@ -1,24 +1,58 @@
 from uuid import uuid4
 
-from sqlalchemy import UUID, Enum, Text, Unicode
+from sqlalchemy import UUID, Computed, Enum, Index, Text, Unicode, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
-from app.database.mixins import TimeStampMixin, UserAuditMixin
+from app.database.mixins import NOT_DELETED, TimeStampMixin, UserAuditMixin
 from app.schemas.post import PostStatus
 
 
 class Post(Base, UserAuditMixin, TimeStampMixin):
     __tablename__ = "posts"
+    __table_args__ = (
+        Index(
+            "ix_posts_created_at_uuid",
+            "created_at",
+            "uuid",
+            postgresql_where=NOT_DELETED,
+        ),
+        Index(
+            "ix_posts_updated_at_uuid",
+            "updated_at",
+            "uuid",
+            postgresql_where=NOT_DELETED,
+        ),
+        Index("ix_posts_status_uuid", "status", "uuid", postgresql_where=NOT_DELETED),
+        Index("ix_posts_title_uuid", "title", "uuid", postgresql_where=NOT_DELETED),
+        Index("ix_posts_search_vector", "search_vector", postgresql_using="gin"),
+        # Only the tombstones, found oldest first by the purge.
+        Index(
+            "ix_posts_deleted_at",
+            "deleted_at",
+            postgresql_where=text("deleted_at IS NOT NULL"),
+        ),
+    )
 
     uuid: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, unique=True, nullable=False, default=uuid4
     )
     title: Mapped[str] = mapped_column(Unicode(255), nullable=False)
     body: Mapped[str] = mapped_column(Text, nullable=False)
+    excerpt: Mapped[str] = mapped_column(Unicode(300), nullable=True)
     status: Mapped[PostStatus] = mapped_column(
         Enum(PostStatus, create_type=False), nullable=False, default=PostStatus.DRAFT
     )
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(body, '')), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
 
     post_categories = relationship("PostCategory", backref="posts")
 
@@ -1,6 +1,6 @@
 from uuid import uuid4
 
-from sqlalchemy import UUID, ForeignKey
+from sqlalchemy import UUID, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -9,6 +9,7 @@ from app.database.mixins import TimeStampMixin, UserAuditMixin
 
 class PostCategory(Base):
     __tablename__ = "post_categories"
+    __table_args__ = (Index("ix_post_categories_post_uuid_uuid", "post_uuid", "uuid"),)
 
     uuid: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True), nullable=False, primary_key=True, unique=True, default=uuid4
@@ -1,21 +1,34 @@
 from datetime import datetime
 from uuid import uuid4
 
-from sqlalchemy import UUID, DateTime, Text, Unicode, func
+from sqlalchemy import UUID, DateTime, Index, Text, Unicode, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
-from app.database.mixins import TimeStampMixin, UserAuditMixin
+from app.database.mixins import NOT_DELETED, TimeStampMixin, UserAuditMixin
 
 
 class User(Base, TimeStampMixin, UserAuditMixin):
     __tablename__ = "users"
+    __table_args__ = (
+        Index(
+            "ix_users_created_at_uuid",
+            "created_at",
+            "uuid",
+            postgresql_where=NOT_DELETED,
+        ),
+        # Unique among live users only, a deleted account frees its username and email.
+        Index(
+            "ix_users_username", "username", unique=True, postgresql_where=NOT_DELETED
+        ),
+        Index("ix_users_email", "email", unique=True, postgresql_where=NOT_DELETED),
+    )
 
     uuid: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, unique=True, nullable=False, default=uuid4
     )
-    username: Mapped[str] = mapped_column(Unicode(32), unique=True, nullable=False)
-    email: Mapped[str] = mapped_column(Unicode(320), unique=True, nullable=False)
+    username: Mapped[str] = mapped_column(Unicode(32), nullable=False)
+    email: Mapped[str] = mapped_column(Unicode(320), nullable=False)
     password: Mapped[str] = mapped_column(Unicode(128), nullable=False)
     full_name: Mapped[str] = mapped_column(Unicode(128), nullable=True)
     bio: Mapped[str] = mapped_column(Text, nullable=True)
@@ -3,12 +3,17 @@ from http import HTTPStatus
 from fastapi import APIRouter, status
 from fastapi.responses import JSONResponse
 
-from . import auth, category, post_category, posts, sub_category, users
+from app.schemas.message import MessageResponse
+
+from . import (auth, category, metrics, post_category, posts, sub_category,
+               users)
 
 router = APIRouter()
 
 
-@router.get("/", tags=["Health"], status_code=status.HTTP_200_OK)
+@router.get(
+    "/", tags=["Health"], status_code=status.HTTP_200_OK, response_model=MessageResponse
+)
 async def index():
     return JSONResponse(status_code=HTTPStatus.OK, content={"message": "OK"})
 
@@ -23,3 +28,4 @@ router.include_router(posts.router, prefix="/post", tags=["Post"])
 router.include_router(
     post_category.router, prefix="/post-category", tags=["Post Category"]
 )
+router.include_router(metrics.router, tags=["Metrics"])
@@ -5,9 +5,10 @@ from fastapi.responses import JSONResponse
 
 from app.crud import UserCRUD
 from app.dependencies import AuthenticationRequired, CRUDProvider
-from app.schemas.auth import (AuthResponse, LoginUserRequest,
+from app.schemas.auth import (AuthResponse, LoginUserRequest, LogoutResponse,
                               LogoutUserRequest, RegisterUserRequest,
                               ResetPasswordRequest, UserResponse)
+from app.schemas.message import MessageResponse
 
 router = APIRouter()
 
@@ -19,9 +20,8 @@ async def register(
     data: RegisterUserRequest,
     user_crud: UserCRUD = Depends(CRUDProvider.get_user_crud),
 ):
-    user_data = data.model_dump()
-    user = await user_crud.register(**user_data)
-    token = await user_crud.login(user_data["email"], user_data["password"])
+    user = await user_crud.register(**data.model_dump())
+    token = user_crud.issue_tokens(user)
     return {
         "token": token,
         "user": user,
@@ -32,16 +32,15 @@ async def register(
 async def login(
     data: LoginUserRequest, user_crud: UserCRUD = Depends(CRUDProvider.get_user_crud)
 ):
-    login_data = data.model_dump()
-    token = await user_crud.login(**login_data)
-    user = await user_crud.get_by_email(login_data.get("email"))
+    user = await user_crud.authenticate(**data.model_dump())
+    token = user_crud.issue_tokens(user)
     return {
         "token": token,
         "user": user,
     }
 
 
-@router.post("/logout")
+@router.post("/logout", response_model=LogoutResponse)
 async def logout(data: LogoutUserRequest):
     return JSONResponse(
         status_code=status.HTTP_200_OK,
@@ -49,7 +48,11 @@ async def logout(data: LogoutUserRequest):
     )
 
 
-@router.post("/reset-password/{uuid}", dependencies=[Depends(AuthenticationRequired)])
+@router.post(
+    "/reset-password/{uuid}",
+    dependencies=[Depends(AuthenticationRequired)],
+    response_model=MessageResponse,
+)
 async def reset_password(
     uuid: UUID,
     data: ResetPasswordRequest,
@@ -1,31 +1,57 @@
+from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, status
 
 from app.crud.category import CategoryCRUD
 from app.dependencies import (AuthenticationRequired, CRUDProvider,
                               get_current_user)
 from app.models import User
-from app.schemas.category import (CategoryResponse, CreateCategoryRequest,
+from app.schemas.category import (CategoryRead, CategoryResponse,
+                                  CategoryTreeResponse, CreateCategoryRequest,
                                   UpdateCategoryRequest)
+from app.schemas.message import MessageResponse
+from app.utils import response_cache
 
 router = APIRouter()
 
 
-@router.get("/")
+@router.get("/", response_model=List[CategoryRead])
 async def get_categories(
+    request: Request,
     skip: int = 0,
     limit: int = 100,
+    sort: str | None = None,
+    cursor: str | None = None,
     crud: CategoryCRUD = Depends(CRUDProvider.get_category_crud),
 ):
-    return await crud.get_all_categories(skip=skip, limit=limit)
+    def headers(categories):
+        next_cursor = crud.next_cursor(categories, limit, sort)
+        return {"X-Next-Cursor": next_cursor} if next_cursor else {}
 
+    return await response_cache.respond(
+        request,
+        "categories",
+        lambda: crud.get_all_categories(
+            skip=skip, limit=limit, sort=sort, cursor=cursor
+        ),
+        headers=headers,
+        response_model=List[CategoryRead],
+    )
+
+
+@router.get("/tree", response_model=List[CategoryTreeResponse])
+async def get_category_tree(
+    crud: CategoryCRUD = Depends(CRUDProvider.get_category_crud),
+):
+    return await crud.get_category_tree()
 
-@router.get("/{uuid}")
+
+@router.get("/{uuid}", response_model=CategoryRead)
 async def get_category(
     uuid: UUID, crud: CategoryCRUD = Depends(CRUDProvider.get_category_crud)
 ):
-    return await crud.get_category_by_uuid(uuid)
+    return await crud.get_cached_category(uuid)
 
 
 @router.post(
@@ -47,6 +73,7 @@ async def create_category(
     "/{uuid}",
     status_code=status.HTTP_200_OK,
     dependencies=[Depends(AuthenticationRequired)],
+    response_model=MessageResponse,
 )
 async def update_category(
     data: UpdateCategoryRequest,
@@ -68,6 +95,8 @@ async def update_category(
     dependencies=[Depends(AuthenticationRequired)],
 )
 async def delete_category(
-    uuid: UUID, crud: CategoryCRUD = Depends(CRUDProvider.get_category_crud)
+    uuid: UUID,
+    current_user: User = Depends(get_current_user),
+    crud: CategoryCRUD = Depends(CRUDProvider.get_category_crud),
 ):
-    await crud.delete_category(uuid)
+    await crud.delete_category(uuid, user_uuid=current_user.uuid)
@@ -0,0 +1,10 @@
+from fastapi import APIRouter, Response
+
+from app.utils.metrics import CONTENT_TYPE, render
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics():
+    return Response(content=render(), media_type=CONTENT_TYPE)
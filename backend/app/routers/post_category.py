@@ -1,37 +1,62 @@
+from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
 
 from app.crud.post_category import PostCategoryCRUD
 from app.dependencies import AuthenticationRequired, CRUDProvider
+from app.schemas.message import MessageResponse
+from app.schemas.partial import dump_json, partial_model
 from app.schemas.post_category import (CreatePostCategoryRequest,
+                                       PostCategoryResponse,
                                        UpdatePostCategoryRequest)
 
 router = APIRouter()
 
 
-@router.get("/")
+@router.get("/", response_model=List[PostCategoryResponse])
 async def get_post_categories(
     skip: int = 0,
     limit: int = 100,
+    cursor: str | None = None,
+    fields: str | None = None,
     crud: PostCategoryCRUD = Depends(CRUDProvider.get_post_category_crud),
 ):
-    return await crud.get_all_post_categories(skip=skip, limit=limit)
+    fields = crud.parse_fields(fields)
+    post_categories = await crud.get_all_post_categories(
+        skip=skip, limit=limit, cursor=cursor, fields=fields
+    )
+    next_cursor = crud.next_cursor(post_categories, limit)
+    model = (
+        partial_model(PostCategoryResponse, fields) if fields else PostCategoryResponse
+    )
+    return Response(
+        content=dump_json(post_categories, List[model]),
+        media_type="application/json",
+        headers={"X-Next-Cursor": next_cursor} if next_cursor else None,
+    )
 
 
-@router.get("/by-post/{uuid}")
+@router.get("/by-post/{uuid}", response_model=List[PostCategoryResponse])
 async def get_post_categories_by_post_uuid(
     post_uuid: UUID,
     skip: int = 0,
     limit: int = 100,
+    cursor: str | None = None,
     crud: PostCategoryCRUD = Depends(CRUDProvider.get_post_category_crud),
 ):
-    return await crud.get_all_post_categories_by_post_uuid(
-        post_uuid=post_uuid, skip=skip, limit=limit
+    post_categories = await crud.get_all_post_categories_by_post_uuid(
+        post_uuid=post_uuid, skip=skip, limit=limit, cursor=cursor
+    )
+    next_cursor = crud.next_cursor(post_categories, limit)
+    return Response(
+        content=dump_json(post_categories, List[PostCategoryResponse]),
+        media_type="application/json",
+        headers={"X-Next-Cursor": next_cursor} if next_cursor else None,
     )
 
 
-@router.get("/{uuid}")
+@router.get("/{uuid}", response_model=PostCategoryResponse)
 async def get_post_category(
     uuid: UUID, crud: PostCategoryCRUD = Depends(CRUDProvider.get_post_category_crud)
 ):
@@ -42,6 +67,7 @@ async def get_post_category(
     "/",
     dependencies=[Depends(AuthenticationRequired)],
     status_code=status.HTTP_201_CREATED,
+    response_model=PostCategoryResponse,
 )
 async def create_post_category(
     data: CreatePostCategoryRequest,
@@ -50,20 +76,30 @@ async def create_post_category(
     return await crud.create_post_category(data.model_dump())
 
 
-@router.patch("/{uuid}", dependencies=[Depends(AuthenticationRequired)])
+@router.patch(
+    "/{uuid}",
+    dependencies=[Depends(AuthenticationRequired)],
+    response_model=MessageResponse,
+)
 async def update_post_category(
     uuid: UUID,
     data: UpdatePostCategoryRequest,
     crud: PostCategoryCRUD = Depends(CRUDProvider.get_post_category_crud),
 ):
-    return await crud.update_post_category(
+    await crud.update_post_category(
         data.model_dump(exclude_none=True),
         post_category_uuid=uuid,
     )
+    return {"message": "Post category updated successfully."}
 
 
-@router.delete("/{uuid}", dependencies=[Depends(AuthenticationRequired)])
+@router.delete(
+    "/{uuid}",
+    dependencies=[Depends(AuthenticationRequired)],
+    response_model=MessageResponse,
+)
 async def delete_post_category(
     uuid: UUID, crud: PostCategoryCRUD = Depends(CRUDProvider.get_post_category_crud)
 ):
-    return await crud.delete_post_category(uuid)
+    await crud.delete_post_category(uuid)
+    return {"message": "Post category deleted successfully."}
@@ -1,30 +1,117 @@
+from datetime import datetime
+from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 
-from app.crud.post import PostCRUD
+from app.crud.post import POST_FIELDS, PostCRUD
+from app.crud.post_import import PostImporter, iter_lines
 from app.dependencies import (AuthenticationRequired, CRUDProvider,
                               get_current_user)
 from app.models import User
+from app.schemas.partial import dump_json, dump_ndjson, partial_model
 from app.schemas.post import (PostCreateRequest, PostCreateResponse,
-                              PostPartialUpdateRequest, PostUpdateRequest)
+                              PostDetail, PostImportResponse,
+                              PostMultipleCreateRequest,
+                              PostMultipleCreateResponse,
+                              PostMultipleDeleteRequest,
+                              PostPartialUpdateRequest, PostRead,
+                              PostSearchResult, PostStatus, PostSummary,
+                              PostUpdateRequest)
+from app.utils import response_cache
 
 router = APIRouter()
 
 
-@router.get("/")
+@router.get("/", response_model=List[PostSummary])
 async def get_posts(
+    request: Request,
     skip: int = 0,
     limit: int = 100,
+    sort: str | None = None,
+    cursor: str | None = None,
+    fields: str | None = None,
     crud: PostCRUD = Depends(CRUDProvider.get_post_curd),
 ):
-    posts = await crud.get_all_posts(skip=skip, limit=limit)
-    return posts
-
-
-@router.get("/{uuid}")
-async def get_post(uuid: UUID, crud: PostCRUD = Depends(CRUDProvider.get_post_curd)):
-    return await crud.get_post_by_uuid(uuid)
+    fields = crud.parse_fields(fields)
+
+    def headers(posts):
+        next_cursor = crud.next_cursor(posts, limit, sort)
+        return {"X-Next-Cursor": next_cursor} if next_cursor else {}
+
+    return await response_cache.respond(
+        request,
+        "posts",
+        lambda: crud.get_all_posts(
+            skip=skip, limit=limit, sort=sort, cursor=cursor, fields=fields
+        ),
+        headers=headers,
+        response_model=List[partial_model(PostRead, fields)]
+        if fields
+        else List[PostSummary],
+    )
+
+
+@router.get("/search", response_model=List[PostSearchResult])
+async def search_posts(
+    q: str = Query(..., min_length=1, max_length=256),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
+    crud: PostCRUD = Depends(CRUDProvider.get_post_curd),
+):
+    rows = await crud.search_posts(q, limit=limit, cursor=cursor)
+    next_cursor = crud.next_search_cursor(rows, limit)
+    return Response(
+        content=dump_json(
+            [
+                {"post": row.Post, "rank": row.rank, "snippet": row.snippet}
+                for row in rows
+            ],
+            List[PostSearchResult],
+        ),
+        media_type="application/json",
+        headers={"X-Next-Cursor": next_cursor} if next_cursor else None,
+    )
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_posts(
+    post_status: PostStatus | None = Query(None, alias="status"),
+    updated_since: datetime | None = None,
+    crud: PostCRUD = Depends(CRUDProvider.get_post_curd),
+):
+    model = partial_model(PostRead, POST_FIELDS)
+
+    async def lines():
+        # Dependencies with `yield` exit before a streamed body is sent, so the stream
+        # checks out its own connection on the session and closes it once done.
+        async with crud.session:
+            result = await crud.stream_posts(
+                status=post_status, updated_since=updated_since
+            )
+            async for rows in result.partitions():
+                yield dump_ndjson(rows, model)
+
+    return StreamingResponse(
+        lines(),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="posts.ndjson"'},
+    )
+
+
+@router.get("/{uuid}", response_model=PostDetail)
+async def get_post(
+    request: Request,
+    uuid: UUID,
+    crud: PostCRUD = Depends(CRUDProvider.get_post_curd),
+):
+    return await response_cache.respond(
+        request,
+        "posts",
+        lambda: crud.get_post_detail(uuid),
+        response_model=PostDetail,
+    )
 
 
 @router.post(
@@ -45,6 +132,44 @@ async def create_post(
     return {"message": "Post created successfully.", "post": post}
 
 
+@router.post(
+    "/create/multiple",
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(AuthenticationRequired)],
+    response_model=PostMultipleCreateResponse,
+)
+async def create_multiple_posts(
+    data: PostMultipleCreateRequest,
+    crud: PostCRUD = Depends(CRUDProvider.get_post_curd),
+    current_user: User = Depends(get_current_user),
+):
+    posts_data = [
+        {
+            **post.model_dump(),
+            "created_by": current_user.uuid,
+            "updated_by": current_user.uuid,
+        }
+        for post in data.posts
+    ]
+    posts = await crud.create_multiple_posts(posts_data)
+
+    return {"message": "Posts created successfully.", "posts": posts}
+
+
+@router.post(
+    "/import",
+    dependencies=[Depends(AuthenticationRequired)],
+    response_model=PostImportResponse,
+)
+async def import_posts(
+    request: Request,
+    crud: PostCRUD = Depends(CRUDProvider.get_post_curd),
+    current_user: User = Depends(get_current_user),
+):
+    importer = PostImporter(crud.session, author=current_user.uuid)
+    return await importer.run(iter_lines(request.stream()))
+
+
 @router.put(
     "/{uuid}",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -82,9 +207,12 @@ async def partial_update_post(
     status_code=status.HTTP_204_NO_CONTENT,
     dependencies=[Depends(AuthenticationRequired)],
 )
-async def delete_post(uuid: UUID, crud: PostCRUD = Depends(CRUDProvider.get_post_curd)):
-    # TODO: Make it soft delete, right now, it will be hard deleted
-    await crud.delete_post(uuid)
+async def delete_post(
+    uuid: UUID,
+    current_user: User = Depends(get_current_user),
+    crud: PostCRUD = Depends(CRUDProvider.get_post_curd),
+):
+    await crud.delete_post(uuid, user_uuid=current_user.uuid)
 
 
 @router.post(
@@ -92,5 +220,9 @@ async def delete_post(uuid: UUID, crud: PostCRUD = Depends(CRUDProvider.get_post
     status_code=status.HTTP_204_NO_CONTENT,
     dependencies=[Depends(AuthenticationRequired)],
 )
-async def delete_multiple_post():
-    pass
+async def delete_multiple_post(
+    data: PostMultipleDeleteRequest,
+    current_user: User = Depends(get_current_user),
+    crud: PostCRUD = Depends(CRUDProvider.get_post_curd),
+):
+    await crud.delete_multiple_posts(data.uuids, user_uuid=current_user.uuid)
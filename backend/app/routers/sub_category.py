@@ -1,31 +1,50 @@
+from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, status
 
 from app.crud.sub_category import SubCategoryCRUD
 from app.dependencies import (AuthenticationRequired, CRUDProvider,
                               get_current_user)
 from app.models import User
 from app.schemas.sub_category import (CreateSubCategoryRequest,
+                                      SubCategoryDetailResponse,
+                                      SubCategoryRead,
                                       UpdateSubCategoryRequest)
+from app.utils import response_cache
 
 router = APIRouter()
 
 
-@router.get("/")
+@router.get("/", response_model=List[SubCategoryRead])
 async def get_sub_categories(
+    request: Request,
     skip: int = 0,
     limit: int = 100,
+    sort: str | None = None,
+    cursor: str | None = None,
     crud: SubCategoryCRUD = Depends(CRUDProvider.get_sub_category_crud),
 ):
-    return await crud.get_all_sub_categories(skip=skip, limit=limit)
+    def headers(sub_categories):
+        next_cursor = crud.next_cursor(sub_categories, limit, sort)
+        return {"X-Next-Cursor": next_cursor} if next_cursor else {}
+
+    return await response_cache.respond(
+        request,
+        "sub_categories",
+        lambda: crud.get_all_sub_categories(
+            skip=skip, limit=limit, sort=sort, cursor=cursor
+        ),
+        headers=headers,
+        response_model=List[SubCategoryRead],
+    )
 
 
-@router.get("/{uuid}")
+@router.get("/{uuid}", response_model=SubCategoryDetailResponse)
 async def get_sub_category(
     uuid: UUID, crud: SubCategoryCRUD = Depends(CRUDProvider.get_sub_category_crud)
 ):
-    sub_category = await crud.get_sub_category_by_uuid(uuid)
+    sub_category = await crud.get_cached_sub_category(uuid)
     return {"message": "ok", "sub_category": sub_category}
 
 
@@ -33,6 +52,7 @@ async def get_sub_category(
     "/",
     status_code=status.HTTP_201_CREATED,
     dependencies=[Depends(AuthenticationRequired)],
+    response_model=SubCategoryDetailResponse,
 )
 async def create_sub_category(
     data: CreateSubCategoryRequest,
@@ -67,6 +87,8 @@ async def update_sub_category(
     dependencies=[Depends(AuthenticationRequired)],
 )
 async def delete_sub_category(
-    uuid: UUID, crud: SubCategoryCRUD = Depends(CRUDProvider.get_sub_category_crud)
+    uuid: UUID,
+    current_user: User = Depends(get_current_user),
+    crud: SubCategoryCRUD = Depends(CRUDProvider.get_sub_category_crud),
 ):
-    await crud.delete_sub_category(uuid)
+    await crud.delete_sub_category(uuid, user_uuid=current_user.uuid)
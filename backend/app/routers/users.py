@@ -1,15 +1,18 @@
 from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
 from fastapi.responses import JSONResponse
 
 from app.crud import UserCRUD
 from app.dependencies import AuthenticationRequired, CRUDProvider, current_user
 from app.exceptions import BadRequestException
 from app.models import User
+from app.schemas.message import MessageResponse
+from app.schemas.partial import dump_json, partial_model
 from app.schemas.user import (PartialUpdateUserRequest, UpdateUserRequest,
-                              UserResponse)
+                              UserDetailResponse, UserResponse,
+                              UserUpdateResponse)
 
 router = APIRouter(dependencies=[Depends(AuthenticationRequired)])
 
@@ -18,24 +21,37 @@ router = APIRouter(dependencies=[Depends(AuthenticationRequired)])
 async def get_all_users(
     skip: int = 0,
     limit: int = 100,
+    sort: str | None = None,
+    cursor: str | None = None,
+    fields: str | None = None,
     user_crud: UserCRUD = Depends(CRUDProvider.get_user_crud),
 ):
-    return await user_crud.get_all_users()
+    fields = user_crud.parse_fields(fields)
+    users = await user_crud.get_all_users(
+        skip=skip, limit=limit, sort=sort, cursor=cursor, fields=fields
+    )
+    next_cursor = user_crud.next_cursor(users, limit, sort)
+    model = partial_model(UserResponse, fields) if fields else UserResponse
+    return Response(
+        content=dump_json(users, List[model]),
+        media_type="application/json",
+        headers={"X-Next-Cursor": next_cursor} if next_cursor else None,
+    )
 
 
-@router.get("/user-profile", status_code=status.HTTP_200_OK)
+@router.get(
+    "/user-profile", status_code=status.HTTP_200_OK, response_model=UserDetailResponse
+)
 async def get_current_user(current_user: User = Depends(current_user.get_current_user)):
-    # TODO: Add the scheme for detail user response
     return current_user
 
 
-@router.get("/{uuid}")
+@router.get("/{uuid}", response_model=UserDetailResponse)
 async def get_user(
     uuid: UUID, user_crud: UserCRUD = Depends(CRUDProvider.get_user_crud)
 ):
     user = await user_crud.get_by_uuid(uuid)
     if user:
-        # TODO: added the details user-response
         return user
     else:
         return JSONResponse(
@@ -46,9 +62,7 @@ async def get_user(
         )
 
 
-@router.put(
-    "/{uuid}",
-)
+@router.put("/{uuid}", response_model=UserUpdateResponse)
 async def update_user_profile(
     uuid: UUID,
     data: UpdateUserRequest,
@@ -69,7 +83,7 @@ async def update_user_profile(
     raise BadRequestException("Error in updating user")
 
 
-@router.patch("/{uuid}")
+@router.patch("/{uuid}", response_model=UserUpdateResponse)
 async def partial_update_user_profile(
     uuid: UUID,
     data: PartialUpdateUserRequest,
@@ -90,11 +104,13 @@ async def partial_update_user_profile(
     raise BadRequestException("Error in updating user")
 
 
-@router.delete("/{uuid}")
+@router.delete("/{uuid}", response_model=MessageResponse)
 async def delete_user(
-    uuid: UUID, user_crud: UserCRUD = Depends(CRUDProvider.get_user_crud)
+    uuid: UUID,
+    user: User = Depends(current_user.get_current_user),
+    user_crud: UserCRUD = Depends(CRUDProvider.get_user_crud),
 ):
-    await user_crud.delete_user(uuid)
+    await user_crud.delete_user(uuid, deleted_by=user.uuid)
     # TODO: Added the message in the response content
     return JSONResponse(
         status_code=status.HTTP_200_OK,
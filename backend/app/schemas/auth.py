@@ -1,5 +1,6 @@
 from pydantic import BaseModel, EmailStr, Field
 
+from .message import MessageResponse
 from .token import Token
 from .user import UserResponse
 
@@ -31,3 +32,7 @@ class ResetPasswordRequest(BaseModel):
 class AuthResponse(BaseModel):
     token: Token
     user: UserResponse
+
+
+class LogoutResponse(MessageResponse):
+    data: LogoutUserRequest
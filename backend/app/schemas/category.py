@@ -1,7 +1,11 @@
+from datetime import datetime
+from typing import List
 from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from app.schemas.sub_category import SubCategoryResponse
+
 
 class CategoryBase(BaseModel):
     name: str = Field(..., title="The name of the category")
@@ -18,5 +22,18 @@ class CategoryResponse(CategoryBase):
         form_attributes = True
 
 
+class CategoryRead(CategoryResponse):
+    created_by: UUID | None = Field(None, description="UUID of the creator")
+    updated_by: UUID | None = Field(None, description="UUID of the last editor")
+    created_at: datetime
+    updated_at: datetime
+
+
 class UpdateCategoryRequest(CategoryBase):
     pass
+
+
+class CategoryTreeResponse(CategoryResponse):
+    sub_categories: List[SubCategoryResponse] = Field(
+        default_factory=list, description="The sub categories of the category"
+    )
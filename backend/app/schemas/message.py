@@ -0,0 +1,5 @@
+from pydantic import BaseModel, Field
+
+
+class MessageResponse(BaseModel):
+    message: str = Field(..., examples=["OK"])
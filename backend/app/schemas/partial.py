@@ -0,0 +1,66 @@
+import functools
+from typing import Any, Iterable, Tuple, Type
+
+from pydantic import BaseModel, ConfigDict, TypeAdapter, create_model
+
+
+@functools.lru_cache(maxsize=256)
+def partial_model(model: Type[BaseModel], fields: Tuple[str, ...]) -> Type[BaseModel]:
+    """
+    Builds a response model with only some of the fields of `model`, for sparse fieldsets.
+
+    Models are cached, so every distinct fieldset is only built once.
+
+    Args:
+        model (Type[BaseModel]): The full response model.
+        fields (Tuple[str, ...]): The names of the fields to keep, all must exist on `model`.
+
+    Returns:
+        Type[BaseModel]: The partial model, validated from attributes like `model`.
+    """
+    return create_model(
+        f"Partial{model.__name__}",
+        __config__=ConfigDict(from_attributes=True),
+        **{
+            name: (model.model_fields[name].annotation, model.model_fields[name])
+            for name in fields
+        },
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def type_adapter(response_model: Any) -> TypeAdapter:
+    return TypeAdapter(response_model)
+
+
+def dump_json(data: Any, response_model: Any) -> bytes:
+    """
+    Serializes `data`, e.g. ORM records, to JSON through `response_model`.
+
+    Args:
+        data (Any): The data to serialize.
+        response_model (Any): The type to serialize the data as, e.g. `List[PostSummary]`.
+
+    Returns:
+        bytes: The JSON document.
+    """
+    adapter = type_adapter(response_model)
+    return adapter.dump_json(adapter.validate_python(data, from_attributes=True))
+
+
+def dump_ndjson(rows: Iterable[Any], model: Any) -> bytes:
+    """
+    Serializes `rows` as newline delimited JSON, one `model` document per line.
+
+    Args:
+        rows (Iterable[Any]): The rows to serialize, e.g. ORM records or row mappings.
+        model (Any): The type each row is serialized as.
+
+    Returns:
+        bytes: The NDJSON lines, each ending with a newline.
+    """
+    adapter = type_adapter(model)
+    return b"".join(
+        adapter.dump_json(adapter.validate_python(row, from_attributes=True)) + b"\n"
+        for row in rows
+    )
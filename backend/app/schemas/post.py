@@ -1,7 +1,13 @@
+from datetime import datetime
 from enum import StrEnum
+from typing import List
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.schemas.category import CategoryRead
+from app.schemas.post_category import PostCategoryResponse
+from app.schemas.sub_category import SubCategoryRead
 
 
 class PostStatus(StrEnum):
@@ -42,9 +48,103 @@ class PostResponse(PostBase):
         form_attributes = True
 
 
+class PostAuthor(BaseModel):
+    uuid: UUID = Field(..., description="User UUID")
+    username: str = Field(..., description="User username", examples=["john.doe"])
+    profile_image: str | None = Field(None, description="User profile image URL")
+
+    class Config:
+        from_attributes = True
+
+
+class PostSummary(BaseModel):
+    uuid: UUID = Field(..., description="Post UUID")
+    title: str = Field(..., examples=["Title of the post"])
+    status: PostStatus
+    excerpt: str | None = Field(None, description="The beginning of the post body")
+    created_by: UUID | None = Field(None, description="UUID of the author")
+    author: PostAuthor | None = None
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class PostRead(PostSummary):
+    body: str
+    updated_by: UUID | None = Field(None, description="UUID of the last editor")
+
+
+class SubCategoryDetail(SubCategoryRead):
+    category: CategoryRead | None = None
+
+
+class PostCategoryDetail(PostCategoryResponse):
+    sub_categories: SubCategoryDetail | None = Field(
+        None, description="The sub-category, with its category"
+    )
+
+
+class PostDetail(PostRead):
+    post_categories: List[PostCategoryDetail] = Field(default_factory=list)
+
+
 class PostCreateResponse(BaseModel):
     message: str = Field(default="Post created successfully.")
     post: PostResponse
 
     class Config:
         form_attributes = True
+
+
+class PostMultipleCreateRequest(BaseModel):
+    posts: List[PostCreateRequest] = Field(..., min_length=1, max_length=1000)
+
+
+class PostMultipleCreateResponse(BaseModel):
+    message: str = Field(default="Posts created successfully.")
+    posts: List[PostResponse]
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class PostMultipleDeleteRequest(BaseModel):
+    uuids: List[UUID] = Field(
+        ..., min_length=1, max_length=1000, description="UUIDs of the posts to delete"
+    )
+
+
+class PostSearchResult(BaseModel):
+    post: PostSummary
+    rank: float = Field(..., description="Relevance of the post to the query")
+    snippet: str = Field(
+        ..., description="Excerpt of the body with the matches wrapped in <mark>"
+    )
+
+
+class PostImportCategory(BaseModel):
+    category: str | None = Field(None, examples=["Programming"], max_length=128)
+    sub_category: str | None = Field(None, examples=["Python"], max_length=128)
+
+
+class PostImportRow(PostBase):
+    uuid: UUID | None = Field(
+        None, description="Post UUID, rows whose UUID already exists are skipped"
+    )
+    categories: List[PostImportCategory] = Field(
+        default_factory=list, description="Categories and sub-categories, by name"
+    )
+
+
+class PostImportError(BaseModel):
+    line: int = Field(..., description="Line number in the NDJSON input, from 1")
+    message: str
+
+
+class PostImportResponse(BaseModel):
+    imported: int = Field(..., description="Number of posts created")
+    skipped: int = Field(..., description="Number of posts whose UUID already existed")
+    failed: int = Field(..., description="Number of rows rejected")
+    errors: List[PostImportError] = Field(
+        ..., description="The rejected and skipped rows, up to `IMPORT_MAX_ERRORS`"
+    )
@@ -14,3 +14,13 @@ class UpdatePostCategoryRequest(BaseModel):
     post_uuid: UUID | None = Field(None, decsription="Post UUID")
     category_uuid: UUID | None = Field(None, description="Category UUID")
     sub_category_uuid: UUID | None = Field(None, description="SubCategory UUID")
+
+
+class PostCategoryResponse(BaseModel):
+    uuid: UUID = Field(..., description="Post category UUID")
+    post_uuid: UUID = Field(..., description="Post UUID")
+    category_uuid: UUID | None = Field(None, description="Category UUID")
+    sub_category_uuid: UUID | None = Field(None, description="SubCategory UUID")
+
+    class Config:
+        from_attributes = True
@@ -1,3 +1,4 @@
+from datetime import datetime
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -26,3 +27,15 @@ class SubCategoryResponse(SubCategoryBase):
 
     class Config:
         form_attributes = True
+
+
+class SubCategoryRead(SubCategoryResponse):
+    created_by: UUID | None = Field(None, description="UUID of the creator")
+    updated_by: UUID | None = Field(None, description="UUID of the last editor")
+    created_at: datetime
+    updated_at: datetime
+
+
+class SubCategoryDetailResponse(BaseModel):
+    message: str = Field(default="ok")
+    sub_category: SubCategoryRead
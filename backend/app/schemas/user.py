@@ -1,13 +1,21 @@
+from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, Field
+
+from .message import MessageResponse
 
 
 class UserResponse(BaseModel):
     uuid: UUID = Field(..., description="User UUID")
     username: str = Field(..., description="User username", examples=["john.doe"])
-    email: EmailStr = Field(
-        ..., description="User email address", examples=["john.doe@example.com"]
+    # Emails are validated when users register, validating them again on every response
+    # with `EmailStr` costs more than the rest of the serialization.
+    email: str = Field(
+        ...,
+        description="User email address",
+        examples=["john.doe@example.com"],
+        json_schema_extra={"format": "email"},
     )
     profile_image: str | None = Field(None, description="User profile image URL")
 
@@ -15,6 +23,18 @@ class UserResponse(BaseModel):
         from_attributes = True
 
 
+class UserDetailResponse(UserResponse):
+    full_name: str | None = Field(None, description="User full name")
+    bio: str | None = Field(None, description="User bio")
+    last_login: datetime | None = Field(None, description="Last login time")
+    created_at: datetime
+    updated_at: datetime
+
+
+class UserUpdateResponse(MessageResponse):
+    api: str = Field(..., description="URL of the updated user")
+
+
 class CurrentUser(BaseModel):
     uuid: UUID | None = Field(None, description="Currently logged user's uuid")
 
@@ -1,36 +1,53 @@
+import logging
+from contextlib import asynccontextmanager
 from http import HTTPStatus
 from typing import List
 
 from fastapi import FastAPI, Request
 from fastapi.middleware import Middleware
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
+from app.crud.taxonomy import taxonomy_cache
+from app.database.session import async_session_maker
 from app.exceptions import CustomException
-from app.middlewares import AuthBackend, AuthenticationMiddleware
+from app.middlewares import (AuthBackend, AuthenticationMiddleware,
+                             CompressionMiddleware, MetricsMiddleware,
+                             QueryStatsMiddleware)
 from app.routers import router
+from app.utils.metrics import Counter
+
+logger = logging.getLogger(__name__)
+
+errors_total = Counter(
+    "app_errors_total",
+    "Errors returned to clients, by exception class.",
+    labelnames=("exception",),
+)
 
 
 def on_auth_error(request: Request, exc: Exception):
+    errors_total.inc(type(exc).__name__)
     status_code, error_code, message = HTTPStatus.UNAUTHORIZED, None, str(exc)
     if isinstance(exc, CustomException):
         status_code = int(exc.code)
         error_code = exc.error_code
         message = exc.message
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status_code, content={"message": message, "error_code": error_code}
     )
 
 
 async def exception_handler(request: Request, exc: Exception | CustomException):
+    errors_total.inc(type(exc).__name__)
     try:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=exc.code,
             content={"error_code": exc.error_code, "message": exc.message or str(exc)},
         )
     except:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=400, content={"error_code": 400, "message": str(exc)}
         )
 
@@ -46,6 +63,9 @@ def init_listeners(app_: FastAPI) -> None:
 
 def make_middleware() -> List[Middleware]:
     middleware = [
+        Middleware(MetricsMiddleware),
+        Middleware(CompressionMiddleware),
+        Middleware(QueryStatsMiddleware),
         Middleware(
             CORSMiddleware,
             allow_origins=["*"],
@@ -60,12 +80,26 @@ def make_middleware() -> List[Middleware]:
     return middleware
 
 
+@asynccontextmanager
+async def lifespan(app_: FastAPI):
+    try:
+        async with async_session_maker() as session:
+            await taxonomy_cache.load(session)
+    except Exception:
+        logger.warning(
+            "Taxonomy not preloaded, it is loaded on first use.", exc_info=True
+        )
+    yield
+
+
 def create_app() -> FastAPI:
     app_ = FastAPI(
         title="Byte Blog",
         description="Byte Blog is a simple blogging platform to share and read blog posts.",
         version="1.0.0",
         middleware=make_middleware(),
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
     init_router(app_)
     init_listeners(app_)
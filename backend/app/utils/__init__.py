@@ -1,4 +1,22 @@
+from .cache import TTLCache
+from .cursor_handler import CursorHandler
+from .dataloader import DataLoader
 from .jwt_handler import JWTHandler
 from .password_handler import PasswordHandler
+from .password_hashing_pool import PasswordHashingPool, password_hashing_pool
+from .response_cache import (MemoryResponseCacheBackend, ResponseCache,
+                             ResponseCacheBackend, response_cache)
 
-__all__ = ["JWTHandler", "PasswordHandler"]
+__all__ = [
+    "CursorHandler",
+    "DataLoader",
+    "JWTHandler",
+    "PasswordHandler",
+    "PasswordHashingPool",
+    "password_hashing_pool",
+    "MemoryResponseCacheBackend",
+    "ResponseCache",
+    "ResponseCacheBackend",
+    "response_cache",
+    "TTLCache",
+]
@@ -0,0 +1,93 @@
+import time
+from collections import OrderedDict
+from typing import Dict, Generic, Hashable, Tuple, TypeVar
+
+KeyType = TypeVar("KeyType", bound=Hashable)
+ValueType = TypeVar("ValueType")
+
+
+class TTLCache(Generic[KeyType, ValueType]):
+    """
+    A bounded, in-process LRU cache whose entries expire after a time-to-live.
+
+    Entries expire after `ttl` seconds, or earlier when a shorter ttl is given on `set`.
+    When the cache is full the least recently used entry is evicted. Hits and misses are
+    counted so the cache can be monitored.
+
+    Attributes:
+        maxsize (int): The maximum number of entries kept.
+        ttl (float): The default and maximum time-to-live of an entry, in seconds.
+        hits (int): The number of lookups served from the cache.
+        misses (int): The number of lookups that found no live entry.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[KeyType, Tuple[float, ValueType]] = OrderedDict()
+
+    def get(self, key: KeyType) -> ValueType | None:
+        """
+        Returns the live value stored for `key`, or `None`.
+
+        Args:
+            key (KeyType): The key to look up.
+
+        Returns:
+            ValueType | None: The cached value, or `None` if it is missing or expired.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    def set(self, key: KeyType, value: ValueType, ttl: float | None = None) -> None:
+        """
+        Stores `value` for `key`.
+
+        Args:
+            key (KeyType): The key to store the value under.
+            value (ValueType): The value to store.
+            ttl (float, optional): The time-to-live in seconds, capped at the cache `ttl`.
+                Entries with a non-positive ttl are not stored. Defaults to the cache `ttl`.
+        """
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: KeyType) -> None:
+        """Removes the entry stored for `key`, if any."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Removes every entry, the hit and miss counters are kept."""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns a snapshot of the cache metrics.
+
+        Returns:
+            Dict[str, int]: The current size, the maximum size, and the hit and miss counters.
+        """
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
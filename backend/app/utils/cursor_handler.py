@@ -0,0 +1,63 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, List
+from uuid import UUID
+
+from app.exceptions import BadRequestException
+
+
+class CursorHandler:
+    """
+    A utility class for encoding and decoding keyset pagination cursors.
+
+    A cursor is an opaque, URL-safe token holding the values of the ordering columns
+    of the last record of a page. Clients pass it back unchanged to fetch the next page.
+    """
+
+    @classmethod
+    def encode(cls, values: List[Any]) -> str:
+        """
+        Encodes the ordering values of a record into an opaque cursor.
+
+        Args:
+            values (List[Any]): The values of the ordering columns, e.g. `[created_at, uuid]`.
+
+        Returns:
+            str: The URL-safe cursor token.
+        """
+        raw = json.dumps([cls._serialize(value) for value in values])
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, cursor: str) -> List[Any]:
+        """
+        Decodes a cursor back into its list of raw (JSON) ordering values.
+
+        Args:
+            cursor (str): The cursor token received from the client.
+
+        Returns:
+            List[Any]: The decoded ordering values.
+
+        Raises:
+            BadRequestException: If the cursor is malformed.
+        """
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        except (binascii.Error, ValueError):
+            raise BadRequestException("Invalid pagination cursor.")
+
+        if not isinstance(values, list):
+            raise BadRequestException("Invalid pagination cursor.")
+        return values
+
+    @staticmethod
+    def _serialize(value: Any) -> Any:
+        if isinstance(value, datetime):
+            return value.isoformat()
+        if isinstance(value, UUID):
+            return str(value)
+        return value
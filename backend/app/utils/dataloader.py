@@ -0,0 +1,101 @@
+import asyncio
+from typing import (Awaitable, Callable, Dict, Generic, Hashable, Iterable,
+                    List, Sequence, Set, TypeVar)
+
+KeyType = TypeVar("KeyType", bound=Hashable)
+ValueType = TypeVar("ValueType")
+
+
+class DataLoader(Generic[KeyType, ValueType]):
+    """
+    Coalesces the lookups made during one event loop tick into a single batched load.
+
+    `load` only queues the key and returns a future, the queued keys are loaded together by
+    `batch_load` once the current tick is over, so lookups issued together (e.g. with
+    `load_many` or `asyncio.gather`) cost one query instead of one per key. Results are
+    memoized per key, a loader is meant to live as long as a request.
+
+    Attributes:
+        batch_load (Callable[[List[KeyType]], Awaitable[Sequence[ValueType]]]): Loads the values of
+            a list of keys, returning them in the same order as the keys.
+        max_batch_size (int | None): The maximum number of keys loaded at once, `None` for no limit.
+        batches (int): How many batches were loaded so far.
+    """
+
+    def __init__(
+        self,
+        batch_load: Callable[[List[KeyType]], Awaitable[Sequence[ValueType]]],
+        max_batch_size: int | None = None,
+    ) -> None:
+        self.batch_load = batch_load
+        self.max_batch_size = max_batch_size
+        self.batches = 0
+        self._futures: Dict[KeyType, asyncio.Future] = {}
+        self._queue: List[KeyType] = []
+        self._tasks: Set[asyncio.Task] = set()
+
+    def load(self, key: KeyType) -> Awaitable[ValueType]:
+        """
+        Queues `key` for the next batch.
+
+        Args:
+            key (KeyType): The key to load.
+
+        Returns:
+            Awaitable[ValueType]: Resolves to the value of `key`, shared by every load of the same key.
+        """
+        future = self._futures.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._futures[key] = future
+            self._queue.append(key)
+            if len(self._queue) == 1:
+                loop.call_soon(self._dispatch)
+        return future
+
+    async def load_many(self, keys: Iterable[KeyType]) -> List[ValueType]:
+        """
+        Loads several keys in the same batch.
+
+        Args:
+            keys (Iterable[KeyType]): The keys to load.
+
+        Returns:
+            List[ValueType]: The values, in the same order as the keys.
+        """
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def clear(self) -> None:
+        """Forgets the memoized values, the next loads query them again."""
+        self._futures = {
+            key: future for key, future in self._futures.items() if not future.done()
+        }
+
+    def _dispatch(self) -> None:
+        queue, self._queue = self._queue, []
+        size = self.max_batch_size or len(queue)
+        for start in range(0, len(queue), size):
+            task = asyncio.ensure_future(self._load_batch(queue[start : start + size]))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _load_batch(self, keys: List[KeyType]) -> None:
+        self.batches += 1
+        try:
+            values = await self.batch_load(keys)
+            if len(values) != len(keys):
+                raise ValueError(
+                    f"The batch load returned {len(values)} values for {len(keys)} keys."
+                )
+        except Exception as e:
+            for key in keys:
+                future = self._futures.pop(key)
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for key, value in zip(keys, values):
+            future = self._futures[key]
+            if not future.done():
+                future.set_result(value)
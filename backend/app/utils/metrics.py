@@ -0,0 +1,254 @@
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterator, List, Sequence, Tuple
+
+DEFAULT_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LabelValues = Tuple[str, ...]
+Sample = Tuple[str, Dict[str, str], float]
+
+registry: List["Metric"] = []
+caches: Dict[str, Any] = {}
+
+
+class Metric:
+    """
+    A metric kept in process, each worker exposes its own values.
+
+    Values are plain numbers in a dict keyed by label values, updating one is a dict lookup
+    and an addition, cheap enough for the hot path. Metrics whose value already exists
+    elsewhere, e.g. pool or cache statistics, take a `callback` read at scrape time instead.
+
+    Attributes:
+        name (str): The metric name, e.g. `http_requests_total`.
+        documentation (str): What the metric measures.
+        labelnames (Tuple[str, ...]): The names of the labels, in the order values are given.
+        callback (Callable[[], Dict[LabelValues, float]] | None): Returns the current values by
+            label values, used instead of the values set on the metric.
+    """
+
+    type = "untyped"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        callback: Callable[[], Dict[LabelValues, float]] | None = None,
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.callback = callback
+        self._values: Dict[LabelValues, float] = {}
+        registry.append(self)
+
+    def samples(self) -> Iterator[Sample]:
+        """
+        Yields the samples of the metric.
+
+        Yields:
+            Sample: The sample name, its labels and its value.
+        """
+        values = self.callback() if self.callback else self._values
+        for labelvalues, value in values.items():
+            yield self.name, dict(zip(self.labelnames, labelvalues)), value
+
+    def clear(self) -> None:
+        """Drops every value."""
+        self._values.clear()
+
+
+class Counter(Metric):
+    """A value that only goes up, e.g. a number of requests."""
+
+    type = "counter"
+
+    def inc(self, *labelvalues: str, amount: float = 1) -> None:
+        """
+        Increments the counter.
+
+        Args:
+            *labelvalues (str): The value of each label, in the order of `labelnames`.
+            amount (float, optional): The increment. Defaults to 1.
+        """
+        self._values[labelvalues] = self._values.get(labelvalues, 0) + amount
+
+
+class Gauge(Metric):
+    """A value that goes up and down, e.g. a number of requests in flight."""
+
+    type = "gauge"
+
+    def set(self, value: float, *labelvalues: str) -> None:
+        """
+        Sets the gauge.
+
+        Args:
+            value (float): The new value.
+            *labelvalues (str): The value of each label, in the order of `labelnames`.
+        """
+        self._values[labelvalues] = value
+
+    def inc(self, *labelvalues: str, amount: float = 1) -> None:
+        """Increments the gauge by `amount`."""
+        self._values[labelvalues] = self._values.get(labelvalues, 0) + amount
+
+    def dec(self, *labelvalues: str, amount: float = 1) -> None:
+        """Decrements the gauge by `amount`."""
+        self._values[labelvalues] = self._values.get(labelvalues, 0) - amount
+
+
+class Histogram(Metric):
+    """
+    Counts observations in cumulative buckets, per combination of label values.
+
+    Observing is a bisect and three increments, so it is cheap enough for every query
+    and every request.
+
+    Attributes:
+        buckets (Tuple[float, ...]): The upper bounds of the buckets, ascending.
+    """
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        """
+        Records one observation.
+
+        Args:
+            value (float): The observed value, e.g. a duration in seconds.
+            *labelvalues (str): The value of each label, in the order of `labelnames`.
+        """
+        series = self._series.get(labelvalues)
+        if series is None:
+            # One counter per bucket, then `+Inf`, the sum and the count.
+            series = self._series[labelvalues] = [0] * (len(self.buckets) + 3)
+        series[bisect_left(self.buckets, value)] += 1
+        series[-2] += value
+        series[-1] += 1
+
+    def snapshot(self) -> Dict[LabelValues, Dict[str, object]]:
+        """
+        Returns the current state of every series.
+
+        Returns:
+            Dict[LabelValues, Dict[str, object]]: By label values, the cumulative `buckets`
+            as `(upper bound, count)` pairs ending with `+Inf`, the `sum` and the `count`.
+        """
+        snapshot = {}
+        for labelvalues, series in self._series.items():
+            cumulative, buckets = 0, []
+            for bound, count in zip((*self.buckets, float("inf")), series[:-2]):
+                cumulative += count
+                buckets.append((bound, cumulative))
+            snapshot[labelvalues] = {
+                "buckets": buckets,
+                "sum": series[-2],
+                "count": series[-1],
+            }
+        return snapshot
+
+    def samples(self) -> Iterator[Sample]:
+        for labelvalues, series in self.snapshot().items():
+            labels = dict(zip(self.labelnames, labelvalues))
+            for bound, count in series["buckets"]:
+                yield f"{self.name}_bucket", {**labels, "le": _format(bound)}, count
+            yield f"{self.name}_sum", labels, series["sum"]
+            yield f"{self.name}_count", labels, series["count"]
+
+    def clear(self) -> None:
+        """Drops every series."""
+        self._series.clear()
+
+
+def register_cache(name: str, cache: Any) -> None:
+    """
+    Exposes the hit, miss and size statistics of a cache, e.g. a `TTLCache`.
+
+    Args:
+        name (str): The value of the `cache` label.
+        cache (Any): The cache, its `stats()` must return `hits`, `misses` and `size`.
+    """
+    caches[name] = cache
+
+
+def _cache_stat(stat: str) -> Callable[[], Dict[LabelValues, float]]:
+    return lambda: {(name,): cache.stats()[stat] for name, cache in caches.items()}
+
+
+cache_hits = Counter(
+    "cache_hits_total",
+    "Lookups served from an in-process cache.",
+    labelnames=("cache",),
+    callback=_cache_stat("hits"),
+)
+cache_misses = Counter(
+    "cache_misses_total",
+    "Lookups missing an in-process cache.",
+    labelnames=("cache",),
+    callback=_cache_stat("misses"),
+)
+cache_entries = Gauge(
+    "cache_entries",
+    "Entries held by an in-process cache.",
+    labelnames=("cache",),
+    callback=_cache_stat("size"),
+)
+
+
+def render() -> str:
+    """
+    Renders every registered metric in the Prometheus text exposition format.
+
+    Returns:
+        str: The metrics document.
+    """
+    lines: List[str] = []
+    for metric in registry:
+        lines.append(f"# HELP {metric.name} {_escape(metric.documentation)}")
+        lines.append(f"# TYPE {metric.name} {metric.type}")
+        for name, labels, value in metric.samples():
+            if labels:
+                rendered = ",".join(
+                    f'{label}="{_escape(str(label_value))}"'
+                    for label, label_value in labels.items()
+                )
+                name = f"{name}{{{rendered}}}"
+            lines.append(f"{name} {_format(value)}")
+    return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value))
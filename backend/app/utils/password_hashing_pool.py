@@ -0,0 +1,169 @@
+import asyncio
+import time
+from concurrent.futures import (Executor, ProcessPoolExecutor,
+                                ThreadPoolExecutor)
+from typing import Any, Callable, Dict, Tuple
+
+from app.config import config
+from app.exceptions import ServiceUnavailableException
+
+from .metrics import Counter, Histogram
+from .password_handler import PasswordHandler
+
+HASHING_BUCKETS = (0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 2.0, 5.0)
+
+hashing_duration = Histogram(
+    "password_hashing_duration_seconds",
+    "Time a worker spent hashing or verifying a password, by operation.",
+    labelnames=("operation",),
+    buckets=HASHING_BUCKETS,
+)
+hashing_wait = Histogram(
+    "password_hashing_wait_seconds",
+    "Time a password operation waited for a free worker, by operation.",
+    labelnames=("operation",),
+)
+hashing_rejected = Counter(
+    "password_hashing_rejected_total",
+    "Password operations rejected because the pool was saturated.",
+)
+
+
+def _run_timed(func: Callable[..., Any], *args: Any) -> Tuple[float, float, Any]:
+    """Runs `func` inside a worker and returns when it started and finished with its result."""
+    started_at = time.monotonic()
+    result = func(*args)
+    return started_at, time.monotonic(), result
+
+
+class PasswordHashingPool:
+    """
+    Runs `PasswordHandler` hashing and verification on a bounded worker pool.
+
+    bcrypt is deliberately slow (~200ms per call), running it inline in an `async def`
+    blocks the event loop for every other request. Operations are offloaded to a thread
+    or process pool, and once `workers + max_queue` operations are pending new ones are
+    rejected immediately with a 503 instead of queueing without bound.
+
+    Attributes:
+        executor_type (str): Either `thread` or `process`.
+        workers (int): The number of concurrent hashing workers.
+        max_queue (int): The number of operations allowed to wait for a free worker.
+    """
+
+    def __init__(self, executor_type: str, workers: int, max_queue: int) -> None:
+        self.executor_type = executor_type
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor: Executor | None = None
+        self._pending = 0
+        self._completed = 0
+        self._rejected = 0
+        self._peak_pending = 0
+        self._total_wait_seconds = 0.0
+        self._total_run_seconds = 0.0
+
+    async def hash_password(self, password: str) -> str:
+        """
+        Hash a plain-text password on the worker pool.
+
+        Args:
+            password (str): The plain-text password to be hashed.
+
+        Returns:
+            str: The hashed password.
+
+        Raises:
+            ServiceUnavailableException: If the pool is saturated.
+        """
+        return await self._submit(PasswordHandler.hash_password, password)
+
+    async def verify_password(self, password: str, hashed_password: str) -> bool:
+        """
+        Verify a plain-text password against a hash on the worker pool.
+
+        Args:
+            password (str): The plain-text password to verify.
+            hashed_password (str): The previously hashed password to compare.
+
+        Returns:
+            bool: `True` if the password matches the hash, `False` otherwise.
+
+        Raises:
+            ServiceUnavailableException: If the pool is saturated.
+        """
+        return await self._submit(
+            PasswordHandler.verify_password, password, hashed_password
+        )
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Returns a snapshot of the pool saturation metrics.
+
+        Returns:
+            Dict[str, float]: The pool size, pending/in-flight/queued operations, peak pending,
+            completed and rejected totals, and the average wait and run time in seconds.
+        """
+        completed = self._completed or 1
+        return {
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "pending": self._pending,
+            "in_flight": min(self._pending, self.workers),
+            "queued": max(self._pending - self.workers, 0),
+            "peak_pending": self._peak_pending,
+            "completed": self._completed,
+            "rejected": self._rejected,
+            "avg_wait_seconds": self._total_wait_seconds / completed,
+            "avg_run_seconds": self._total_run_seconds / completed,
+        }
+
+    def shutdown(self) -> None:
+        """Shuts the worker pool down, it is recreated on the next operation."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def _submit(self, func: Callable[..., Any], *args: Any) -> Any:
+        if self._pending >= self.workers + self.max_queue:
+            self._rejected += 1
+            hashing_rejected.inc()
+            raise ServiceUnavailableException(
+                "Too many concurrent password operations, please try again later."
+            )
+
+        self._pending += 1
+        self._peak_pending = max(self._peak_pending, self._pending)
+        submitted_at = time.monotonic()
+        loop = asyncio.get_running_loop()
+        try:
+            started_at, finished_at, result = await loop.run_in_executor(
+                self._get_executor(), _run_timed, func, *args
+            )
+        finally:
+            self._pending -= 1
+
+        wait_seconds = max(started_at - submitted_at, 0.0)
+        self._completed += 1
+        self._total_wait_seconds += wait_seconds
+        self._total_run_seconds += finished_at - started_at
+        hashing_wait.observe(wait_seconds, func.__name__)
+        hashing_duration.observe(finished_at - started_at, func.__name__)
+        return result
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.executor_type == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="password-hashing"
+                )
+        return self._executor
+
+
+password_hashing_pool = PasswordHashingPool(
+    executor_type=config.PASSWORD_HASHER_EXECUTOR,
+    workers=config.PASSWORD_HASHER_WORKERS,
+    max_queue=config.PASSWORD_HASHER_MAX_QUEUE,
+)
@@ -0,0 +1,208 @@
+import hashlib
+from dataclasses import dataclass, field
+from typing import (Any, Awaitable, Callable, Dict, Iterable, List, Protocol,
+                    Sequence)
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
+
+from app.config import config
+from app.schemas.partial import dump_json
+
+from .cache import TTLCache
+from .metrics import register_cache
+
+
+@dataclass
+class CachedResponse:
+    """A serialized response body with its ETag and extra headers."""
+
+    body: bytes
+    etag: str
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+class ResponseCacheBackend(Protocol):
+    """
+    The storage used by `ResponseCache`, e.g. in-process memory or a shared store like Redis.
+
+    Generations are per-namespace counters, bumping one makes every key built with the
+    previous value unreachable, which invalidates the namespace without scanning keys.
+    """
+
+    async def get(self, key: str) -> CachedResponse | None: ...
+
+    async def set(self, key: str, value: CachedResponse, ttl: float) -> None: ...
+
+    async def generation(self, namespace: str) -> int: ...
+
+    async def bump_generation(self, namespace: str) -> int: ...
+
+    async def clear(self) -> None: ...
+
+
+class MemoryResponseCacheBackend:
+    """An in-process LRU backend, entries are private to the worker process."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._entries: TTLCache[str, CachedResponse] = TTLCache(
+            maxsize=maxsize, ttl=ttl
+        )
+        self._generations: Dict[str, int] = {}
+
+    async def get(self, key: str) -> CachedResponse | None:
+        return self._entries.get(key)
+
+    async def set(self, key: str, value: CachedResponse, ttl: float) -> None:
+        self._entries.set(key, value, ttl)
+
+    async def generation(self, namespace: str) -> int:
+        return self._generations.get(namespace, 0)
+
+    async def bump_generation(self, namespace: str) -> int:
+        self._generations[namespace] = self._generations.get(namespace, 0) + 1
+        return self._generations[namespace]
+
+    async def clear(self) -> None:
+        self._entries.clear()
+        self._generations.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return self._entries.stats()
+
+
+class ResponseCache:
+    """
+    Caches serialized JSON responses of read endpoints and answers conditional requests.
+
+    Responses are keyed by namespace generation, route path and query parameters. Each one
+    carries a strong ETag derived from the `uuid` and `updated_at` of the returned records
+    (or a hash of the body when the records have none), and a request whose `If-None-Match`
+    matches gets an empty `304 Not Modified`. CRUD write methods invalidate their namespaces.
+
+    Attributes:
+        backend (ResponseCacheBackend): Where responses and generations are stored.
+        ttl (float): How long a response is cached, in seconds, `0` only sets ETags.
+    """
+
+    def __init__(self, backend: ResponseCacheBackend, ttl: float) -> None:
+        self.backend = backend
+        self.ttl = ttl
+
+    async def respond(
+        self,
+        request: Request,
+        namespace: str,
+        loader: Callable[[], Awaitable[Any]],
+        headers: Callable[[Any], Dict[str, str]] | None = None,
+        response_model: Any = None,
+    ) -> Response:
+        """
+        Returns the cached response for `request`, loading and caching it on a miss.
+
+        Args:
+            request (Request): The incoming request.
+            namespace (str): The cache namespace the response belongs to, e.g. `posts`.
+            loader (Callable[[], Awaitable[Any]]): Loads the data to return, called only on a miss.
+            headers (Callable[[Any], Dict[str, str]], optional): Builds extra headers from the loaded
+                data, e.g. `X-Next-Cursor`, they are cached with the body. Defaults to None.
+            response_model (Any, optional): The type the data is serialized as, e.g. `List[PostSummary]`.
+                Defaults to None, the data is then encoded with `jsonable_encoder`.
+
+        Returns:
+            Response: The JSON response, or `304 Not Modified` if the client copy is current.
+        """
+        key = await self._key(request, namespace)
+        cached = await self.backend.get(key)
+        if cached is None:
+            data = await loader()
+            extra_headers = headers(data) if headers else {}
+            etag = self._records_etag(key, data)
+            if etag and self._not_modified(request, etag):
+                return Response(
+                    status_code=304, headers={**extra_headers, "ETag": etag}
+                )
+
+            body = self._serialize(data, response_model)
+            etag = etag or self._etag(key.encode(), body)
+            cached = CachedResponse(body=body, etag=etag, headers=extra_headers)
+            if self.ttl > 0:
+                await self.backend.set(key, cached, self.ttl)
+
+        response_headers = {**cached.headers, "ETag": cached.etag}
+        if self._not_modified(request, cached.etag):
+            return Response(status_code=304, headers=response_headers)
+        return Response(
+            content=cached.body,
+            media_type="application/json",
+            headers=response_headers,
+        )
+
+    async def invalidate(self, namespaces: Iterable[str]) -> None:
+        """
+        Invalidates every response cached under the given namespaces.
+
+        Args:
+            namespaces (Iterable[str]): The namespaces to invalidate.
+        """
+        for namespace in namespaces:
+            await self.backend.bump_generation(namespace)
+
+    async def clear(self) -> None:
+        """Removes every cached response."""
+        await self.backend.clear()
+
+    async def _key(self, request: Request, namespace: str) -> str:
+        generation = await self.backend.generation(namespace)
+        query = "&".join(
+            f"{k}={v}" for k, v in sorted(request.query_params.multi_items())
+        )
+        return f"{namespace}:{generation}:{request.url.path}?{query}"
+
+    @staticmethod
+    def _serialize(data: Any, response_model: Any) -> bytes:
+        if response_model is None:
+            return ORJSONResponse(content=jsonable_encoder(data)).body
+        return dump_json(data, response_model)
+
+    def _records_etag(self, key: str, data: Any) -> str | None:
+        records: Sequence[Any] = data if isinstance(data, (list, tuple)) else [data]
+        parts: List[str] = []
+        for record in records:
+            # Only loaded attributes, a sparse fieldset may leave `updated_at` unloaded.
+            loaded = getattr(record, "__dict__", {})
+            uuid = loaded.get("uuid")
+            updated_at = loaded.get("updated_at")
+            if uuid is None or updated_at is None:
+                return None
+            parts.append(f"{uuid}:{updated_at.isoformat()}")
+        return self._etag(key.encode(), "|".join(parts).encode())
+
+    @staticmethod
+    def _etag(*parts: bytes) -> str:
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(part)
+            digest.update(b"\0")
+        return f'"{digest.hexdigest()[:32]}"'
+
+    @staticmethod
+    def _not_modified(request: Request, etag: str) -> bool:
+        if_none_match = request.headers.get("If-None-Match")
+        if not if_none_match:
+            return False
+        candidates = {
+            candidate.strip().removeprefix("W/")
+            for candidate in if_none_match.split(",")
+        }
+        return "*" in candidates or etag in candidates
+
+
+response_cache = ResponseCache(
+    MemoryResponseCacheBackend(
+        maxsize=config.RESPONSE_CACHE_MAX_SIZE, ttl=config.RESPONSE_CACHE_TTL_SECONDS
+    ),
+    ttl=config.RESPONSE_CACHE_TTL_SECONDS,
+)
+register_cache("response", response_cache.backend)
@@ -0,0 +1,84 @@
+"""
+Measures the per-request latency of `POST /auth/register` and `POST /auth/login`.
+
+The app is driven in-process through an ASGI transport against a scratch database created
+next to the one of `TEST_POSTGRES_URL` and dropped after the run.
+
+Usage:
+    python -m benchmarks.auth_flow --requests 50
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Dict, List
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import (AsyncSession, async_sessionmaker,
+                                    create_async_engine)
+
+from app.database import get_async_session
+from app.server import create_app
+from benchmarks.database import scratch_database
+from benchmarks.fakes import fake_user
+
+
+def summarize(name: str, timings: List[float]) -> Dict[str, float]:
+    timings = sorted(timings)
+    summary = {
+        "mean_ms": statistics.mean(timings) * 1000,
+        "p50_ms": timings[len(timings) // 2] * 1000,
+        "p95_ms": timings[int(len(timings) * 0.95) - 1] * 1000,
+    }
+    print(
+        f"{name:<20} n={len(timings):<5} "
+        + "  ".join(f"{key}={value:8.1f}" for key, value in summary.items())
+    )
+    return summary
+
+
+async def run(requests: int) -> None:
+    users = [fake_user() for _ in range(requests)]
+    register_timings, login_timings = [], []
+    async with scratch_database("auth_flow") as url:
+        engine = create_async_engine(url)
+        session_maker = async_sessionmaker(
+            engine, class_=AsyncSession, expire_on_commit=False
+        )
+
+        async def _get_session():
+            async with session_maker() as session:
+                yield session
+
+        app = create_app()
+        app.dependency_overrides[get_async_session] = _get_session
+
+        try:
+            async with AsyncClient(
+                transport=ASGITransport(app=app), base_url="http://benchmark"
+            ) as client:
+                for user in users:
+                    started_at = time.perf_counter()
+                    response = await client.post("/auth/register", json=user)
+                    register_timings.append(time.perf_counter() - started_at)
+                    assert response.status_code == 201, response.text
+
+                for user in users:
+                    login_data = {"email": user["email"], "password": user["password"]}
+                    started_at = time.perf_counter()
+                    response = await client.post("/auth/login", json=login_data)
+                    login_timings.append(time.perf_counter() - started_at)
+                    assert response.status_code == 200, response.text
+        finally:
+            await engine.dispose()
+
+    summarize("POST /auth/register", register_timings)
+    summarize("POST /auth/login", login_timings)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(run(args.requests))
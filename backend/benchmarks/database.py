@@ -0,0 +1,48 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from sqlalchemy import make_url, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.config import config
+from app.models import Base
+
+
+async def _run_admin(statement: str) -> None:
+    admin_engine = create_async_engine(
+        make_url(config.TEST_POSTGRES_URL).set(database="postgres"),
+        isolation_level="AUTOCOMMIT",
+    )
+    async with admin_engine.connect() as conn:
+        await conn.execute(text(statement))
+    await admin_engine.dispose()
+
+
+@asynccontextmanager
+async def scratch_database(suffix: str) -> AsyncIterator[str]:
+    """
+    Creates a database holding the schema for a benchmark run, dropped afterwards.
+
+    It is named after the database of `TEST_POSTGRES_URL` with `suffix` appended, e.g.
+    `byte-blog-db-test_load_test`, so the configured databases are never touched, even when
+    `TEST_POSTGRES_URL` and `POSTGRES_URL` point to the same one.
+
+    Args:
+        suffix (str): Appended to the name of the test database.
+
+    Yields:
+        str: The URL of the scratch database.
+    """
+    url = make_url(config.TEST_POSTGRES_URL)
+    name = f"{url.database}_{suffix}"
+    await _run_admin(f'DROP DATABASE IF EXISTS "{name}" WITH (FORCE)')
+    await _run_admin(f'CREATE DATABASE "{name}"')
+    url = url.set(database=name).render_as_string(hide_password=False)
+    try:
+        engine = create_async_engine(url)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        await engine.dispose()
+        yield url
+    finally:
+        await _run_admin(f'DROP DATABASE IF EXISTS "{name}" WITH (FORCE)')
@@ -0,0 +1,19 @@
+from faker import Faker
+
+fake = Faker()
+
+
+def fake_user() -> dict:
+    return {
+        "username": fake.user_name(),
+        "password": fake.password(length=12),
+        "email": fake.email(),
+    }
+
+
+def fake_post() -> dict:
+    return {
+        "title": fake.sentence(nb_words=6),
+        "body": fake.paragraph(nb_sentences=5),
+        "status": "draft",
+    }
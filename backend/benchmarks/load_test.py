@@ -0,0 +1,332 @@
+"""
+Drives a mixed workload against the API and reports latency percentiles and throughput.
+
+By default the app is driven in-process through an ASGI transport against a scratch
+database created next to the one of `TEST_POSTGRES_URL` and dropped after the run. With
+`--base-url` a running server is load tested over HTTP instead, e.g. one started with
+`docker compose up` and `python main.py`, and the seeded data is left in place.
+
+The dataset (users, categories and posts) is seeded through the API, then `--concurrency`
+clients send requests for `--duration` seconds, picking each request from the workload:
+
+- `mixed`: anonymous post reads and searches, authenticated writes and logins;
+- `reads`: anonymous reads only;
+- `logins`: a login storm.
+
+Results can be saved as a baseline and later runs compared with it, the exit code is 1 when
+an endpoint regressed by more than `--tolerance`.
+
+Usage:
+    python -m benchmarks.load_test --duration 20 --concurrency 10
+    python -m benchmarks.load_test --save benchmarks/baseline.json
+    python -m benchmarks.load_test --compare benchmarks/baseline.json
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import sys
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Tuple
+
+from httpx import ASGITransport, AsyncClient, Response
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.database import create_engine, get_async_session
+from app.server import create_app
+from benchmarks.database import scratch_database
+from benchmarks.fakes import fake_post, fake_user
+
+SEARCH_TERMS = ("python", "database", "tuning", "async", "cache", "index")
+
+
+class Dataset:
+    """The seeded users (with their credentials and tokens), categories and posts."""
+
+    def __init__(self) -> None:
+        self.users: List[Dict[str, Any]] = []
+        self.post_uuids: List[str] = []
+        self.category_names: List[str] = []
+
+
+class Workload:
+    """
+    The requests a client can send, each a coroutine returning its endpoint and response.
+
+    Attributes:
+        client (AsyncClient): The client sending the requests.
+        dataset (Dataset): The seeded data requests refer to.
+        rng (random.Random): The source of randomness of this client.
+    """
+
+    def __init__(self, client: AsyncClient, dataset: Dataset, rng: random.Random):
+        self.client = client
+        self.dataset = dataset
+        self.rng = rng
+
+    def _auth(self) -> Dict[str, str]:
+        user = self.rng.choice(self.dataset.users)
+        return {"Authorization": f"Bearer {user['access_token']}"}
+
+    async def list_posts(self) -> Tuple[str, Response]:
+        params = {"limit": 20, "sort": self.rng.choice(["-created_at", "title"])}
+        return "GET /post/", await self.client.get("/post/", params=params)
+
+    async def read_post(self) -> Tuple[str, Response]:
+        uuid = self.rng.choice(self.dataset.post_uuids)
+        return "GET /post/{uuid}", await self.client.get(f"/post/{uuid}")
+
+    async def search_posts(self) -> Tuple[str, Response]:
+        params = {"q": self.rng.choice(SEARCH_TERMS), "limit": 10}
+        return "GET /post/search", await self.client.get("/post/search", params=params)
+
+    async def category_tree(self) -> Tuple[str, Response]:
+        return "GET /category/tree", await self.client.get("/category/tree")
+
+    async def create_post(self) -> Tuple[str, Response]:
+        response = await self.client.post(
+            "/post/", json=fake_post(), headers=self._auth()
+        )
+        if response.status_code == 201:
+            self.dataset.post_uuids.append(response.json()["post"]["uuid"])
+        return "POST /post/", response
+
+    async def update_post(self) -> Tuple[str, Response]:
+        uuid = self.rng.choice(self.dataset.post_uuids)
+        response = await self.client.patch(
+            f"/post/{uuid}",
+            json={"title": fake_post()["title"]},
+            headers=self._auth(),
+        )
+        return "PATCH /post/{uuid}", response
+
+    async def login(self) -> Tuple[str, Response]:
+        user = self.rng.choice(self.dataset.users)
+        response = await self.client.post(
+            "/auth/login", json={"email": user["email"], "password": user["password"]}
+        )
+        return "POST /auth/login", response
+
+    def scenarios(
+        self, name: str
+    ) -> Tuple[List[Callable[[], Awaitable[Tuple[str, Response]]]], List[int]]:
+        """
+        Returns the requests of a workload with their weights.
+
+        Args:
+            name (str): The workload, `mixed`, `reads` or `logins`.
+
+        Returns:
+            Tuple[List[Callable], List[int]]: The request coroutines and their relative weights.
+        """
+        reads = [
+            (self.list_posts, 30),
+            (self.read_post, 30),
+            (self.search_posts, 10),
+            (self.category_tree, 10),
+        ]
+        workloads = {
+            "mixed": reads
+            + [(self.create_post, 8), (self.update_post, 6), (self.login, 6)],
+            "reads": reads,
+            "logins": [(self.login, 1)],
+        }
+        requests, weights = zip(*workloads[name])
+        return list(requests), list(weights)
+
+
+def percentile(timings: List[float], fraction: float) -> float:
+    """Returns the nearest-rank percentile of sorted `timings`."""
+    return timings[max(math.ceil(fraction * len(timings)) - 1, 0)]
+
+
+def summarize(
+    timings: Dict[str, List[float]], errors: Dict[str, int], elapsed: float
+) -> Dict[str, Dict[str, float]]:
+    results = {}
+    every = sorted(t for endpoint_timings in timings.values() for t in endpoint_timings)
+    for endpoint, endpoint_timings in [*sorted(timings.items()), ("total", every)]:
+        endpoint_timings = sorted(endpoint_timings)
+        if not endpoint_timings:
+            continue
+        results[endpoint] = {
+            "requests": len(endpoint_timings),
+            "errors": errors.get(endpoint, 0)
+            if endpoint != "total"
+            else sum(errors.values()),
+            "rps": len(endpoint_timings) / elapsed,
+            "p50_ms": percentile(endpoint_timings, 0.50) * 1000,
+            "p95_ms": percentile(endpoint_timings, 0.95) * 1000,
+            "p99_ms": percentile(endpoint_timings, 0.99) * 1000,
+        }
+    return results
+
+
+def print_results(results: Dict[str, Dict[str, float]]) -> None:
+    print(
+        f"{'endpoint':<22}{'requests':>9}{'errors':>8}{'rps':>9}"
+        f"{'p50_ms':>9}{'p95_ms':>9}{'p99_ms':>9}"
+    )
+    for endpoint, result in results.items():
+        print(
+            f"{endpoint:<22}{result['requests']:>9}{result['errors']:>8}"
+            f"{result['rps']:>9.1f}{result['p50_ms']:>9.1f}"
+            f"{result['p95_ms']:>9.1f}{result['p99_ms']:>9.1f}"
+        )
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    tolerance: float,
+) -> List[str]:
+    """
+    Compares results with a baseline.
+
+    Args:
+        results (Dict[str, Dict[str, float]]): The results of this run, by endpoint.
+        baseline (Dict[str, Dict[str, float]]): The baseline results, by endpoint.
+        tolerance (float): The allowed relative regression, e.g. `0.2` for 20%.
+
+    Returns:
+        List[str]: A description of every regression, p95 latency up or throughput down.
+    """
+    regressions = []
+    for endpoint, result in results.items():
+        before = baseline.get(endpoint)
+        if before is None:
+            continue
+        if result["p95_ms"] > before["p95_ms"] * (1 + tolerance):
+            regressions.append(
+                f"{endpoint}: p95 {before['p95_ms']:.1f} ms -> {result['p95_ms']:.1f} ms"
+            )
+        if result["rps"] < before["rps"] * (1 - tolerance):
+            regressions.append(
+                f"{endpoint}: {before['rps']:.1f} -> {result['rps']:.1f} requests/s"
+            )
+    return regressions
+
+
+@asynccontextmanager
+async def open_client(base_url: str | None) -> AsyncIterator[AsyncClient]:
+    if base_url:
+        async with AsyncClient(base_url=base_url, timeout=30) as client:
+            yield client
+        return
+
+    async with scratch_database("load_test") as url:
+        engine = create_engine(url)
+        session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+        async def _get_session():
+            async with session_maker() as session:
+                yield session
+
+        app = create_app()
+        app.dependency_overrides[get_async_session] = _get_session
+        try:
+            async with AsyncClient(
+                transport=ASGITransport(app=app),
+                base_url="http://benchmark",
+                timeout=30,
+            ) as client:
+                yield client
+        finally:
+            await engine.dispose()
+
+
+async def seed(
+    client: AsyncClient, users: int, categories: int, posts: int, rng: random.Random
+) -> Dataset:
+    dataset = Dataset()
+    for _ in range(users):
+        user = fake_user()
+        response = await client.post("/auth/register", json=user)
+        assert response.status_code == 201, response.text
+        user["access_token"] = response.json()["token"]["access_token"]
+        dataset.users.append(user)
+    headers = {"Authorization": f"Bearer {dataset.users[0]['access_token']}"}
+
+    for index in range(categories):
+        name = f"Category {index} {rng.randrange(1 << 30)}"
+        response = await client.post("/category/", json={"name": name}, headers=headers)
+        assert response.status_code in (200, 201), response.text
+        dataset.category_names.append(name)
+
+    for start in range(0, posts, 500):
+        batch = []
+        for _ in range(min(500, posts - start)):
+            post = fake_post()
+            post["body"] += " " + " ".join(rng.sample(SEARCH_TERMS, 2))
+            post["status"] = rng.choice(["draft", "published"])
+            batch.append(post)
+        response = await client.post(
+            "/post/create/multiple", json={"posts": batch}, headers=headers
+        )
+        assert response.status_code == 201, response.text
+        dataset.post_uuids.extend(post["uuid"] for post in response.json()["posts"])
+    return dataset
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Dict[str, float]]:
+    rng = random.Random(args.seed)
+    timings: Dict[str, List[float]] = {}
+    errors: Dict[str, int] = {}
+
+    async with open_client(args.base_url) as client:
+        dataset = await seed(client, args.users, args.categories, args.posts, rng)
+        deadline = time.perf_counter() + args.duration
+
+        async def worker(index: int) -> None:
+            workload = Workload(client, dataset, random.Random(args.seed + index))
+            requests, weights = workload.scenarios(args.workload)
+            while time.perf_counter() < deadline:
+                request = workload.rng.choices(requests, weights)[0]
+                started_at = time.perf_counter()
+                endpoint, response = await request()
+                timings.setdefault(endpoint, []).append(
+                    time.perf_counter() - started_at
+                )
+                if response.status_code >= 400:
+                    errors[endpoint] = errors.get(endpoint, 0) + 1
+
+        started_at = time.perf_counter()
+        await asyncio.gather(*(worker(index) for index in range(args.concurrency)))
+        elapsed = time.perf_counter() - started_at
+
+    return summarize(timings, errors, elapsed)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--base-url", help="Load test a running server instead")
+    parser.add_argument(
+        "--workload", choices=["mixed", "reads", "logins"], default="mixed"
+    )
+    parser.add_argument("--duration", type=float, default=20, help="In seconds")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--categories", type=int, default=5)
+    parser.add_argument("--posts", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--save", help="Write the results to this baseline file")
+    parser.add_argument("--compare", help="Compare the results with this baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    print_results(results)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as file:
+            json.dump({"workload": args.workload, "results": results}, file, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)
+        regressions = compare(results, baseline["results"], args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        sys.exit(1 if regressions else 0)
@@ -0,0 +1,94 @@
+import json
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import List
+from uuid import uuid4
+
+import pytest
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+from app.schemas.partial import dump_json, type_adapter
+from app.schemas.post import PostStatus, PostSummary
+from app.schemas.user import UserResponse
+
+
+def make_post(index: int) -> SimpleNamespace:
+    author = SimpleNamespace(uuid=uuid4(), username=f"user{index}", profile_image=None)
+    return SimpleNamespace(
+        uuid=uuid4(),
+        title=f"Title of the post {index}",
+        status=PostStatus.PUBLISHED,
+        excerpt="This is the beginning of the post. " * 8,
+        created_by=author.uuid,
+        author=author,
+        created_at=datetime.now(UTC),
+        updated_at=datetime.now(UTC),
+    )
+
+
+def make_user(index: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        uuid=uuid4(),
+        username=f"user{index}",
+        email=f"user{index}@example.com",
+        profile_image=None,
+    )
+
+
+def encode_jsonable(rows, model) -> bytes:
+    """No response model, `jsonable_encoder` walks the values and the stdlib encodes them."""
+    return JSONResponse(content=jsonable_encoder(rows)).body
+
+
+def encode_response_model(rows, model) -> bytes:
+    """A response model validates the rows, the stdlib encodes its output."""
+    adapter = type_adapter(List[model])
+    content = adapter.dump_python(
+        adapter.validate_python(rows, from_attributes=True), mode="json"
+    )
+    return JSONResponse(content=content).body
+
+
+def encode_orjson(rows, model) -> bytes:
+    """A response model validates the rows, `orjson` encodes its output, the app default."""
+    adapter = type_adapter(List[model])
+    content = adapter.dump_python(
+        adapter.validate_python(rows, from_attributes=True), mode="json"
+    )
+    return ORJSONResponse(content=content).body
+
+
+def encode_dump_json(rows, model) -> bytes:
+    """The cached `TypeAdapter` of the model validates and encodes in one pass."""
+    return Response(content=dump_json(rows, List[model])).body
+
+
+@pytest.mark.parametrize("size", [1, 100, 1000])
+@pytest.mark.parametrize(
+    "encode",
+    [encode_jsonable, encode_response_model, encode_orjson, encode_dump_json],
+    ids=["jsonable_encoder", "response_model", "orjson", "dump_json"],
+)
+@pytest.mark.parametrize(
+    "model, make_row",
+    [(PostSummary, make_post), (UserResponse, make_user)],
+    ids=["PostSummary", "UserResponse"],
+)
+def test_list_response(benchmark, model, make_row, encode, size):
+    """Encodes a list endpoint response, compare the strategies within a group."""
+    benchmark.group = f"{model.__name__}[{size}]"
+    rows = [make_row(index) for index in range(size)]
+    # `jsonable_encoder` cannot walk `SimpleNamespace`, it gets the rows as dicts.
+    if encode is encode_jsonable:
+        rows = [
+            {
+                key: vars(value) if isinstance(value, SimpleNamespace) else value
+                for key, value in vars(row).items()
+            }
+            for row in rows
+        ]
+
+    body = benchmark(encode, rows, model)
+    assert len(json.loads(body)) == size
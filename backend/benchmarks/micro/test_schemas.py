@@ -0,0 +1,62 @@
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import List
+from uuid import uuid4
+
+import pytest
+from pydantic import TypeAdapter
+
+from app.models.post import PostStatus
+from app.schemas.post import PostCreateResponse
+from app.schemas.token import Token
+from app.schemas.user import UserResponse
+
+SIZES = [1, 100, 1000]
+
+
+def make_user(index: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        uuid=uuid4(),
+        username=f"user{index}",
+        email=f"user{index}@example.com",
+        profile_image=None,
+    )
+
+
+def make_post_create_response(index: int) -> dict:
+    post = SimpleNamespace(
+        uuid=uuid4(),
+        title=f"Title of the post {index}",
+        body="This is the content of the post. " * 20,
+        status=PostStatus.PUBLISHED,
+    )
+    return {"message": "Post created successfully.", "post": post}
+
+
+def make_token(index: int) -> dict:
+    return {
+        "access_token": f"access.token.{index}" * 8,
+        "refresh_token": f"refresh.token.{index}" * 8,
+        "expires_in": datetime.now(UTC),
+    }
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize(
+    "schema, make_row",
+    [
+        (UserResponse, make_user),
+        (PostCreateResponse, make_post_create_response),
+        (Token, make_token),
+    ],
+    ids=["UserResponse", "PostCreateResponse", "Token"],
+)
+def test_serialize(benchmark, schema, make_row, size):
+    """Validates rows into the response model then dumps them to JSON, as a route does."""
+    adapter = TypeAdapter(List[schema])
+    rows = [make_row(index) for index in range(size)]
+
+    data = benchmark(
+        lambda: adapter.dump_json(adapter.validate_python(rows, from_attributes=True))
+    )
+    assert len(adapter.validate_json(data)) == size
@@ -0,0 +1,39 @@
+import pytest
+
+from app.utils import PasswordHandler
+from app.utils.jwt_handler import JWTHandler
+
+PAYLOAD = {
+    "uuid": "92b6cefe-d64f-4660-a53b-dfb2a0cb2147",
+    "email": "john.doe@example.com",
+    "username": "john.doe",
+}
+PASSWORD = "password123"
+
+
+@pytest.fixture(params=[4, 10, 12], ids=lambda rounds: f"rounds={rounds}")
+def password_handler(request, monkeypatch):
+    """`PasswordHandler` hashing at the bcrypt cost factor given by the parameter."""
+    context = PasswordHandler.pwd_context.copy(bcrypt__rounds=request.param)
+    monkeypatch.setattr(PasswordHandler, "pwd_context", context)
+    return PasswordHandler
+
+
+def test_jwt_encode(benchmark):
+    token, _ = benchmark(lambda: JWTHandler.encode(PAYLOAD.copy()))
+    assert JWTHandler.decode(token)["uuid"] == PAYLOAD["uuid"]
+
+
+def test_jwt_decode(benchmark):
+    token, _ = JWTHandler.encode(PAYLOAD.copy())
+    assert benchmark(JWTHandler.decode, token)["uuid"] == PAYLOAD["uuid"]
+
+
+def test_hash_password(benchmark, password_handler):
+    hashed_password = benchmark(password_handler.hash_password, PASSWORD)
+    assert password_handler.verify_password(PASSWORD, hashed_password)
+
+
+def test_verify_password(benchmark, password_handler):
+    hashed_password = password_handler.hash_password(PASSWORD)
+    assert benchmark(password_handler.verify_password, PASSWORD, hashed_password)
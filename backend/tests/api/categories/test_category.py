@@ -0,0 +1,158 @@
+import pytest
+from httpx import AsyncClient
+
+from tests.utils.posts import create_fake_post
+
+
+async def create_category(client: AsyncClient, headers, name: str):
+    response = await client.post("/category/", json={"name": name}, headers=headers)
+    return response.json()
+
+
+async def create_sub_category(client: AsyncClient, headers, name: str, category):
+    response = await client.post(
+        "/sub-category/",
+        json={"name": name, "category_uuid": category["uuid"]},
+        headers=headers,
+    )
+    return response.json()["sub_category"]
+
+
+@pytest.mark.asyncio
+async def test_get_category_tree(client: AsyncClient, auth_headers) -> None:
+    programming = await create_category(client, auth_headers, "Programming")
+    cooking = await create_category(client, auth_headers, "Cooking")
+    await create_sub_category(client, auth_headers, "Rust", programming)
+    await create_sub_category(client, auth_headers, "Python", programming)
+
+    response = await client.get("/category/tree")
+
+    assert response.status_code == 200
+    tree = response.json()
+    assert [category["uuid"] for category in tree] == [
+        cooking["uuid"],
+        programming["uuid"],
+    ]
+    assert tree[0]["sub_categories"] == []
+    assert [sub["name"] for sub in tree[1]["sub_categories"]] == ["Python", "Rust"]
+
+
+@pytest.mark.asyncio
+async def test_get_category_tree_after_update(
+    client: AsyncClient, auth_headers
+) -> None:
+    category = await create_category(client, auth_headers, "Programming")
+    await client.get("/category/tree")
+
+    await client.put(
+        f"/category/{category['uuid']}", json={"name": "Coding"}, headers=auth_headers
+    )
+    response = await client.get("/category/tree")
+
+    assert [category["name"] for category in response.json()] == ["Coding"]
+
+
+@pytest.mark.asyncio
+async def test_deleted_category_name_can_be_reused(
+    client: AsyncClient, auth_headers
+) -> None:
+    category = await create_category(client, auth_headers, "Programming")
+    await client.get("/category/tree")
+
+    response = await client.delete(
+        f"/category/{category['uuid']}", headers=auth_headers
+    )
+    tree = (await client.get("/category/tree")).json()
+    recreated = await create_category(client, auth_headers, "Programming")
+
+    assert response.status_code == 204
+    assert tree == []
+    assert recreated["uuid"] != category["uuid"]
+
+
+@pytest.mark.asyncio
+async def test_get_sub_categories_with_cursor_past_the_end(
+    client: AsyncClient, auth_headers
+) -> None:
+    category = await create_category(client, auth_headers, "Programming")
+    await create_sub_category(client, auth_headers, "Python", category)
+    await create_sub_category(client, auth_headers, "Rust", category)
+
+    first_page = await client.get("/sub-category/", params={"limit": 2})
+    last_page = await client.get(
+        "/sub-category/",
+        params={"limit": 2, "cursor": first_page.headers["X-Next-Cursor"]},
+    )
+
+    assert last_page.status_code == 200
+    assert last_page.json() == []
+    assert "X-Next-Cursor" not in last_page.headers
+
+
+@pytest.mark.asyncio
+async def test_get_post_with_taxonomy(client: AsyncClient, auth_headers) -> None:
+    category = await create_category(client, auth_headers, "Programming")
+    sub_category = await create_sub_category(client, auth_headers, "Python", category)
+    post = (
+        await client.post("/post/", json=create_fake_post(), headers=auth_headers)
+    ).json()["post"]
+    await client.post(
+        "/post-category/",
+        json={
+            "post_uuid": post["uuid"],
+            "category_uuid": category["uuid"],
+            "sub_category_uuid": sub_category["uuid"],
+        },
+        headers=auth_headers,
+    )
+
+    response = await client.get(f"/post/{post['uuid']}")
+
+    assert response.status_code == 200
+    detail = response.json()["post_categories"][0]["sub_categories"]
+    assert detail["name"] == "Python"
+    assert detail["category"]["name"] == "Programming"
+
+    await client.patch(
+        f"/sub-category/{sub_category['uuid']}",
+        json={"name": "CPython"},
+        headers=auth_headers,
+    )
+    response = await client.get(f"/post/{post['uuid']}")
+
+    assert response.json()["post_categories"][0]["sub_categories"]["name"] == "CPython"
+
+
+@pytest.mark.asyncio
+async def test_category_response_shapes(client: AsyncClient, auth_headers) -> None:
+    category = await create_category(client, auth_headers, "Programming")
+    sub_category = await create_sub_category(client, auth_headers, "Python", category)
+
+    categories = (await client.get("/category/")).json()
+    detail = (await client.get(f"/category/{category['uuid']}")).json()
+    tree = (await client.get("/category/tree")).json()
+
+    read_fields = {
+        "uuid",
+        "name",
+        "created_by",
+        "updated_by",
+        "created_at",
+        "updated_at",
+    }
+    assert set(category) == {"uuid", "name"}
+    assert [set(item) for item in categories] == [read_fields]
+    assert set(detail) == read_fields
+    assert set(sub_category) == read_fields | {"category_uuid"}
+    assert tree == [
+        {
+            **category,
+            "sub_categories": [
+                {
+                    "uuid": sub_category["uuid"],
+                    "name": "Python",
+                    "category_uuid": category["uuid"],
+                }
+            ],
+        }
+    ]
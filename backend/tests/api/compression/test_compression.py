@@ -0,0 +1,143 @@
+import asyncio
+import gzip
+import zlib
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.responses import Response, StreamingResponse
+from starlette.routing import Route
+
+from app.middlewares import compression
+from app.middlewares.compression import CompressionMiddleware, compressed_cache
+from tests.utils.posts import create_fake_post
+from tests.utils.users import create_fake_user
+
+LINES = [b'{"line": %d, "padding": "%s"}\n' % (i, b"x" * 100) for i in range(20)]
+
+
+def create_test_app() -> Starlette:
+    async def large(request):
+        return Response(b"x" * 2048, media_type="application/json")
+
+    async def small(request):
+        return Response(b"{}", media_type="application/json")
+
+    async def encoded(request):
+        return Response(
+            gzip.compress(b"x" * 2048),
+            media_type="application/json",
+            headers={"Content-Encoding": "gzip"},
+        )
+
+    async def stream(request):
+        async def lines():
+            for line in LINES:
+                yield line
+
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+    app = Starlette(
+        routes=[
+            Route("/large", large),
+            Route("/small", small),
+            Route("/encoded", encoded),
+            Route("/stream", stream),
+        ]
+    )
+    return CompressionMiddleware(app, minimum_size=1024)
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, coding",
+    [
+        ("gzip, deflate", "gzip"),
+        ("br;q=1.0, gzip;q=0.5", "gzip"),
+        ("gzip;q=0", None),
+        ("*", "gzip"),
+        ("identity", None),
+        ("", None),
+    ],
+)
+def test_negotiate(monkeypatch, accept_encoding, coding):
+    monkeypatch.setattr(compression, "brotli", None)
+    assert compression.negotiate(accept_encoding) == coding
+
+
+@pytest.mark.asyncio
+async def test_compress_only_large_unencoded_responses(monkeypatch):
+    monkeypatch.setattr(compression, "brotli", None)
+    async with AsyncClient(
+        transport=ASGITransport(app=create_test_app()),
+        base_url="http://test",
+        headers={"Accept-Encoding": "gzip"},
+    ) as client:
+        large = await client.get("/large")
+        small = await client.get("/small")
+        encoded = await client.get("/encoded")
+
+    assert large.headers["Content-Encoding"] == "gzip"
+    assert large.headers["Vary"] == "Accept-Encoding"
+    assert int(large.headers["Content-Length"]) < 2048
+    assert large.content == b"x" * 2048
+    assert "Content-Encoding" not in small.headers
+    assert small.content == b"{}"
+    assert encoded.content == b"x" * 2048
+
+
+@pytest.mark.asyncio
+async def test_stream_is_compressed_chunk_by_chunk(monkeypatch):
+    monkeypatch.setattr(compression, "brotli", None)
+    messages = []
+
+    async def receive():
+        # The client stays connected until the response is sent.
+        await asyncio.Event().wait()
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/stream",
+        "headers": [(b"accept-encoding", b"gzip")],
+        "query_string": b"",
+    }
+    await create_test_app()(scope, receive, send)
+
+    headers = dict(messages[0]["headers"])
+    assert headers[b"content-encoding"] == b"gzip"
+    assert b"content-length" not in headers
+
+    # Every chunk is flushed, so each one decodes to its line as it arrives.
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    chunks = [message["body"] for message in messages[1:] if message["body"]]
+    decoded = [decompressor.decompress(chunk) for chunk in chunks]
+    assert decoded[: len(LINES)] == LINES
+    assert decompressor.eof
+
+
+@pytest.mark.asyncio
+async def test_cached_response_is_compressed_once(client: AsyncClient) -> None:
+    register_response = await client.post("/auth/register", json=create_fake_user())
+    access_token = register_response.json()["token"]["access_token"]
+    await client.post(
+        "/post/create/multiple",
+        json={"posts": [create_fake_post() for _ in range(10)]},
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    headers = {"Accept-Encoding": "gzip"}
+
+    first = await client.get("/post/", headers=headers)
+    hits = compressed_cache.hits
+    second = await client.get("/post/", headers=headers)
+    not_modified = await client.get(
+        "/post/", headers={**headers, "If-None-Match": second.headers["ETag"]}
+    )
+
+    assert first.headers["Content-Encoding"] == "gzip"
+    assert second.headers["ETag"].startswith('W/"')
+    assert second.content == first.content
+    assert compressed_cache.hits == hits + 1
+    assert not_modified.status_code == 304
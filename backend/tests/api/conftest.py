@@ -5,8 +5,14 @@ import pytest_asyncio
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
 
+from app.crud.taxonomy import taxonomy_cache
+from app.crud.user import user_cache
 from app.database import get_async_session
+from app.middlewares import token_cache
+from app.middlewares.compression import compressed_cache
 from app.server import create_app
+from app.utils import response_cache
+from tests.utils.users import create_fake_user
 
 
 @pytest.fixture(scope="session")
@@ -15,6 +21,16 @@ def app() -> Generator[FastAPI, Any, None]:
     yield app
 
 
+@pytest_asyncio.fixture(autouse=True)
+async def clear_caches():
+    yield
+    token_cache.clear()
+    compressed_cache.clear()
+    user_cache.clear()
+    taxonomy_cache.invalidate()
+    await response_cache.clear()
+
+
 @pytest_asyncio.fixture(scope="function")
 async def client(app: FastAPI, db_session) -> AsyncClient:
     async def _get_session():
@@ -26,3 +42,10 @@ async def client(app: FastAPI, db_session) -> AsyncClient:
         transport=ASGITransport(app=app), base_url="http://test"
     ) as ac:
         yield ac
+
+
+@pytest_asyncio.fixture
+async def auth_headers(client: AsyncClient):
+    register_response = await client.post("/auth/register", json=create_fake_user())
+    access_token = register_response.json()["token"]["access_token"]
+    return {"Authorization": f"Bearer {access_token}"}
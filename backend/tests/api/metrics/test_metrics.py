@@ -0,0 +1,45 @@
+import pytest
+from httpx import AsyncClient
+
+from app.utils.metrics import Counter, Histogram, registry, render
+
+
+def test_render_histogram_and_counter():
+    histogram = Histogram("test_duration_seconds", "Test.", ("route",), (0.1, 1.0))
+    counter = Counter("test_errors_total", 'A "quoted" help.', ("exception",))
+    try:
+        histogram.observe(0.05, "/a")
+        histogram.observe(0.5, "/a")
+        counter.inc("ValueError")
+        counter.inc("ValueError", amount=2)
+
+        text = render()
+    finally:
+        registry.remove(histogram)
+        registry.remove(counter)
+
+    assert "# TYPE test_duration_seconds histogram" in text
+    assert 'test_duration_seconds_bucket{route="/a",le="0.1"} 1.0' in text
+    assert 'test_duration_seconds_bucket{route="/a",le="+Inf"} 2.0' in text
+    assert 'test_duration_seconds_count{route="/a"} 2.0' in text
+    assert '# HELP test_errors_total A \\"quoted\\" help.' in text
+    assert 'test_errors_total{exception="ValueError"} 3.0' in text
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint(client: AsyncClient) -> None:
+    await client.get("/post/")
+    await client.get("/post/", params={"cursor": "invalid"})
+
+    response = await client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+    text = response.text
+    assert 'http_requests_total{method="GET",route="/post/",status="400"}' in text
+    assert 'http_request_duration_seconds_count{method="GET",route="/post/"}' in text
+    assert "http_requests_in_flight 1.0" in text
+    assert 'app_errors_total{exception="BadRequestException"}' in text
+    assert 'cache_misses_total{cache="response"}' in text
+    assert 'cache_hits_total{cache="jwt"}' in text
+    assert "# TYPE db_pool_connections gauge" in text
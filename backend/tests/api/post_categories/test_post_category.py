@@ -0,0 +1,55 @@
+import pytest
+from httpx import AsyncClient
+
+from tests.api.categories.test_category import (create_category,
+                                                create_sub_category)
+from tests.utils.posts import create_fake_post
+
+
+async def create_post_category(client: AsyncClient, headers):
+    category = await create_category(client, headers, "Programming")
+    python = await create_sub_category(client, headers, "Python", category)
+    rust = await create_sub_category(client, headers, "Rust", category)
+    post = (
+        await client.post("/post/", json=create_fake_post(), headers=headers)
+    ).json()["post"]
+    response = await client.post(
+        "/post-category/",
+        json={
+            "post_uuid": post["uuid"],
+            "category_uuid": category["uuid"],
+            "sub_category_uuid": python["uuid"],
+        },
+        headers=headers,
+    )
+    return response.json(), rust
+
+
+@pytest.mark.asyncio
+async def test_update_post_category(client: AsyncClient, auth_headers) -> None:
+    post_category, rust = await create_post_category(client, auth_headers)
+
+    response = await client.patch(
+        f"/post-category/{post_category['uuid']}",
+        json={"sub_category_uuid": rust["uuid"]},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"message": "Post category updated successfully."}
+    updated = await client.get(f"/post-category/{post_category['uuid']}")
+    assert updated.json()["sub_category_uuid"] == rust["uuid"]
+
+
+@pytest.mark.asyncio
+async def test_delete_post_category(client: AsyncClient, auth_headers) -> None:
+    post_category, _ = await create_post_category(client, auth_headers)
+
+    response = await client.delete(
+        f"/post-category/{post_category['uuid']}", headers=auth_headers
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"message": "Post category deleted successfully."}
+    deleted = await client.get(f"/post-category/{post_category['uuid']}")
+    assert deleted.status_code == 404
@@ -0,0 +1,495 @@
+import json
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+
+from app.crud.post import PostCRUD
+from app.utils import CursorHandler
+from tests.utils.posts import create_fake_post
+
+
+@pytest.mark.asyncio
+async def test_create_post(client: AsyncClient, auth_headers) -> None:
+    fake_post = create_fake_post()
+
+    response = await client.post("/post/", json=fake_post, headers=auth_headers)
+
+    assert response.status_code == 201
+    assert response.json()["post"]["title"] == fake_post["title"]
+    assert response.json()["post"]["uuid"] is not None
+
+
+@pytest.mark.asyncio
+async def test_create_multiple_posts(client: AsyncClient, auth_headers) -> None:
+    fake_posts = [create_fake_post() for _ in range(5)]
+
+    response = await client.post(
+        "/post/create/multiple", json={"posts": fake_posts}, headers=auth_headers
+    )
+
+    assert response.status_code == 201
+    assert [post["title"] for post in response.json()["posts"]] == [
+        post["title"] for post in fake_posts
+    ]
+
+    posts_response = await client.get("/post/")
+    assert len(posts_response.json()) == 5
+
+
+@pytest.mark.asyncio
+async def test_create_multiple_posts_without_posts(
+    client: AsyncClient, auth_headers
+) -> None:
+    response = await client.post(
+        "/post/create/multiple", json={"posts": []}, headers=auth_headers
+    )
+
+    assert response.status_code == 422
+    assert response.json()["detail"] is not None
+
+
+@pytest.mark.asyncio
+async def test_delete_multiple_posts(client: AsyncClient, auth_headers) -> None:
+    create_response = await client.post(
+        "/post/create/multiple",
+        json={"posts": [create_fake_post() for _ in range(3)]},
+        headers=auth_headers,
+    )
+    uuids = [post["uuid"] for post in create_response.json()["posts"]]
+
+    response = await client.post(
+        "/post/delete/multiple", json={"uuids": uuids[:2]}, headers=auth_headers
+    )
+
+    assert response.status_code == 204
+
+    posts_response = await client.get("/post/")
+    assert [post["uuid"] for post in posts_response.json()] == uuids[2:]
+
+
+@pytest.mark.asyncio
+async def test_delete_multiple_posts_not_found(
+    client: AsyncClient, auth_headers
+) -> None:
+    response = await client.post(
+        "/post/delete/multiple",
+        json={"uuids": [str(uuid4())]},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 404
+    assert response.json()["message"] is not None
+
+
+@pytest.mark.asyncio
+async def test_delete_post_is_soft(client: AsyncClient, auth_headers) -> None:
+    create_response = await client.post(
+        "/post/create/multiple",
+        json={"posts": [create_fake_post() for _ in range(2)]},
+        headers=auth_headers,
+    )
+    uuid, kept = [post["uuid"] for post in create_response.json()["posts"]]
+
+    response = await client.delete(f"/post/{uuid}", headers=auth_headers)
+
+    assert response.status_code == 204
+    assert (await client.get(f"/post/{uuid}")).status_code == 404
+    assert [post["uuid"] for post in (await client.get("/post/")).json()] == [kept]
+    assert (
+        await client.delete(f"/post/{uuid}", headers=auth_headers)
+    ).status_code == 404
+    deleted_again = await client.post(
+        "/post/delete/multiple", json={"uuids": [uuid]}, headers=auth_headers
+    )
+    assert deleted_again.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_get_post_not_modified(client: AsyncClient, auth_headers) -> None:
+    create_response = await client.post(
+        "/post/", json=create_fake_post(), headers=auth_headers
+    )
+    uuid = create_response.json()["post"]["uuid"]
+
+    response = await client.get(f"/post/{uuid}")
+    etag = response.headers["ETag"]
+
+    assert response.status_code == 200
+    assert response.json()["uuid"] == uuid
+
+    not_modified = await client.get(f"/post/{uuid}", headers={"If-None-Match": etag})
+
+    assert not_modified.status_code == 304
+    assert not_modified.headers["ETag"] == etag
+    assert not_modified.content == b""
+
+
+@pytest.mark.asyncio
+async def test_get_post_after_update(client: AsyncClient, auth_headers) -> None:
+    create_response = await client.post(
+        "/post/", json=create_fake_post(), headers=auth_headers
+    )
+    uuid = create_response.json()["post"]["uuid"]
+    etag = (await client.get(f"/post/{uuid}")).headers["ETag"]
+
+    updated_post = create_fake_post()
+    await client.put(f"/post/{uuid}", json=updated_post, headers=auth_headers)
+    response = await client.get(f"/post/{uuid}", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.json()["title"] == updated_post["title"]
+
+
+@pytest.mark.asyncio
+async def test_get_posts_cached_with_cursor(client: AsyncClient, auth_headers) -> None:
+    await client.post(
+        "/post/create/multiple",
+        json={"posts": [create_fake_post() for _ in range(3)]},
+        headers=auth_headers,
+    )
+
+    first = await client.get("/post/", params={"limit": 2})
+    cached = await client.get("/post/", params={"limit": 2})
+
+    assert cached.status_code == 200
+    assert cached.json() == first.json()
+    assert cached.headers["ETag"] == first.headers["ETag"]
+    assert cached.headers["X-Next-Cursor"] == first.headers["X-Next-Cursor"]
+
+    await client.post("/post/", json=create_fake_post(), headers=auth_headers)
+    refreshed = await client.get("/post/", params={"limit": 2})
+
+    assert refreshed.status_code == 200
+    assert refreshed.headers["ETag"] != first.headers["ETag"]
+
+
+@pytest.mark.asyncio
+async def test_get_posts_with_cursor_past_the_end(
+    client: AsyncClient, auth_headers
+) -> None:
+    await client.post(
+        "/post/create/multiple",
+        json={"posts": [create_fake_post() for _ in range(2)]},
+        headers=auth_headers,
+    )
+
+    first_page = await client.get("/post/", params={"limit": 2})
+    last_page = await client.get(
+        "/post/", params={"limit": 2, "cursor": first_page.headers["X-Next-Cursor"]}
+    )
+
+    assert last_page.status_code == 200
+    assert last_page.json() == []
+    assert "X-Next-Cursor" not in last_page.headers
+
+
+@pytest.mark.asyncio
+async def test_search_posts(client: AsyncClient, auth_headers) -> None:
+    posts = [
+        {"title": "Tuning PostgreSQL", "body": "Indexes and planner settings."},
+        {"title": "Cooking pasta", "body": "Boil water, then tune the heat."},
+        {"title": "Gardening", "body": "Nothing about databases here."},
+    ]
+    await client.post(
+        "/post/create/multiple", json={"posts": posts}, headers=auth_headers
+    )
+
+    response = await client.get("/post/search", params={"q": "tuning"})
+
+    assert response.status_code == 200
+    results = response.json()
+    assert [result["post"]["title"] for result in results] == [
+        "Tuning PostgreSQL",
+        "Cooking pasta",
+    ]
+    assert results[0]["rank"] > results[1]["rank"]
+    assert "<mark>tune</mark>" in results[1]["snippet"]
+    assert "search_vector" not in results[0]["post"]
+    assert "body" not in results[0]["post"]
+    assert results[0]["post"]["excerpt"] == posts[0]["body"]
+    assert results[0]["post"]["author"] is not None
+
+
+@pytest.mark.asyncio
+async def test_search_posts_with_cursor(client: AsyncClient, auth_headers) -> None:
+    posts = [
+        {"title": f"Async python {index}", "body": "python " * index}
+        for index in range(1, 6)
+    ]
+    await client.post(
+        "/post/create/multiple", json={"posts": posts}, headers=auth_headers
+    )
+
+    first_page = await client.get("/post/search", params={"q": "python", "limit": 3})
+    second_page = await client.get(
+        "/post/search",
+        params={
+            "q": "python",
+            "limit": 3,
+            "cursor": first_page.headers["X-Next-Cursor"],
+        },
+    )
+
+    assert len(first_page.json()) == 3
+    assert len(second_page.json()) == 2
+    assert "X-Next-Cursor" not in second_page.headers
+    titles = [result["post"]["title"] for result in first_page.json()]
+    titles += [result["post"]["title"] for result in second_page.json()]
+    assert sorted(titles) == sorted(post["title"] for post in posts)
+
+
+@pytest.mark.asyncio
+async def test_search_posts_with_invalid_cursor(client: AsyncClient) -> None:
+    response = await client.get(
+        "/post/search", params={"q": "python", "cursor": "invalid"}
+    )
+
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "values",
+    [
+        [0.5, 123],
+        [0.5, {"uuid": "value"}],
+        [{"rank": 0.5}, "b3f3c5a2-1a4b-4c0e-8a4a-2f0b6b1d2c3e"],
+    ],
+)
+async def test_search_posts_with_mistyped_cursor(client: AsyncClient, values) -> None:
+    response = await client.get(
+        "/post/search",
+        params={"q": "python", "cursor": CursorHandler.encode(values)},
+    )
+
+    assert response.status_code == 400
+    assert response.json()["message"] == "Invalid pagination cursor."
+
+
+@pytest.mark.asyncio
+async def test_get_posts_summary(client: AsyncClient, auth_headers) -> None:
+    body = "word " * 100
+    create_response = await client.post(
+        "/post/", json={**create_fake_post(), "body": body}, headers=auth_headers
+    )
+
+    response = await client.get("/post/")
+
+    assert response.status_code == 200
+    summary = response.json()[0]
+    assert set(summary) == {
+        "uuid",
+        "title",
+        "status",
+        "excerpt",
+        "created_by",
+        "author",
+        "created_at",
+        "updated_at",
+    }
+    assert summary["uuid"] == create_response.json()["post"]["uuid"]
+    assert summary["author"]["uuid"] == summary["created_by"]
+    assert "email" not in summary["author"]
+    assert summary["excerpt"].endswith("…")
+    assert len(summary["excerpt"]) <= 281
+
+
+@pytest.mark.asyncio
+async def test_update_post_refreshes_excerpt(client: AsyncClient, auth_headers) -> None:
+    create_response = await client.post(
+        "/post/", json=create_fake_post(), headers=auth_headers
+    )
+    uuid = create_response.json()["post"]["uuid"]
+
+    await client.patch(
+        f"/post/{uuid}", json={"body": "A brand   new\nbody."}, headers=auth_headers
+    )
+    response = await client.get("/post/")
+
+    assert response.json()[0]["excerpt"] == "A brand new body."
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_refreshes_excerpt(
+    client: AsyncClient, auth_headers, db_session
+) -> None:
+    create_response = await client.post(
+        "/post/create/multiple",
+        json={"posts": [create_fake_post() for _ in range(2)]},
+        headers=auth_headers,
+    )
+    uuids = [post["uuid"] for post in create_response.json()["posts"]]
+
+    await PostCRUD(db_session).bulk_update(uuids, {"body": "A brand   new\nbody."})
+    response = await client.get("/post/")
+
+    assert [post["excerpt"] for post in response.json()] == ["A brand new body."] * 2
+
+
+@pytest.mark.asyncio
+async def test_get_posts_with_fields(client: AsyncClient, auth_headers) -> None:
+    await client.post(
+        "/post/create/multiple",
+        json={"posts": [create_fake_post() for _ in range(3)]},
+        headers=auth_headers,
+    )
+
+    first_page = await client.get("/post/", params={"fields": "uuid,body", "limit": 2})
+    second_page = await client.get(
+        "/post/",
+        params={
+            "fields": "uuid,body",
+            "limit": 2,
+            "cursor": first_page.headers["X-Next-Cursor"],
+        },
+    )
+
+    assert first_page.status_code == 200
+    assert [set(post) for post in first_page.json()] == [{"uuid", "body"}] * 2
+    assert len(second_page.json()) == 1
+    assert second_page.json()[0]["uuid"] not in {
+        post["uuid"] for post in first_page.json()
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_posts_with_invalid_fields(client: AsyncClient) -> None:
+    response = await client.get("/post/", params={"fields": "uuid,search_vector"})
+
+    assert response.status_code == 400
+    assert response.json()["message"] is not None
+
+
+@pytest.mark.asyncio
+async def test_export_posts(client: AsyncClient, auth_headers) -> None:
+    posts = [create_fake_post() for _ in range(3)]
+    posts[0]["status"] = "published"
+    await client.post(
+        "/post/create/multiple", json={"posts": posts}, headers=auth_headers
+    )
+
+    response = await client.get("/post/export")
+    published = await client.get("/post/export", params={"status": "published"})
+
+    assert response.status_code == 200
+    assert response.headers["Content-Type"] == "application/x-ndjson"
+    exported = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(post["title"] for post in exported) == sorted(
+        post["title"] for post in posts
+    )
+    assert "body" in exported[0] and "search_vector" not in exported[0]
+    assert [json.loads(line)["title"] for line in published.text.splitlines()] == [
+        posts[0]["title"]
+    ]
+
+
+@pytest.mark.asyncio
+async def test_import_posts(client: AsyncClient, auth_headers) -> None:
+    category = (
+        await client.post(
+            "/category/", json={"name": "Programming"}, headers=auth_headers
+        )
+    ).json()
+    await client.post(
+        "/sub-category/",
+        json={"name": "Python", "category_uuid": category["uuid"]},
+        headers=auth_headers,
+    )
+    existing_uuid = str(uuid4())
+    rows = [
+        {
+            **create_fake_post(),
+            "categories": [{"category": "Programming", "sub_category": "Python"}],
+        },
+        {**create_fake_post(), "uuid": existing_uuid},
+        {"title": "No body"},
+        {**create_fake_post(), "categories": [{"category": "Unknown"}]},
+    ]
+    lines = "\n".join(json.dumps(row) for row in rows) + "\n\n"
+
+    response = await client.post("/post/import", content=lines, headers=auth_headers)
+    reimport = await client.post(
+        "/post/import", content=json.dumps(rows[1]), headers=auth_headers
+    )
+
+    assert response.status_code == 200
+    report = response.json()
+    assert (report["imported"], report["skipped"], report["failed"]) == (2, 0, 2)
+    assert [error["line"] for error in report["errors"]] == [3, 4]
+    assert "Unknown category `Unknown`." in report["errors"][1]["message"]
+    assert (reimport.json()["imported"], reimport.json()["skipped"]) == (0, 1)
+    assert reimport.json()["errors"] == [
+        {"line": 1, "message": f"Post with uuid `{existing_uuid}` already exists."}
+    ]
+
+    titles = {post["title"]: post for post in (await client.get("/post/")).json()}
+    imported = await client.get(f"/post/{titles[rows[0]['title']]['uuid']}")
+    post_categories = imported.json()["post_categories"]
+    assert post_categories[0]["sub_categories"]["name"] == "Python"
+    assert post_categories[0]["category_uuid"] == category["uuid"]
+    assert titles[rows[1]["title"]]["author"] is not None
+
+
+@pytest.mark.asyncio
+async def test_import_posts_with_mixed_chunk(client: AsyncClient, auth_headers) -> None:
+    existing = (
+        await client.post("/post/", json=create_fake_post(), headers=auth_headers)
+    ).json()["post"]
+    duplicate_uuid = str(uuid4())
+    rows = [
+        create_fake_post(),
+        {**create_fake_post(), "uuid": duplicate_uuid},
+        {**create_fake_post(), "uuid": duplicate_uuid},
+        {**create_fake_post(), "uuid": existing["uuid"]},
+        {**create_fake_post(), "body": "Null \x00 byte"},
+        {"title": "No body"},
+        create_fake_post(),
+    ]
+    lines = "\n".join(json.dumps(row) for row in rows)
+
+    response = await client.post("/post/import", content=lines, headers=auth_headers)
+
+    assert response.status_code == 200
+    report = response.json()
+    assert (report["imported"], report["skipped"], report["failed"]) == (3, 1, 3)
+    errors = {error["line"]: error["message"] for error in report["errors"]}
+    assert sorted(errors) == [3, 4, 5, 6]
+    assert errors[3] == f"Duplicate uuid `{duplicate_uuid}`, already on line 2."
+    assert errors[4] == f"Post with uuid `{existing['uuid']}` already exists."
+    assert errors[5] == "body: NUL characters are not allowed."
+
+    titles = {post["title"] for post in (await client.get("/post/")).json()}
+    assert {rows[0]["title"], rows[1]["title"], rows[6]["title"]} <= titles
+    assert rows[2]["title"] not in titles
+
+
+@pytest.mark.asyncio
+async def test_post_response_shapes(client: AsyncClient, auth_headers) -> None:
+    fake_post = create_fake_post()
+    create_response = await client.post("/post/", json=fake_post, headers=auth_headers)
+    uuid = create_response.json()["post"]["uuid"]
+
+    posts = (await client.get("/post/")).json()
+    detail = (await client.get(f"/post/{uuid}")).json()
+
+    summary_fields = {
+        "uuid",
+        "title",
+        "status",
+        "excerpt",
+        "created_by",
+        "author",
+        "created_at",
+        "updated_at",
+    }
+    assert create_response.json() == {
+        "message": "Post created successfully.",
+        "post": {"uuid": uuid, **fake_post},
+    }
+    assert [set(post) for post in posts] == [summary_fields]
+    assert set(posts[0]["author"]) == {"uuid", "username", "profile_image"}
+    assert set(detail) == summary_fields | {"body", "updated_by", "post_categories"}
+    assert detail["body"] == fake_post["body"]
+    assert detail["post_categories"] == []
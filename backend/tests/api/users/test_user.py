@@ -2,7 +2,11 @@ from typing import Any, Dict
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import select
 
+from app.crud.user import user_cache
+from app.models import User
+from app.utils import CursorHandler
 from tests.utils.users import create_fake_user
 
 
@@ -31,6 +35,147 @@ async def test_get_all_users(client: AsyncClient) -> None:
     assert len(response.json()) == 1
 
 
+@pytest.mark.asyncio
+async def test_get_all_users_with_cursor(client: AsyncClient) -> None:
+    access_token = None
+    for _ in range(3):
+        register_response = await client.post("/auth/register", json=create_fake_user())
+        access_token = register_response.json()["token"]["access_token"]
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    first_page = await client.get("/user/", params={"limit": 2}, headers=headers)
+
+    assert first_page.status_code == 200
+    assert len(first_page.json()) == 2
+    assert "X-Next-Cursor" in first_page.headers
+
+    second_page = await client.get(
+        "/user/",
+        params={"limit": 2, "cursor": first_page.headers["X-Next-Cursor"]},
+        headers=headers,
+    )
+
+    assert second_page.status_code == 200
+    assert len(second_page.json()) == 1
+    assert "X-Next-Cursor" not in second_page.headers
+    first_page_uuids = {user["uuid"] for user in first_page.json()}
+    assert second_page.json()[0]["uuid"] not in first_page_uuids
+
+
+@pytest.mark.asyncio
+async def test_get_all_users_with_invalid_cursor(client: AsyncClient) -> None:
+    fake_user = create_fake_user()
+
+    register_response = await client.post("/auth/register", json=fake_user)
+
+    access_token = register_response.json()["token"]["access_token"]
+
+    response = await client.get(
+        "/user/",
+        params={"cursor": "invalid-cursor"},
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+
+    assert response.status_code == 400
+    assert response.json()["message"] is not None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "values",
+    [
+        ["2025-01-01T00:00:00", 123],
+        ["2025-01-01T00:00:00", {"uuid": "value"}],
+        [["2025-01-01T00:00:00"], "b3f3c5a2-1a4b-4c0e-8a4a-2f0b6b1d2c3e"],
+    ],
+)
+async def test_get_all_users_with_mistyped_cursor(client: AsyncClient, values) -> None:
+    register_response = await client.post("/auth/register", json=create_fake_user())
+    access_token = register_response.json()["token"]["access_token"]
+
+    response = await client.get(
+        "/user/",
+        params={"cursor": CursorHandler.encode(values)},
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+
+    assert response.status_code == 400
+    assert response.json()["message"] == "Invalid pagination cursor."
+
+
+@pytest.mark.asyncio
+async def test_get_all_users_sorted(client: AsyncClient) -> None:
+    access_token = None
+    for _ in range(3):
+        register_response = await client.post("/auth/register", json=create_fake_user())
+        access_token = register_response.json()["token"]["access_token"]
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    response = await client.get("/user/", params={"sort": "-username"}, headers=headers)
+
+    assert response.status_code == 200
+    usernames = [user["username"] for user in response.json()]
+    assert usernames == sorted(usernames, reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_get_all_users_sorted_with_cursor(client: AsyncClient) -> None:
+    access_token = None
+    for _ in range(3):
+        register_response = await client.post("/auth/register", json=create_fake_user())
+        access_token = register_response.json()["token"]["access_token"]
+    headers = {"Authorization": f"Bearer {access_token}"}
+    params = {"sort": "-created_at", "limit": 2}
+
+    first_page = await client.get("/user/", params=params, headers=headers)
+    second_page = await client.get(
+        "/user/",
+        params={**params, "cursor": first_page.headers["X-Next-Cursor"]},
+        headers=headers,
+    )
+    all_users = await client.get(
+        "/user/", params={"sort": "-created_at"}, headers=headers
+    )
+
+    assert second_page.status_code == 200
+    paged_uuids = [user["uuid"] for user in first_page.json() + second_page.json()]
+    assert paged_uuids == [user["uuid"] for user in all_users.json()]
+
+
+@pytest.mark.asyncio
+async def test_get_all_users_with_invalid_sort(client: AsyncClient) -> None:
+    fake_user = create_fake_user()
+
+    register_response = await client.post("/auth/register", json=fake_user)
+
+    access_token = register_response.json()["token"]["access_token"]
+
+    response = await client.get(
+        "/user/",
+        params={"sort": "password"},
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+
+    assert response.status_code == 400
+    assert response.json()["message"] is not None
+
+
+@pytest.mark.asyncio
+async def test_get_all_users_with_fields(client: AsyncClient) -> None:
+    register_response = await client.post("/auth/register", json=create_fake_user())
+    access_token = register_response.json()["token"]["access_token"]
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    response = await client.get(
+        "/user/", params={"fields": "uuid,username"}, headers=headers
+    )
+    invalid = await client.get("/user/", params={"fields": "password"}, headers=headers)
+
+    assert response.status_code == 200
+    assert set(response.json()[0]) == {"uuid", "username"}
+    assert invalid.status_code == 400
+
+
 @pytest.mark.asyncio
 async def test_get_current_user_profile(client: AsyncClient) -> None:
     fake_user = create_fake_user()
@@ -48,6 +193,42 @@ async def test_get_current_user_profile(client: AsyncClient) -> None:
     assert response.json()["username"] == fake_user["username"]
 
 
+@pytest.mark.asyncio
+async def test_get_current_user_profile_is_cached(client: AsyncClient) -> None:
+    register_response = await client.post("/auth/register", json=create_fake_user())
+    access_token = register_response.json()["token"]["access_token"]
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    await client.get("/user/user-profile", headers=headers)
+    hits = user_cache.hits
+    response = await client.get("/user/user-profile", headers=headers)
+
+    assert response.status_code == 200
+    assert response.json()["uuid"] == register_response.json()["user"]["uuid"]
+    assert user_cache.hits == hits + 1
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_profile_after_update(
+    client: AsyncClient, mock_update_data: Dict[str, Any]
+) -> None:
+    register_response = await client.post("/auth/register", json=create_fake_user())
+    access_token = register_response.json()["token"]["access_token"]
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    await client.get("/user/user-profile", headers=headers)
+    await client.put(
+        f"/user/{register_response.json()['user']['uuid']}",
+        json=mock_update_data,
+        headers=headers,
+    )
+    response = await client.get("/user/user-profile", headers=headers)
+
+    assert response.status_code == 200
+    assert response.json()["full_name"] == mock_update_data["full_name"]
+    assert response.json()["bio"] == mock_update_data["bio"]
+
+
 @pytest.mark.asyncio
 async def test_get_user_by_uuid(client: AsyncClient) -> None:
     fake_user = create_fake_user()
@@ -235,4 +416,56 @@ async def test_partial_update_user_profile_without_any_data(
     assert response.json()["detail"] is not None
 
 
-# TODO: Delete user profile API test
+@pytest.mark.asyncio
+async def test_delete_user(client: AsyncClient, db_session) -> None:
+    admin = (await client.post("/auth/register", json=create_fake_user())).json()
+    deleted = (await client.post("/auth/register", json=create_fake_user())).json()
+    headers = {"Authorization": f"Bearer {admin['token']['access_token']}"}
+
+    response = await client.delete(f"/user/{deleted['user']['uuid']}", headers=headers)
+
+    assert response.status_code == 200
+    assert response.json()["message"] == "User deleted successfully."
+    not_found = await client.get(f"/user/{deleted['user']['uuid']}", headers=headers)
+    assert not_found.status_code == 404
+    deleted_by = await db_session.scalar(
+        select(User.deleted_by)
+        .where(User.uuid == deleted["user"]["uuid"])
+        .execution_options(include_deleted=True)
+    )
+    assert str(deleted_by) == admin["user"]["uuid"]
+
+
+@pytest.mark.asyncio
+async def test_user_response_shapes(client: AsyncClient) -> None:
+    fake_user = create_fake_user()
+    register_response = await client.post("/auth/register", json=fake_user)
+    uuid = register_response.json()["user"]["uuid"]
+    access_token = register_response.json()["token"]["access_token"]
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    users = (await client.get("/user/", headers=headers)).json()
+    detail = (await client.get(f"/user/{uuid}", headers=headers)).json()
+    profile = (await client.get("/user/user-profile", headers=headers)).json()
+
+    assert users == [
+        {
+            "uuid": uuid,
+            "username": fake_user["username"],
+            "email": fake_user["email"],
+            "profile_image": None,
+        }
+    ]
+    assert set(detail) == {
+        "uuid",
+        "username",
+        "email",
+        "profile_image",
+        "full_name",
+        "bio",
+        "last_login",
+        "created_at",
+        "updated_at",
+    }
+    assert detail["email"] == fake_user["email"]
+    assert profile == detail
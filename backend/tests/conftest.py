@@ -1,16 +1,32 @@
 import asyncio
 import os
-from typing import Generator
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Generator, Iterator
+from uuid import uuid4
 
 import pytest
 import pytest_asyncio
-from sqlalchemy.ext.asyncio import (AsyncSession, async_sessionmaker,
-                                    create_async_engine)
+from sqlalchemy import make_url, text
+from sqlalchemy.ext.asyncio import (AsyncEngine, AsyncSession,
+                                    async_sessionmaker, create_async_engine)
 
 from app.config import config
 from app.models import Base
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--db-isolation",
+        choices=["savepoint", "database"],
+        default="savepoint",
+        help=(
+            "How `db_session` isolates tests: `savepoint` rolls back a transaction kept "
+            "open around the test, `database` gives every test its own database cloned "
+            "from the template"
+        ),
+    )
+
+
 @pytest.fixture(scope="session")
 def event_loop(request) -> Generator:  # noqa: indirect usage
     loop = asyncio.get_event_loop_policy().new_event_loop()
@@ -18,19 +34,131 @@ def event_loop(request) -> Generator:  # noqa: indirect usage
     loop.close()
 
 
-@pytest_asyncio.fixture(scope="function")
-async def db_session() -> AsyncSession:
-    async_egine = create_async_engine(config.TEST_POSTGRES_URL)
-    async_session = async_sessionmaker(
-        async_egine, class_=AsyncSession, expire_on_commit=False
+async def _run_admin(statement: str) -> None:
+    admin_engine = create_async_engine(
+        make_url(config.TEST_POSTGRES_URL).set(database="postgres"),
+        isolation_level="AUTOCOMMIT",
     )
+    async with admin_engine.connect() as conn:
+        await conn.execute(text(statement))
+    await admin_engine.dispose()
+
+
+async def _create_database(name: str, template: str | None = None) -> str:
+    await _run_admin(f'DROP DATABASE IF EXISTS "{name}" WITH (FORCE)')
+    await _run_admin(
+        f'CREATE DATABASE "{name}"' + (f' TEMPLATE "{template}"' if template else "")
+    )
+    return (
+        make_url(config.TEST_POSTGRES_URL)
+        .set(database=name)
+        .render_as_string(hide_password=False)
+    )
+
 
-    async with async_session() as session:
-        async with async_egine.begin() as conn:
+async def _drop_database(name: str) -> None:
+    await _run_admin(f'DROP DATABASE IF EXISTS "{name}" WITH (FORCE)')
+
+
+@pytest.fixture(scope="session")
+def database_name() -> str:
+    """
+    The name of the test database of this process, derived from the database of
+    `TEST_POSTGRES_URL` with a `_pytest` suffix, and the worker id when the suite runs in
+    parallel with `pytest -n`, so every worker gets its own database. The configured
+    database itself, which may be the one of `POSTGRES_URL`, is never dropped.
+    """
+    name = f"{make_url(config.TEST_POSTGRES_URL).database}_pytest"
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    return f"{name}_{worker}" if worker else name
+
+
+@pytest.fixture(scope="session")
+def template_database(event_loop, database_name: str) -> Iterator[str]:
+    """
+    A database holding the schema, created once per session and cloned by `CREATE DATABASE
+    ... TEMPLATE`, which copies files instead of replaying the DDL. It must not be connected
+    to while it is cloned, so its engine is disposed once the schema is created.
+    """
+    name = f"{database_name}_template"
+
+    async def create() -> None:
+        url = await _create_database(name)
+        engine = create_async_engine(url)
+        async with engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
+        await engine.dispose()
 
-        yield session
+    event_loop.run_until_complete(create())
+    yield name
+    event_loop.run_until_complete(_drop_database(name))
 
-    async with async_egine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-    await async_egine.dispose()
+
+@pytest.fixture(scope="session")
+def database_url(
+    event_loop, database_name: str, template_database: str
+) -> Iterator[str]:
+    """The URL of the test database, cloned from the template once per session."""
+    url = event_loop.run_until_complete(
+        _create_database(database_name, template=template_database)
+    )
+    yield url
+    event_loop.run_until_complete(_drop_database(database_name))
+
+
+@pytest.fixture(scope="session")
+def db_engine(event_loop, database_url: str) -> Iterator[AsyncEngine]:
+    engine = create_async_engine(database_url)
+    yield engine
+    event_loop.run_until_complete(engine.dispose())
+
+
+@asynccontextmanager
+async def _cloned_database(template: str) -> AsyncIterator[str]:
+    name = f"{template.removesuffix('_template')}_{uuid4().hex[:8]}"
+    try:
+        yield await _create_database(name, template=template)
+    finally:
+        await _drop_database(name)
+
+
+@pytest_asyncio.fixture
+async def isolated_database_url(template_database: str) -> AsyncIterator[str]:
+    """
+    The URL of a database cloned from the template for this test only, for tests that commit
+    through their own engines and so cannot be rolled back.
+    """
+    async with _cloned_database(template_database) as url:
+        yield url
+
+
+@pytest_asyncio.fixture(scope="function")
+async def db_session(
+    request, template_database: str, db_engine: AsyncEngine
+) -> AsyncIterator[AsyncSession]:
+    """
+    A session whose changes are discarded after the test.
+
+    The schema is created once per session. By default the test runs inside a transaction
+    that is rolled back afterwards, the session commits and rolls back savepoints within it.
+    With `--db-isolation=database` the test gets its own database instead, see
+    `isolated_database_url`.
+    """
+    if request.config.getoption("--db-isolation") == "database":
+        async with _cloned_database(template_database) as url:
+            engine = create_async_engine(url)
+            async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+                yield session
+            await engine.dispose()
+        return
+
+    async with db_engine.connect() as conn:
+        transaction = await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        yield session
+        await session.close()
+        await transaction.rollback()
@@ -0,0 +1,70 @@
+import logging
+
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import config
+from app.crud import UserCRUD
+from app.database import create_engine, get_async_session
+from app.database.instrumentation import (QueryStats, query_stats,
+                                          statement_shape)
+from app.server import create_app
+
+
+@pytest_asyncio.fixture
+async def instrumented_session(database_url: str):
+    """A session on its own engine, instrumented by `create_engine`."""
+    engine = create_engine(database_url)
+    async with AsyncSession(engine) as session:
+        yield session
+    await engine.dispose()
+
+
+def test_statement_shape():
+    assert statement_shape("SELECT *\n  FROM users WHERE uuid IN ($1, $2)") == (
+        statement_shape("SELECT * FROM users WHERE uuid IN ($1,$2,$3)")
+    )
+
+
+@pytest.mark.asyncio
+async def test_query_stats(instrumented_session: AsyncSession):
+    stats = QueryStats()
+    token = query_stats.set(stats)
+    try:
+        for _ in range(3):
+            await UserCRUD(instrumented_session).get_by_email("john.doe@example.com")
+        await instrumented_session.execute(text("SELECT pg_sleep(0.05)"))
+    finally:
+        query_stats.reset(token)
+
+    assert stats.count == 4
+    assert stats.duration >= 0.05
+    assert max(stats.slowest)[1] == "SELECT pg_sleep(0.05)"
+    assert [count for _, count in stats.repeated(2)] == [3]
+
+
+@pytest.mark.asyncio
+async def test_query_stats_headers_and_n_plus_one(
+    instrumented_session: AsyncSession, monkeypatch, caplog
+):
+    monkeypatch.setattr(config, "DEBUG", True)
+    monkeypatch.setattr(config, "DB_N_PLUS_ONE_THRESHOLD", 0)
+    app = create_app()
+
+    async def _get_session():
+        return instrumented_session
+
+    app.dependency_overrides[get_async_session] = _get_session
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        with caplog.at_level(logging.WARNING):
+            response = await client.get("/category/")
+
+    assert int(response.headers["X-DB-Query-Count"]) >= 1
+    assert float(response.headers["X-DB-Time-Ms"]) > 0
+    assert "Possible N+1 query on GET /category/" in caplog.text
@@ -0,0 +1,94 @@
+import asyncio
+from typing import List
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud import UserCRUD
+from app.crud.post_category import PostCategoryCRUD
+from app.utils import DataLoader
+from tests.utils.users import create_fake_user
+
+
+def count_queries(session: AsyncSession) -> List[str]:
+    statements: List[str] = []
+
+    @event.listens_for(session.bind.sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, *args):
+        # Savepoints isolating the test from the next ones are not queries of the loader.
+        if not statement.startswith(("SAVEPOINT", "RELEASE SAVEPOINT")):
+            statements.append(statement)
+
+    return statements
+
+
+@pytest.mark.asyncio
+async def test_loader_batches_and_memoizes():
+    """Ensure keys loaded in the same tick are loaded once, in one batch, in key order."""
+    calls = []
+
+    async def batch_load(keys):
+        calls.append(keys)
+        return [key * 2 for key in keys]
+
+    loader = DataLoader(batch_load, max_batch_size=2)
+
+    values = await asyncio.gather(loader.load(1), loader.load(2), loader.load(1))
+    assert values == [2, 4, 2]
+    assert calls == [[1, 2]]
+
+    assert await loader.load_many([3, 2, 4, 5]) == [6, 4, 8, 10]
+    assert calls == [[1, 2], [3, 4], [5]]
+
+
+@pytest.mark.asyncio
+async def test_loader_failed_batch_is_retried():
+    attempts = []
+
+    async def batch_load(keys):
+        attempts.append(keys)
+        if len(attempts) == 1:
+            raise RuntimeError("unavailable")
+        return keys
+
+    loader = DataLoader(batch_load)
+
+    with pytest.raises(RuntimeError):
+        await loader.load("key")
+    assert await loader.load("key") == "key"
+    assert len(attempts) == 2
+
+
+@pytest.mark.asyncio
+async def test_crud_loader_uses_one_query(db_session: AsyncSession):
+    crud = UserCRUD(db_session)
+    users = [await crud.create(create_fake_user()) for _ in range(3)]
+    missing = uuid4()
+    statements = count_queries(db_session)
+
+    loaded = await crud.loader().load_many([user.uuid for user in users] + [missing])
+    by_post, by_user = await asyncio.gather(
+        PostCategoryCRUD(db_session).loader("post_uuid", many=True).load(uuid4()),
+        crud.loader().load(users[0].uuid),
+    )
+
+    assert [user.uuid for user in loaded[:3]] == [user.uuid for user in users]
+    assert loaded[3] is None
+    assert by_post == []
+    assert by_user is loaded[0]
+    assert len(statements) == 2
+
+
+@pytest.mark.asyncio
+async def test_crud_loader_is_cleared_by_writes(db_session: AsyncSession):
+    crud = UserCRUD(db_session)
+    user = await crud.create(create_fake_user())
+    statements = count_queries(db_session)
+
+    await crud.loader().load(user.uuid)
+    await crud.update(user, {"bio": "Updated"})
+    await crud.loader().load(user.uuid)
+
+    assert sum("IN (" in statement for statement in statements) == 2
@@ -0,0 +1,44 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import text
+
+from app.config import config
+from app.database import create_engine, pool_stats
+from app.database.session import engine_options
+
+
+def test_engine_options_pgbouncer_mode():
+    """Ensure statement caching is disabled and statement names are unique with PgBouncer."""
+    with patch.object(config, "DB_PGBOUNCER_MODE", True):
+        connect_args = engine_options()["connect_args"]
+
+    assert connect_args["statement_cache_size"] == 0
+    assert connect_args["prepared_statement_cache_size"] == 0
+    name_func = connect_args["prepared_statement_name_func"]
+    assert name_func() != name_func()
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_records_checkouts(database_url: str):
+    """Ensure checkouts and waits are recorded once the pool is exhausted."""
+    with (
+        patch.object(config, "DB_POOL_SIZE", 1),
+        patch.object(config, "DB_MAX_OVERFLOW", 0),
+    ):
+        engine = create_engine(database_url)
+
+    async def query():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT pg_sleep(0.05)"))
+
+    await asyncio.gather(*[query() for _ in range(3)])
+    stats = pool_stats(engine)
+    await engine.dispose()
+
+    assert stats["size"] == 1
+    assert stats["checked_out"] == 0
+    assert stats["checkouts"] == 3
+    assert stats["timeouts"] == 0
+    assert stats["max_wait_seconds"] >= 0.05
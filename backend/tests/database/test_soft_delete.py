@@ -0,0 +1,80 @@
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud import UserCRUD
+from app.crud.post import PostCRUD
+from app.models import Post, PostCategory, User
+from tests.utils.posts import create_fake_post
+from tests.utils.users import create_fake_user
+
+
+async def create_posts(session: AsyncSession, count: int):
+    user = await UserCRUD(session).create(create_fake_user())
+    posts = await PostCRUD(session).create_multiple_posts(
+        [{**create_fake_post(), "created_by": user.uuid} for _ in range(count)]
+    )
+    session.add_all(PostCategory(post_uuid=post.uuid) for post in posts)
+    await session.commit()
+    return user, posts
+
+
+async def backdate_deletion(session: AsyncSession, model, uuids) -> None:
+    await session.execute(
+        update(model)
+        .where(model.uuid.in_(uuids))
+        .values(deleted_at=func.now() - timedelta(days=2))
+        .execution_options(include_deleted=True)
+    )
+    await session.commit()
+
+
+@pytest.mark.asyncio
+async def test_soft_deleted_records_are_hidden(db_session: AsyncSession):
+    user, (deleted, kept) = await create_posts(db_session, 2)
+    crud = PostCRUD(db_session)
+
+    await crud.delete_post(deleted.uuid, user_uuid=user.uuid)
+
+    assert [post.uuid for post in await crud.get_by()] == [kept.uuid]
+    assert await crud.get_by_uuid(deleted.uuid) is None
+    assert await crud.get_by_keys("uuid", [deleted.uuid]) == []
+    assert await crud.bulk_update([deleted.uuid], {"title": "Updated"}) == 0
+
+    tombstone = await db_session.scalar(
+        select(Post.deleted_by)
+        .where(Post.uuid == deleted.uuid, Post.deleted_at.is_not(None))
+        .execution_options(include_deleted=True)
+    )
+    assert tombstone == user.uuid
+
+
+@pytest.mark.asyncio
+async def test_purge_deleted_in_batches(db_session: AsyncSession):
+    user, posts = await create_posts(db_session, 4)
+    crud = PostCRUD(db_session)
+    *old, recent = [post.uuid for post in posts]
+    await crud.delete_multiple_posts([*old, recent], user_uuid=user.uuid)
+    await backdate_deletion(db_session, Post, old)
+
+    purged = await crud.purge_deleted(timedelta(days=1), batch_size=2)
+
+    remaining = await db_session.scalars(
+        select(Post.uuid).execution_options(include_deleted=True)
+    )
+    post_categories = await db_session.scalars(select(PostCategory.post_uuid))
+    assert purged == 3
+    assert remaining.all() == [recent]
+    assert post_categories.all() == [recent]
+
+    # Purging a user clears the references of the posts they created or deleted.
+    await UserCRUD(db_session).delete(user)
+    await backdate_deletion(db_session, User, [user.uuid])
+    assert await UserCRUD(db_session).purge_deleted(timedelta(days=1)) == 1
+    post = await db_session.scalar(
+        select(Post).where(Post.uuid == recent).execution_options(include_deleted=True)
+    )
+    await db_session.refresh(post)
+    assert post.created_by is None and post.deleted_by is None
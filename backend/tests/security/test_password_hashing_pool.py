@@ -0,0 +1,49 @@
+import asyncio
+
+import pytest
+
+from app.exceptions import BadRequestException, ServiceUnavailableException
+from app.utils import PasswordHashingPool
+
+
+@pytest.fixture
+def pool():
+    pool = PasswordHashingPool(executor_type="thread", workers=1, max_queue=1)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify_password(pool: PasswordHashingPool):
+    """Test that hashing and verification work through the worker pool."""
+    hashed_password = await pool.hash_password("password123")
+
+    assert hashed_password != "password123"
+    assert await pool.verify_password("password123", hashed_password)
+    assert not await pool.verify_password("wrongpassword", hashed_password)
+
+
+@pytest.mark.asyncio
+async def test_hash_empty_password(pool: PasswordHashingPool):
+    """Ensure validation errors raised in the worker reach the caller."""
+    with pytest.raises(
+        BadRequestException, match="Password must be a non-empty string."
+    ):
+        await pool.hash_password("")
+
+
+@pytest.mark.asyncio
+async def test_rejects_when_saturated(pool: PasswordHashingPool):
+    """Ensure operations beyond `workers + max_queue` are rejected immediately."""
+    running = [asyncio.create_task(pool.hash_password("password123")) for _ in range(2)]
+    await asyncio.sleep(0)
+
+    with pytest.raises(ServiceUnavailableException):
+        await pool.hash_password("password123")
+
+    await asyncio.gather(*running)
+    stats = pool.stats()
+    assert stats["completed"] == 2
+    assert stats["rejected"] == 1
+    assert stats["peak_pending"] == 2
+    assert stats["pending"] == 0
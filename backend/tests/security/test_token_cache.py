@@ -0,0 +1,88 @@
+import hashlib
+import time
+from unittest.mock import patch
+
+import pytest
+from starlette.requests import HTTPConnection
+
+from app.middlewares import AuthBackend
+from app.utils import JWTHandler, TTLCache
+from app.utils.jwt_handler import JWTDecodeError
+
+USER_UUID = "92b6cefe-d64f-4660-a53b-dfb2a0cb2147"
+
+
+def make_connection(token: str) -> HTTPConnection:
+    return HTTPConnection(
+        {"type": "http", "headers": [(b"authorization", f"Bearer {token}".encode())]}
+    )
+
+
+@pytest.fixture
+def backend():
+    return AuthBackend(cache=TTLCache(maxsize=2, ttl=60))
+
+
+@pytest.mark.asyncio
+async def test_verified_token_is_cached(backend: AuthBackend):
+    """Ensure a token is verified once and then served from the cache."""
+    token, _ = JWTHandler.encode({"uuid": USER_UUID})
+
+    with patch.object(JWTHandler, "decode", wraps=JWTHandler.decode) as decode:
+        for _ in range(3):
+            authenticated, current_user = await backend.authenticate(
+                make_connection(token)
+            )
+            assert authenticated
+            assert str(current_user.uuid) == USER_UUID
+
+    assert decode.call_count == 1
+    assert backend.cache.stats() == {"size": 1, "maxsize": 2, "hits": 2, "misses": 1}
+
+
+@pytest.mark.asyncio
+async def test_invalid_token_is_not_cached(backend: AuthBackend):
+    """Ensure tokens that fail verification never enter the cache."""
+    with pytest.raises(JWTDecodeError):
+        await backend.authenticate(make_connection("invalid.token.value"))
+
+    assert len(backend.cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_token_is_not_cached_past_expiry():
+    """Ensure a cached payload never outlives the token `exp`."""
+    backend = AuthBackend(cache=TTLCache(maxsize=2, ttl=3600))
+    token, _ = JWTHandler.encode({"uuid": USER_UUID}, expire_in_min=1)
+    await backend.authenticate(make_connection(token))
+    key = hashlib.sha256(token.encode()).digest()
+
+    assert backend.cache.get(key) is not None
+    later = time.monotonic() + 61
+    with patch("app.utils.cache.time.monotonic", return_value=later):
+        assert backend.cache.get(key) is None
+
+
+def test_cache_evicts_least_recently_used():
+    """Ensure the oldest unused entry is evicted once the cache is full."""
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_cache_entry_expires():
+    """Ensure entries are dropped once their ttl has passed."""
+    cache = TTLCache(maxsize=2, ttl=60)
+    with patch("app.utils.cache.time.monotonic", return_value=100.0):
+        cache.set("a", 1, ttl=5)
+    with patch("app.utils.cache.time.monotonic", return_value=104.0):
+        assert cache.get("a") == 1
+    with patch("app.utils.cache.time.monotonic", return_value=105.0):
+        assert cache.get("a") is None
+    assert len(cache) == 0
@@ -0,0 +1,10 @@
+from faker import Faker
+
+fake = Faker()
+
+
+def create_fake_post():
+    title = fake.sentence(nb_words=6)
+    body = fake.paragraph(nb_sentences=5)
+
+    return {"title": title, "body": body, "status": "draft"}